@@ -1,17 +1,20 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from dependency_injector.wiring import inject, Provide
 
 from app.container import Container
 from app.service.user import UserService
-from app.database.session import UnitOfWork
 from app.schema.user import (
     UserCreateRequest, 
     UserUpdateRequest, 
     UserResponse, 
     UserListResponse,
+    UserBulkCreateRequest,
+    UserBulkCreateResponse,
+    UserBulkResultResponse,
     SuccessResponse
 )
-from app.dto.user import UserCreateDTO, UserUpdateDTO
+from app.dto.user import UserCreateDTO, UserUpdateDTO, CountStrategy, BulkStatus
 
 router = APIRouter(prefix="/test", tags=["User-Test"])
 
@@ -53,33 +56,37 @@ async def create_user(
 
 
 @router.post(
-    "/controller", 
-    response_model=UserResponse,
-    status_code=status.HTTP_201_CREATED,
-    summary="사용자 생성 (컨트롤러 레벨 트랜잭션)",
-    description="컨트롤러에서 트랜잭션을 관리하는 새로운 사용자 생성 예시"
+    "/bulk",
+    response_model=UserBulkCreateResponse,
+    summary="사용자 일괄 생성",
+    description="여러 사용자를 한 번에 생성합니다. (upsert=true면 이미 있는 사용자의 이름을 갱신)"
 )
 @inject
-async def create_user_controller_transaction(
-    user_request: UserCreateRequest,
-    user_service: UserService = Depends(Provide[Container.user_service_session]),
-    uow: UnitOfWork = Depends(Provide[Container.uow])
-) -> UserResponse:
-    """사용자 생성 - 컨트롤러 레벨 트랜잭션 관리"""
+async def bulk_create_users(
+    bulk_request: UserBulkCreateRequest,
+    user_service: UserService = Depends(Provide[Container.user_service])
+) -> UserBulkCreateResponse:
+    """사용자 일괄 생성"""
     try:
-        async with uow as session:
-            user_dto = UserCreateDTO(
-                email=user_request.email,
-                name=user_request.name
-            )
-            
-            created_user = await user_service.create_user_with_session(session, user_dto)
-            
-            return UserResponse(
-                email=created_user.email,
-                name=created_user.name,
-                created_at=created_user.created_at
-            )
+        user_dtos = [
+            UserCreateDTO(email=user.email, name=user.name)
+            for user in bulk_request.users
+        ]
+        results = await user_service.bulk_create_users(user_dtos, upsert=bulk_request.upsert)
+        return UserBulkCreateResponse(
+            results=[
+                UserBulkResultResponse(
+                    email=result.email,
+                    status=result.status.value,
+                    created_at=result.user.created_at if result.user else None,
+                    error=result.error
+                ) for result in results
+            ],
+            created=sum(result.status == BulkStatus.CREATED for result in results),
+            updated=sum(result.status == BulkStatus.UPDATED for result in results),
+            skipped=sum(result.status in (BulkStatus.SKIPPED, BulkStatus.DUPLICATE) for result in results),
+            failed=sum(result.status == BulkStatus.FAILED for result in results)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -96,17 +103,26 @@ async def create_user_controller_transaction(
     "/search",
     response_model=UserListResponse,
     summary="사용자 목록 조회",
-    description="모든 사용자 목록을 조회합니다. (페이징)"
+    description="모든 사용자 목록을 조회합니다. (커서 페이징, skip 지정 시 오프셋 페이징)"
 )
 @inject
 async def get_users(
-    skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
+    skip: int = Query(0, ge=0, description="건너뛸 레코드 수 (오프셋 페이징, cursor와 함께 쓰지 않음)"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 레코드 수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    count: Optional[CountStrategy] = Query(None, description="전체 수 계산 방식 (기본값: 서버 설정)"),
     user_service: UserService = Depends(Provide[Container.user_service])
 ) -> UserListResponse:
     """사용자 목록 조회"""
     try:
-        users, total = await user_service.get_all_users(skip=skip, limit=limit)
+        next_cursor = None
+        if skip and cursor is None:
+            # 기존 오프셋 페이징 (깊은 페이지일수록 느려짐)
+            users, total = await user_service.get_all_users(skip=skip, limit=limit, count=count)
+        else:
+            users, total, next_cursor = await user_service.get_users_by_cursor(
+                limit=limit, cursor=cursor, count=count
+            )
         user_responses = [
             UserResponse(
                 email=user.email,
@@ -114,7 +130,12 @@ async def get_users(
                 created_at=user.created_at
             ) for user in users
         ]
-        return UserListResponse(users=user_responses, total=total)
+        return UserListResponse(users=user_responses, total=total, next_cursor=next_cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
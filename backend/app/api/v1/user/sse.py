@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Query
+from typing import Optional
+from fastapi import APIRouter, Header, Query
 from fastapi.responses import StreamingResponse
 
 from app.service.progress import ProgressService
@@ -18,11 +19,16 @@ SSE_HEADERS = {
     description="10초 단위로 총 5단계의 진행률을 SSE로 전송합니다."
 )
 async def chat(
-    user_id: str = Query(..., min_length=1, description="사용자 ID")
+    user_id: str = Query(..., min_length=1, description="사용자 ID"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="재접속 시 마지막으로 받은 이벤트 ID")
 ):
-    """SSE 진행률 스트림 시작"""
+    """SSE 진행률 스트림 시작 (Last-Event-ID가 있으면 새 작업 대신 이어보기)"""
+    if last_event_id:
+        stream = ProgressService.search_progress(user_id, last_event_id)
+    else:
+        stream = ProgressService.start_progress(user_id)
     return StreamingResponse(
-        ProgressService.start_progress(user_id),
+        stream,
         media_type="text/event-stream",
         headers=SSE_HEADERS,
     )
@@ -31,14 +37,16 @@ async def chat(
 @router.get(
     "/search",
     summary="진행률 이어보기 SSE 스트림",
-    description="사용자의 현재 진행률을 조회하고, 진행 중이면 SSE로 이어서 스트리밍합니다."
+    description="사용자의 진행률을 조회하고, 진행 중이면 SSE로 이어서 스트리밍합니다. (progress_key가 없으면 가장 최근 진행 중 작업)"
 )
 async def search_progress(
-    user_id: str = Query(..., min_length=1, description="사용자 ID")
+    user_id: str = Query(..., min_length=1, description="사용자 ID"),
+    progress_key: Optional[str] = Query(None, min_length=1, description="이어볼 진행률 키 (init 이벤트로 받은 값)"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", description="재접속 시 마지막으로 받은 이벤트 ID")
 ):
-    """사용자 진행률 이어보기"""
+    """사용자 진행률 이어보기 (Last-Event-ID 이후의 누락 이벤트만 replay)"""
     return StreamingResponse(
-        ProgressService.search_progress(user_id),
+        ProgressService.search_progress(user_id, last_event_id, progress_key),
         media_type="text/event-stream",
         headers=SSE_HEADERS,
     )
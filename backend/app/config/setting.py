@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, List, Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -22,15 +22,49 @@ class Settings(BaseSettings):
     LOG_RETENTION: str = Field("30 days", description="로그 파일 롤테이션 기준")
     LOG_COMPRESSION: str = Field("gz", description="로그 롤테이션 파일 압축")
     
+    # API 로그 배치 기록 설정 (MongoDB)
+    LOG_WRITER_QUEUE_SIZE: int = Field(10000, description="로그 버퍼 큐 최대 크기")
+    LOG_WRITER_BATCH_SIZE: int = Field(500, description="insert_many 배치 크기")
+    LOG_WRITER_FLUSH_INTERVAL: float = Field(1.0, description="배치 flush 주기 (초)")
+    LOG_WRITER_OVERFLOW_POLICY: Literal["drop", "block"] = Field("drop", description="큐가 가득 찼을 때 정책 (drop/block)")
+    LOG_WRITER_PUT_TIMEOUT: float = Field(0.05, description="block 정책에서 큐 대기 최대 시간 (초)")
+    
+    # 분산 작업 큐 설정
+    JOB_LEASE_TTL: int = Field(30, description="작업 lease TTL (초), 하트비트가 1/3 주기로 연장")
+    JOB_MAX_CONCURRENCY: int = Field(100, description="워커 프로세스당 동시 실행 작업 수")
+    JOB_RECLAIM_INTERVAL: float = Field(10.0, description="만료된 lease 회수 주기 (초)")
+    JOB_MAX_ATTEMPTS: int = Field(3, description="작업 최대 실행 시도 횟수")
+    JOB_REQUEUE_DELAY: float = Field(1.0, description="lease를 다른 워커가 보유 중인 작업을 pending으로 되돌리기 전 대기 시간 (초)")
+    
     # LLM KEY
     OPENAI_API_KEY: str = Field("sk-", description="OpenAI API KEY")
     
+    # LLM/임베딩 동시 호출 한도 (클러스터 전체)
+    LLM_CONCURRENCY_LIMITS: Dict[str, int] = Field(
+        {"gpt-4o-mini": 20, "gpt-4o": 10, "gpt-5": 5},
+        description="모델별 동시 호출 한도 (JSON)"
+    )
+    EMBEDDING_CONCURRENCY_LIMIT: int = Field(10, description="임베딩 동시 호출 한도")
+    LLM_CONCURRENCY_TIMEOUT: float = Field(30.0, description="동시 호출 한도 대기 최대 시간 (초)")
+    
     # POSTGRES 정보
     POSTGRES_HOST: str = Field("hyeonsang-postgres", description="POSTGRES HOST")
     POSTGRES_PORT: int = Field(5432, description="POSTGRES PORT")
     POSTGRES_USER: str = Field("cho", description="POSTGRES USER")
     POSTGRES_PASSWORD: str = Field("hyeonsang", description="POSTGRES PASSWORD")
     POSTGRES_NAME: str = Field("chohyeonsang", description="POSTGRES NAME")
+    POSTGRES_POOL_SIZE: int = Field(5, description="워커당 유지하는 DB 커넥션 수")
+    POSTGRES_MAX_OVERFLOW: int = Field(10, description="풀이 가득 찼을 때 추가로 여는 최대 커넥션 수")
+    POSTGRES_POOL_TIMEOUT: float = Field(30.0, description="커넥션 획득 최대 대기 시간 (초)")
+    POSTGRES_POOL_RECYCLE: int = Field(1800, description="커넥션 재생성 주기 (초, -1이면 사용 안 함)")
+    POSTGRES_POOL_PRE_PING: bool = Field(True, description="커넥션 획득 시 연결 상태 확인")
+    POSTGRES_POOL_SLOW_WAIT: float = Field(0.5, description="이 시간(초) 이상 커넥션을 기다리면 경고 로그")
+    POSTGRES_STATEMENT_TIMEOUT_MS: int = Field(0, description="서버 측 statement_timeout (ms, 0이면 사용 안 함)")
+    POSTGRES_PREPARED_STATEMENT_CACHE_SIZE: int = Field(100, description="커넥션당 asyncpg prepared statement 캐시 크기 (0이면 사용 안 함)")
+    POSTGRES_REPLICA_HOSTS: List[str] = Field([], description="읽기 전용 replica 호스트 목록 (JSON, host 또는 host:port)")
+    POSTGRES_REPLICA_STRATEGY: str = Field("round_robin", description="replica 선택 방식 (round_robin/least_loaded)")
+    POSTGRES_REPLICA_MAX_LAG: float = Field(5.0, description="이보다 복제 지연(초)이 크면 replica 제외")
+    POSTGRES_REPLICA_CHECK_INTERVAL: float = Field(5.0, description="replica 상태/복제 지연 확인 주기 (초)")
     
     # MongoDB 정보
     MONGODB_HOST: str = Field("hyeonsang-mongodb", description="MONGODB HOST")
@@ -44,6 +78,45 @@ class Settings(BaseSettings):
     REDIS_PORT: int = Field(6379, description="REDIS PORT")
     REDIS_DB: int = Field(0, description="REDIS DB")
     
+    # Redis 커넥션 풀/타임아웃/재시도 설정
+    REDIS_MAX_CONNECTIONS: int = Field(50, description="요청용 커넥션 풀 최대 크기")
+    REDIS_SOCKET_TIMEOUT: float = Field(5.0, description="명령 응답 대기 최대 시간 (초)")
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = Field(2.0, description="연결 수립 최대 시간 (초)")
+    REDIS_HEALTH_CHECK_INTERVAL: int = Field(30, description="유휴 커넥션 PING 확인 주기 (초)")
+    REDIS_RETRY_ATTEMPTS: int = Field(3, description="연결/타임아웃 오류 시 재시도 횟수")
+    REDIS_RETRY_BACKOFF_BASE: float = Field(0.05, description="재시도 지수 백오프 시작 값 (초)")
+    REDIS_RETRY_BACKOFF_CAP: float = Field(1.0, description="재시도 지수 백오프 최대 값 (초)")
+    
+    # Redis 클라이언트 사이드 캐시 (서버 invalidation 추적)
+    REDIS_CLIENT_CACHE_ENABLED: bool = Field(False, description="클라이언트 사이드 캐시 사용 여부")
+    REDIS_CLIENT_CACHE_PREFIXES: List[str] = Field(["progress:"], description="캐시/추적 대상 키 prefix (JSON)")
+    REDIS_CLIENT_CACHE_MAX_ENTRIES: int = Field(10000, description="로컬 캐시 최대 항목 수")
+    REDIS_CLIENT_CACHE_MAX_AGE: float = Field(60.0, description="invalidation 누락 대비 항목 최대 보존 시간 (초)")
+    
+    # Redis read-through 캐시 설정
+    CACHE_ENABLED: bool = Field(True, description="서비스 조회 결과 캐싱 사용 여부")
+    CACHE_KEY_PREFIX: str = Field("cache", description="캐시 키 prefix")
+    CACHE_NEGATIVE_TTL: int = Field(60, description="조회 결과 없음(None) 캐싱 시간 (초), 0이면 미사용")
+    CACHE_L1_ENABLED: bool = Field(True, description="프로세스 내 L1 캐시 사용 여부")
+    CACHE_L1_MAX_ENTRIES: int = Field(10000, description="L1 캐시 최대 항목 수")
+    CACHE_L1_MAX_BYTES: int = Field(64 * 1024 * 1024, description="L1 캐시 최대 크기 (직렬화 바이트 기준)")
+    CACHE_L1_TTL: float = Field(30.0, description="L1 캐시 항목 최대 보존 시간 (초)")
+    
+    # 동시 조회 합치기 (single-flight)
+    SINGLE_FLIGHT_DISTRIBUTED: bool = Field(False, description="워커 간 single-flight 사용 여부 (Redis 락 + Pub/Sub)")
+    SINGLE_FLIGHT_LEASE_TTL: float = Field(10.0, description="워커 간 leader 락 유지 시간 (초)")
+    SINGLE_FLIGHT_WAIT_TIMEOUT: float = Field(5.0, description="다른 워커 결과 대기 최대 시간 (초), 초과 시 직접 실행")
+    
+    # 사용자 목록 전체 수 계산
+    USER_COUNT_STRATEGY: Literal["exact", "estimated", "cached", "none"] = Field("exact", description="전체 수 계산 방식 (exact/estimated/cached/none)")
+    USER_COUNT_CACHE_TTL: int = Field(60, description="cached 방식의 전체 수 캐싱 시간 (초)")
+    USER_COUNT_EXACT_THRESHOLD: int = Field(10000, description="estimated 방식에서 추정치가 이보다 작으면 정확히 계산")
+    
+    # 사용자 일괄 생성
+    USER_BULK_MAX_ROWS: int = Field(50000, description="일괄 생성 요청 1건의 최대 행 수")
+    USER_BULK_BATCH_SIZE: int = Field(1000, description="다중 행 INSERT 한 문장에 담는 행 수")
+    USER_BULK_COPY_THRESHOLD: int = Field(5000, description="이 행 수 이상이면 COPY로 적재 (asyncpg 전용)")
+    
     # 인증 정보
     ACCESS_TOKEN: Optional[str] = Field(None, description="API 접근 토큰 (PROD 환경에서만 사용)")
     
@@ -57,6 +130,15 @@ class Settings(BaseSettings):
     def POSTGRES_URL(self) -> str:
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_NAME}"
     
+    @property
+    def POSTGRES_REPLICA_URLS(self) -> List[str]:
+        urls = []
+        for host in self.POSTGRES_REPLICA_HOSTS:
+            if ":" not in host:
+                host = f"{host}:{self.POSTGRES_PORT}"
+            urls.append(f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{host}/{self.POSTGRES_NAME}")
+        return urls
+    
     @property
     def SYNC_POSTGRES_URL(self) -> str:
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_NAME}"
@@ -2,6 +2,8 @@ from dependency_injector import containers, providers
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
 from app.database.session import UnitOfWork
+from app.database.pool import engine_options
+from app.database.replica import ReplicaRouter
 from app.config.setting import settings
 from app.service.user import UserService
 
@@ -11,8 +13,7 @@ class Container(containers.DeclarativeContainer):
     engine = providers.Singleton(
         create_async_engine,
         settings.POSTGRES_URL,
-        echo=False,
-        future=True,
+        **engine_options(),
     )
 
     session_factory = providers.Singleton(
@@ -24,10 +25,16 @@ class Container(containers.DeclarativeContainer):
         autocommit=False,
     )
 
-    uow = providers.Factory(UnitOfWork, session=session_factory)
+    # 읽기 전용 트랜잭션 라우팅 (POSTGRES_REPLICA_HOSTS가 비어 있으면 항상 primary)
+    replica_router = providers.Singleton(
+        ReplicaRouter,
+        urls=settings.POSTGRES_REPLICA_URLS,
+        strategy=settings.POSTGRES_REPLICA_STRATEGY,
+        max_lag=settings.POSTGRES_REPLICA_MAX_LAG,
+        check_interval=settings.POSTGRES_REPLICA_CHECK_INTERVAL,
+    )
+
+    uow = providers.Factory(UnitOfWork, session=session_factory, replicas=replica_router)
 
     # 서비스 계층 주입
     user_service = providers.Factory(UserService, uow=uow)
-    
-    # 컨트롤러 계층 주입
-    user_service_session = providers.Factory(UserService, uow=None)
@@ -0,0 +1,393 @@
+import json
+import asyncio
+import inspect
+from abc import ABC, abstractmethod
+from functools import lru_cache, wraps
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from app.config.setting import settings
+from app.core.local_cache import LocalCache
+from app.core.lock.scripts import ScriptCache
+from app.core.logger import get_logger
+from app.core.redis import RedisClient, get_redis_client, get_redis_pubsub_client
+from app.database.session import after_commit, in_write_transaction
+
+logger = get_logger("redis.cache")
+
+# 함수 인자로 캐시 키를 만드는 방법: "{email}" 형식 템플릿 또는 함수와 같은 인자를 받는 callable
+KeyBuilder = Union[str, Callable[..., str]]
+
+
+class Serializer(ABC):
+    """캐시 값 직렬화 인터페이스 (Redis 클라이언트가 decode_responses=True 이므로 문자열 기반)"""
+
+    @abstractmethod
+    def dumps(self, value: Any) -> str:
+        pass
+
+    @abstractmethod
+    def loads(self, data: str) -> Any:
+        pass
+
+
+class JsonSerializer(Serializer):
+    """dict/list/원시 타입용 JSON 직렬화"""
+
+    def dumps(self, value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, default=str)
+
+    def loads(self, data: str) -> Any:
+        return json.loads(data)
+
+
+class PydanticSerializer(Serializer):
+    """Pydantic 모델(DTO) 직렬화"""
+
+    def __init__(self, model: Type[BaseModel]) -> None:
+        self.model = model
+
+    def dumps(self, value: BaseModel) -> str:
+        return value.model_dump_json()
+
+    def loads(self, data: str) -> BaseModel:
+        return self.model.model_validate_json(data)
+
+
+class CacheService:
+    """
+    2단계(L1 프로세스 메모리 → L2 Redis) read-through 캐시 서비스
+
+    - 키 형식: {prefix}:{namespace}:v{version}:{key}
+    - 네임스페이스 버전을 올리면 이전 버전의 키 전체가 한 번에 무효화됨 (남은 키는 TTL로 소멸)
+    - 조회 결과가 None이면 negative_ttl 동안 "없음"을 캐싱해 반복 조회가 DB까지 가지 않게 함
+    - 무효화는 Pub/Sub으로 모든 워커에 전파되어 각 워커의 L1도 함께 제거
+    - L1은 무효화 채널을 구독 중일 때만 사용 (구독이 끊긴 동안의 변경을 놓치지 않도록)
+    - Redis 오류 시 캐시를 건너뛰고 원본 조회 결과를 그대로 반환
+    """
+
+    # 조회 결과가 None임을 나타내는 값 (직렬화 결과와 겹치지 않음)
+    NEGATIVE_MARKER = "\x00none"
+
+    # KEYS: version / ARGV: 버전 앞까지의 키 prefix, 키
+    READ_SCRIPT = """
+    local version = redis.call("GET", KEYS[1]) or "0"
+    return {version, redis.call("GET", ARGV[1] .. version .. ":" .. ARGV[2])}
+    """
+
+    # 무효화 채널 재구독 대기 시간 (초)
+    RESUBSCRIBE_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        prefix: str = "cache",
+        serializer: Optional[Serializer] = None,
+        local: Optional[LocalCache] = None,
+    ) -> None:
+        self.prefix = prefix
+        self.default_serializer = serializer or JsonSerializer()
+        self.local = local
+        self._scripts = ScriptCache()
+        # 네임스페이스별 무효화 세대 (조회 도중 무효화된 값을 L1에 넣지 않기 위함)
+        self._generations: Dict[str, int] = {}
+        self._listening = False
+        self._listener: Optional[asyncio.Task] = None
+        self.local_hits = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @property
+    def channel(self) -> str:
+        return f"{self.prefix}:invalidate"
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{self.prefix}:{namespace}:version"
+
+    def _key_prefix(self, namespace: str) -> str:
+        return f"{self.prefix}:{namespace}:v"
+
+    def _data_key(self, namespace: str, version: str, key: str) -> str:
+        return f"{self._key_prefix(namespace)}{version}:{key}"
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 상태 조회 (hit_ratio는 L1 + L2 기준)"""
+        total = self.local_hits + self.hits + self.misses
+        stats = {
+            "local_hits": self.local_hits,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.local_hits + self.hits) / total, 4) if total else 0.0,
+            "errors": self.errors,
+        }
+        if self.local is not None:
+            stats["local"] = {"listening": self._listening, **self.local.stats()}
+        return stats
+
+    # ---------- 생명주기 (L1 무효화 구독) ----------
+
+    async def start(self) -> None:
+        """무효화 채널 구독 시작 (앱 시작 시 호출, L1이 없으면 무시)"""
+        if self.local is None or self._listener is not None:
+            return
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """무효화 채널 구독 종료 (앱 종료 시 호출)"""
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        self._listening = False
+        if self.local is not None:
+            self.local.clear()
+
+    async def _listen(self) -> None:
+        """무효화 메시지를 L1에 반영, 연결이 끊기면 L1을 비우고 재구독"""
+        while True:
+            pubsub = None
+            try:
+                client = await get_redis_pubsub_client()
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.channel)
+                # 구독 전까지의 변경은 알 수 없으므로 비운 상태에서 시작
+                self.local.clear()
+                self._listening = True
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.bind(error=str(e)).warning("캐시 무효화 채널 구독 중단 - 재구독")
+            finally:
+                self._listening = False
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+            self.local.clear()
+            await asyncio.sleep(self.RESUBSCRIBE_INTERVAL)
+
+    def _apply_invalidation(self, data: str) -> None:
+        try:
+            message = json.loads(data)
+            self._invalidate_local(message["namespace"], message.get("keys"))
+        except (TypeError, ValueError, KeyError):
+            logger.bind(data=data).warning("잘못된 캐시 무효화 메시지")
+
+    def _invalidate_local(self, namespace: str, keys: Optional[List[str]]) -> None:
+        """L1 항목 제거 (keys가 None이면 네임스페이스 전체)"""
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        if self.local is None:
+            return
+        if keys is None:
+            self.local.invalidate_namespace(namespace)
+        else:
+            self.local.invalidate(namespace, keys)
+
+    async def _broadcast(self, namespace: str, keys: Optional[List[str]]) -> None:
+        """로컬 L1 제거 후 다른 워커에 무효화 전파"""
+        self._invalidate_local(namespace, keys)
+        client = await get_redis_client()
+        await client.publish(self.channel, json.dumps({"namespace": namespace, "keys": keys}))
+
+    async def load_scripts(self) -> None:
+        """앱 시작 시 Lua 스크립트를 미리 SCRIPT LOAD"""
+        client = await get_redis_client()
+        await self._scripts.load(client, (self.READ_SCRIPT,))
+
+    async def _read(self, namespace: str, key: str) -> Tuple[str, Optional[str]]:
+        """네임스페이스 현재 버전과 캐시 원문을 한 번의 왕복으로 조회"""
+        client = await get_redis_client()
+        version, raw = await self._scripts.get(client, self.READ_SCRIPT)(
+            keys=[self._version_key(namespace)], args=[self._key_prefix(namespace), key]
+        )
+        return version, raw
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int = RedisClient.SHORT_CACHE_TTL,
+        serializer: Optional[Serializer] = None,
+        negative_ttl: Optional[int] = None,
+        local: bool = True,
+    ) -> Any:
+        """
+        캐시에 있으면 반환, 없으면 loader 결과를 저장 후 반환
+
+        - 저장은 조회 시점의 네임스페이스 버전으로 수행 (그 사이 무효화됐다면 저장분은 읽히지 않음)
+        - negative_ttl: None이면 settings.CACHE_NEGATIVE_TTL, 0이면 None 결과를 캐싱하지 않음
+        - local: False면 L1을 건너뛰고 Redis만 사용
+        """
+        serializer = serializer or self.default_serializer
+        use_local = local and self.local is not None and self._listening
+        if use_local:
+            found, value = self.local.get(namespace, key)
+            if found:
+                self.local_hits += 1
+                return value
+        generation = self._generations.get(namespace, 0)
+
+        try:
+            version, raw = await self._read(namespace, key)
+        except Exception as e:
+            self.errors += 1
+            logger.bind(namespace=namespace, key=key, error=str(e)).warning("캐시 조회 실패 - 원본 조회")
+            return await loader()
+
+        if raw is not None:
+            self.hits += 1
+            value = None if raw == self.NEGATIVE_MARKER else serializer.loads(raw)
+            if use_local:
+                self._fill_local(namespace, key, value, len(raw), ttl, generation)
+            return value
+
+        self.misses += 1
+        value = await loader()
+
+        if value is None:
+            ttl = settings.CACHE_NEGATIVE_TTL if negative_ttl is None else negative_ttl
+            if not ttl:
+                return value
+        try:
+            client = await get_redis_client()
+            data = self.NEGATIVE_MARKER if value is None else serializer.dumps(value)
+            await client.set(self._data_key(namespace, version, key), data, ex=ttl)
+            if use_local:
+                self._fill_local(namespace, key, value, len(data), ttl, generation)
+        except Exception as e:
+            self.errors += 1
+            logger.bind(namespace=namespace, key=key, error=str(e)).warning("캐시 저장 실패")
+        return value
+
+    def _fill_local(self, namespace: str, key: str, value: Any, size: int, ttl: int, generation: int) -> None:
+        """조회 도중 무효화가 없었고 구독이 유지 중일 때만 L1에 저장"""
+        if self._listening and self._generations.get(namespace, 0) == generation:
+            self.local.set(namespace, key, value, size, ttl)
+
+    async def delete(self, namespace: str, *keys: str) -> None:
+        """현재 버전의 키 삭제 후 모든 워커의 L1에서도 제거 (이전 버전 키는 이미 읽히지 않음)"""
+        if not keys:
+            return
+        try:
+            client = await get_redis_client()
+            version = await client.get(self._version_key(namespace)) or "0"
+            await client.delete(*(self._data_key(namespace, version, key) for key in keys))
+            await self._broadcast(namespace, list(keys))
+        except Exception as e:
+            self._invalidate_local(namespace, list(keys))
+            self.errors += 1
+            logger.bind(namespace=namespace, keys=list(keys), error=str(e)).warning("캐시 삭제 실패")
+
+    async def invalidate_namespace(self, namespace: str) -> Optional[int]:
+        """네임스페이스 버전 증가로 전체 무효화 (모든 워커의 L1 포함), 새 버전 반환"""
+        try:
+            client = await get_redis_client()
+            version = await client.incr(self._version_key(namespace))
+            await self._broadcast(namespace, None)
+            logger.bind(namespace=namespace, version=version).info("캐시 네임스페이스 무효화")
+            return version
+        except Exception as e:
+            self._invalidate_local(namespace, None)
+            self.errors += 1
+            logger.bind(namespace=namespace, error=str(e)).warning("캐시 네임스페이스 무효화 실패")
+            return None
+
+
+@lru_cache(maxsize=1)
+def get_cache_service() -> CacheService:
+    """CacheService 싱글톤 인스턴스를 반환합니다."""
+    local = None
+    if settings.CACHE_L1_ENABLED:
+        local = LocalCache(
+            max_entries=settings.CACHE_L1_MAX_ENTRIES,
+            max_bytes=settings.CACHE_L1_MAX_BYTES,
+            ttl=settings.CACHE_L1_TTL,
+        )
+    return CacheService(prefix=settings.CACHE_KEY_PREFIX, local=local)
+
+
+def key_builder(fn: Callable, key: KeyBuilder) -> Callable[..., str]:
+    """함수 호출 인자로 캐시 키를 만드는 함수 생성"""
+    if callable(key):
+        return key
+    signature = inspect.signature(fn)
+
+    def build(*args: Any, **kwargs: Any) -> str:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return key.format(**bound.arguments)
+    return build
+
+
+def cached(
+    namespace: str,
+    key: KeyBuilder,
+    ttl: int = RedisClient.SHORT_CACHE_TTL,
+    serializer: Optional[Serializer] = None,
+    negative_ttl: Optional[int] = None,
+    local: bool = True,
+):
+    """
+    비동기 함수 결과를 L1(프로세스 메모리)/L2(Redis)에 캐싱하는 데코레이터
+
+    - key: "{email}" 같은 인자 이름 템플릿 또는 함수와 같은 인자를 받는 callable
+    - local=False면 Redis에만 캐싱 (값이 크거나 워커 간 즉시 일관성이 더 중요한 경우)
+    - @transactional 위에 두면 캐시 적중 시 DB 세션을 열지 않음
+    - 쓰기 트랜잭션(요청 단위 트랜잭션 등) 안에서는 캐시를 건너뜀
+      (커밋 전/롤백될 값이 캐시에 남거나, 같은 트랜잭션의 쓰기가 캐시된 "없음"에 가려지지 않도록)
+    """
+    def decorator(fn):
+        build_key = key_builder(fn, key)
+
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if not settings.CACHE_ENABLED or in_write_transaction():
+                return await fn(*args, **kwargs)
+            return await get_cache_service().get_or_load(
+                namespace,
+                build_key(*args, **kwargs),
+                lambda: fn(*args, **kwargs),
+                ttl=ttl,
+                serializer=serializer,
+                negative_ttl=negative_ttl,
+                local=local,
+            )
+        return wrapper
+    return decorator
+
+
+def cache_evict(namespace: str, key: Optional[KeyBuilder] = None):
+    """
+    함수가 성공하면 캐시를 무효화하는 데코레이터
+
+    - key가 있으면 해당 키만 삭제, 없으면 네임스페이스 전체 무효화
+    - @transactional 위에 두면 커밋 이후에 무효화됨 (커밋 전 재적재로 인한 오래된 값 방지)
+    - 바깥 트랜잭션(요청 단위 트랜잭션 등)에 참여한 경우에는 그 트랜잭션의 커밋 후로 미룸
+    """
+    def decorator(fn):
+        build_key = key_builder(fn, key) if key is not None else None
+
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            result = await fn(*args, **kwargs)
+            if settings.CACHE_ENABLED:
+                cache = get_cache_service()
+                if build_key is None:
+                    evict = lambda: cache.invalidate_namespace(namespace)
+                else:
+                    cache_key = build_key(*args, **kwargs)
+                    evict = lambda: cache.delete(namespace, cache_key)
+                if not after_commit(evict):
+                    await evict()
+            return result
+        return wrapper
+    return decorator
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import List, Dict, Any, Optional
 from pathlib import Path
+import hashlib
+import json
 import traceback
 import asyncio
 from functools import lru_cache
@@ -11,21 +13,46 @@ from langchain_core.documents import Document
 
 from app.config.setting import settings
 from app.core.logger import get_logger
-from app.core.lock import get_redis_lock
+from app.core.lock import get_redis_rw_lock, get_redis_semaphore
+from app.core.cache import cached, get_cache_service
+from app.core.single_flight import single_flight
 
 logger = get_logger("chromaDB.manager")
 
+# 컬렉션 메타데이터(목록/문서 수) 캐시 네임스페이스와 TTL (초)
+CHROMA_CACHE_NAMESPACE = "chroma"
+CHROMA_METADATA_TTL = 300
+
+
+def _search_key(
+    self: "ChromaManager",
+    query: str,
+    k: int,
+    collection_name: str,
+    filter: Optional[Dict[str, Any]] = None,
+) -> str:
+    """같은 컬렉션/질의/k/필터의 동시 검색을 하나로 합치기 위한 키"""
+    digest = hashlib.sha1(
+        json.dumps([query, k, filter], sort_keys=True, ensure_ascii=False, default=str).encode()
+    ).hexdigest()
+    return f"{collection_name}:{digest}"
+
 
 class ChromaManager:
     """ChromaDB 벡터 스토어 관리자"""
 
+    EMBEDDING_MODEL = "text-embedding-3-large"
+
     def __init__(self, persist_directory: str = "./data/chromadb-data"):
         self.embeddings: Optional[OpenAIEmbeddings] = None
         self.collections: Dict[str, Chroma] = {}
         self.persist_directory = persist_directory
         self.client: Optional[chromadb.PersistentClient] = None
         self._initialized = False
-        self._lock = get_redis_lock()
+        # 검색은 읽기 락(동시 허용), 컬렉션 로드/삭제와 문서 적재는 쓰기 락
+        self._lock = get_redis_rw_lock()
+        # 임베딩 API 동시 호출 한도 (클러스터 전체)
+        self._semaphore = get_redis_semaphore()
 
     # ---------- 내부 유틸 ----------
 
@@ -38,6 +65,20 @@ class ChromaManager:
     def is_initialized(self) -> bool:
         return self._initialized and self.client is not None
 
+    async def _invalidate_metadata(self, *keys: str) -> None:
+        """컬렉션 메타데이터 캐시 무효화 (모든 워커의 L1 포함)"""
+        if settings.CACHE_ENABLED:
+            await get_cache_service().delete(CHROMA_CACHE_NAMESPACE, *keys)
+
+    def _embedding_slot(self):
+        """임베딩 호출 슬롯 (async with, 획득 실패 시 False)"""
+        return self._semaphore.lock(
+            f"embedding:{self.EMBEDDING_MODEL}",
+            ttl=60,
+            timeout=settings.LLM_CONCURRENCY_TIMEOUT,
+            auto_renew=True
+        )
+
     # ---------- 초기화 ----------
 
     async def initialize(self) -> bool:
@@ -52,7 +93,10 @@ class ChromaManager:
             
             self.embeddings = OpenAIEmbeddings(
                 openai_api_key=openai_api_key,
-                model="text-embedding-3-large",
+                model=self.EMBEDDING_MODEL,
+            )
+            self._semaphore.set_limit(
+                f"embedding:{self.EMBEDDING_MODEL}", settings.EMBEDDING_CONCURRENCY_LIMIT
             )
 
             Path(self.persist_directory).mkdir(parents=True, exist_ok=True)
@@ -80,12 +124,17 @@ class ChromaManager:
             logger.warning("ChromaDB not initialized")
             return []
         try:
-            cols = await self._to_thread(self.client.list_collections)
-            return [c.name for c in cols]
+            return await self._collection_names()
         except Exception as e:
             logger.error(f"Failed to list collections: {e}")
             return []
 
+    @cached(CHROMA_CACHE_NAMESPACE, key="collections", ttl=CHROMA_METADATA_TTL)
+    async def _collection_names(self) -> List[str]:
+        """컬렉션 이름 목록 (캐시, 실패 시 예외를 그대로 올려 캐싱되지 않게 함)"""
+        cols = await self._to_thread(self.client.list_collections)
+        return [c.name for c in cols]
+
 
     async def delete_collection(self, collection_name: str) -> bool:
         """컬렉션 삭제"""
@@ -101,6 +150,7 @@ class ChromaManager:
             try:
                 self.collections.pop(collection_name, None)
                 await self._to_thread(self.client.delete_collection, collection_name)
+                await self._invalidate_metadata("collections", f"{collection_name}:count")
                 logger.info(f"Collection '{collection_name}' 삭제 완료")
                 return True
             except Exception as e:
@@ -117,8 +167,11 @@ class ChromaManager:
         if collection_name in self.collections:
             return self.collections[collection_name]
 
-        async with self._lock.lock(f"chroma:collection:{collection_name}", ttl=60, timeout=10) as acquired:
-            if not acquired:
+        # 대용량 컬렉션 로드가 TTL을 넘겨도 다른 워커가 진입하지 않도록 자동 연장
+        async with self._lock.lock(
+            f"chroma:collection:{collection_name}", ttl=60, timeout=10, auto_renew=True
+        ) as lease:
+            if not lease:
                 logger.warning(f"Failed to acquire lock for collection '{collection_name}'")
                 return None
                 
@@ -135,7 +188,12 @@ class ChromaManager:
                     )
 
                 vector_store = await self._to_thread(_build)
+                # 로드 중 lease를 잃었으면 다른 워커가 진입했을 수 있으므로 등록하지 않고 중단
+                if lease.lost:
+                    logger.warning(f"Lost lock for collection '{collection_name}' while loading, aborting")
+                    return None
                 self.collections[collection_name] = vector_store
+                await self._invalidate_metadata("collections")
 
                 try:
                     count = await self._to_thread(vector_store._collection.count)
@@ -165,14 +223,25 @@ class ChromaManager:
             logger.warning(f"Collection '{collection_name}' not found")
             return False
 
-        try:
-            document = Document(page_content=content, metadata=metadata)
-            await vector_store.aadd_documents(documents=[document], ids=[document_id])
-            logger.info(f"Added document {document_id} to collection '{collection_name}'")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to add document to ChromaDB: {e}")
-            return False
+        async with self._lock.lock(f"chroma:collection:{collection_name}", ttl=60, timeout=10) as acquired:
+            if not acquired:
+                logger.warning(f"Failed to acquire write lock for collection '{collection_name}'")
+                return False
+
+            async with self._embedding_slot() as slot:
+                if not slot:
+                    logger.warning("Embedding concurrency limit reached")
+                    return False
+
+                try:
+                    document = Document(page_content=content, metadata=metadata)
+                    await vector_store.aadd_documents(documents=[document], ids=[document_id])
+                    await self._invalidate_metadata(f"{collection_name}:count")
+                    logger.info(f"Added document {document_id} to collection '{collection_name}'")
+                    return True
+                except Exception as e:
+                    logger.error(f"Failed to add document to ChromaDB: {e}")
+                    return False
 
 
     async def delete_document(self, document_id: str, collection_name: str) -> bool:
@@ -182,13 +251,19 @@ class ChromaManager:
             logger.warning(f"Collection '{collection_name}' not found")
             return False
 
-        try:
-            await vector_store.adelete(ids=[document_id])
-            logger.info(f"Deleted document {document_id} from collection '{collection_name}'")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to delete document from ChromaDB: {e}")
-            return False
+        async with self._lock.lock(f"chroma:collection:{collection_name}", ttl=60, timeout=10) as acquired:
+            if not acquired:
+                logger.warning(f"Failed to acquire write lock for collection '{collection_name}'")
+                return False
+
+            try:
+                await vector_store.adelete(ids=[document_id])
+                await self._invalidate_metadata(f"{collection_name}:count")
+                logger.info(f"Deleted document {document_id} from collection '{collection_name}'")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to delete document from ChromaDB: {e}")
+                return False
 
 
     async def update_document(
@@ -227,6 +302,7 @@ class ChromaManager:
         return vector_store.as_retriever(search_type=search_type, search_kwargs=kwargs)
 
 
+    @single_flight("chroma:search", key=_search_key)
     async def search(
         self,
         query: str,
@@ -234,21 +310,33 @@ class ChromaManager:
         collection_name: str,
         filter: Optional[Dict[str, Any]] = None,
     ) -> List[Document]:
-        """유사도 검색"""
+        """유사도 검색 (같은 검색이 동시에 들어오면 임베딩/검색을 한 번만 수행)"""
         vector_store = await self.get_or_create_collection(collection_name)
         if not vector_store:
             logger.warning(f"Collection '{collection_name}' not found")
             return []
 
-        try:
-            if filter:
-                results = await vector_store.asimilarity_search(query=query, k=k, filter=filter)
-            else:
-                results = await vector_store.asimilarity_search(query=query, k=k)
-            return results
-        except Exception as e:
-            logger.error(f"Failed to search in ChromaDB: {e}")
-            return []
+        # 여러 검색은 동시에 진행, 쓰기(삭제/적재) 중에만 대기
+        async with self._lock.read_lock(f"chroma:collection:{collection_name}", ttl=60, timeout=10) as acquired:
+            if not acquired:
+                logger.warning(f"Failed to acquire read lock for collection '{collection_name}'")
+                return []
+
+            # 질의 임베딩 호출 포함
+            async with self._embedding_slot() as slot:
+                if not slot:
+                    logger.warning("Embedding concurrency limit reached")
+                    return []
+
+                try:
+                    if filter:
+                        results = await vector_store.asimilarity_search(query=query, k=k, filter=filter)
+                    else:
+                        results = await vector_store.asimilarity_search(query=query, k=k)
+                    return results
+                except Exception as e:
+                    logger.error(f"Failed to search in ChromaDB: {e}")
+                    return []
 
     # ---------- 통계/유틸 ----------
 
@@ -258,10 +346,15 @@ class ChromaManager:
         if not vector_store:
             return 0
         try:
-            return await self._to_thread(vector_store._collection.count)
+            return await self._document_count(collection_name, vector_store)
         except Exception:
             return 0
 
+    @cached(CHROMA_CACHE_NAMESPACE, key="{collection_name}:count", ttl=CHROMA_METADATA_TTL)
+    async def _document_count(self, collection_name: str, vector_store: Chroma) -> int:
+        """컬렉션 문서 수 (캐시)"""
+        return await self._to_thread(vector_store._collection.count)
+
     async def get_all_document_counts(self) -> Dict[str, int]:
         """모든 컬렉션의 문서 수"""
         counts: Dict[str, int] = {}
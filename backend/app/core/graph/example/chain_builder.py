@@ -13,6 +13,7 @@ class ChainManager:
         self._prompt_manager = prompt_manager
         self._llm_manager = get_llm_manager()
         self._chains: Dict[str, Any] = {}
+        self._chain_models: Dict[str, ModelName] = {}
     
     
     def build_example_response_chain(self) -> Any:
@@ -24,6 +25,7 @@ class ChainManager:
             ])
             model = self._llm_manager.get_model(ModelName.GPT_4O_MINI)
             self._chains['example_response'] = prompt | model | StrOutputParser()
+            self._chain_models['example_response'] = ModelName.GPT_4O_MINI
         
         return self._chains['example_response']
     
@@ -35,4 +37,9 @@ class ChainManager:
     
     def get_chain(self, chain_name: str) -> Optional[Any]:
         """특정 체인을 반환합니다."""
-        return self._chains.get(chain_name)
\ No newline at end of file
+        return self._chains.get(chain_name)
+    
+    
+    def get_chain_model(self, chain_name: str) -> Optional[ModelName]:
+        """체인이 사용하는 모델 이름을 반환합니다."""
+        return self._chain_models.get(chain_name)
\ No newline at end of file
@@ -12,6 +12,7 @@ from app.core.graph.example.graph_state import GraphState
 from app.core.graph.example.prompt_manager import PromptManager
 from app.core.graph.example.chain_builder import ChainManager
 from app.core.chroma_manager import get_chroma_manager
+from app.core.llm_manager import get_llm_manager
 from app.util.agent_assistant import format_docs, format_retriever
 
 
@@ -27,6 +28,7 @@ class GraphOrchestrator:
         self._prompt_manager = prompt_manager
         self._chain_manager = chain_manager
         self.chromadb_manager = get_chroma_manager()
+        self._llm_manager = get_llm_manager()
         self._db_path = db_path
         self._memory_saver: Optional[AsyncSqliteSaver] = None
         self._graph: Optional[Any] = None
@@ -68,11 +70,17 @@ class GraphOrchestrator:
     async def _example_response(self, state: GraphState) -> Dict[str, Any]:
         """응답을 생성합니다."""
         chain = self._chain_manager.get_chain('example_response')
-        answer = await chain.ainvoke({
-            "context": format_retriever(state["documents"]),
-            "question": state["question"].content,
-            "history": format_docs(state["messages"])
-        })
+        model_name = self._chain_manager.get_chain_model('example_response')
+        
+        # 모델별 클러스터 전체 동시 호출 한도 적용
+        async with self._llm_manager.concurrency_slot(model_name) as acquired:
+            if not acquired:
+                raise TimeoutError(f"LLM concurrency limit reached for '{model_name.value}'")
+            answer = await chain.ainvoke({
+                "context": format_retriever(state["documents"]),
+                "question": state["question"].content,
+                "history": format_docs(state["messages"])
+            })
         
         return {
             "answer": AIMessage(answer)
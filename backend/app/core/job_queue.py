@@ -0,0 +1,312 @@
+import json
+import time
+import random
+import asyncio
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.config.setting import settings
+from app.core.lock import RedisLock, get_redis_lock
+from app.core.lock.scripts import ScriptCache
+from app.core.logger import get_logger
+from app.core.redis import get_redis_client
+
+logger = get_logger("redis.job_queue")
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class RedisJobQueue:
+    """
+    Redis 기반 분산 작업 큐
+
+    - pending 리스트에서 BLMOVE로 processing 리스트로 옮기며 작업을 가져감
+    - 작업 소유권(lease)은 RedisLock(`job:lease:{job_id}`)으로 표현하고,
+      하트비트 태스크가 RedisLock.extend로 TTL을 연장
+    - lease가 만료된(워커 비정상 종료) 작업은 다른 워커의 reclaim 루프가 pending으로 되돌림
+    """
+
+    # lease가 없고 claim 이후 grace 시간이 지난 processing 작업을 pending으로 복구
+    RECLAIM_SCRIPT = """
+    local ids = redis.call("LRANGE", KEYS[2], 0, -1)
+    local reclaimed = {}
+    for _, id in ipairs(ids) do
+        if redis.call("EXISTS", ARGV[3] .. id) == 0 then
+            local claimed = redis.call("HGET", KEYS[3], id)
+            if not claimed then
+                redis.call("HSET", KEYS[3], id, ARGV[1])
+            elseif tonumber(ARGV[1]) - tonumber(claimed) > tonumber(ARGV[2]) then
+                if redis.call("LREM", KEYS[2], 1, id) > 0 then
+                    redis.call("HDEL", KEYS[3], id)
+                    redis.call("RPUSH", KEYS[1], id)
+                    table.insert(reclaimed, id)
+                end
+            end
+        end
+    end
+    return reclaimed
+    """
+
+    # processing에 남아 있을 때만 pending으로 반환 (reclaim이 먼저 옮겼으면 중복 추가하지 않음)
+    # KEYS: pending, processing, claimed_at, attempts / ARGV: job_id, 시도 횟수 되돌림 여부(1/0)
+    REQUEUE_SCRIPT = """
+    if redis.call("LREM", KEYS[2], 1, ARGV[1]) == 0 then
+        return 0
+    end
+    redis.call("HDEL", KEYS[3], ARGV[1])
+    if ARGV[2] == "1" then
+        redis.call("HINCRBY", KEYS[4], ARGV[1], -1)
+    end
+    redis.call("RPUSH", KEYS[1], ARGV[1])
+    return 1
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        lease_ttl: int = 30,
+        max_concurrency: int = 100,
+        reclaim_interval: float = 10.0,
+        max_attempts: int = 3,
+        requeue_delay: float = 1.0,
+        lock: Optional[RedisLock] = None,
+    ) -> None:
+        self.name = name
+        self.lease_ttl = lease_ttl
+        self.max_concurrency = max_concurrency
+        self.reclaim_interval = reclaim_interval
+        self.max_attempts = max_attempts
+        self.requeue_delay = requeue_delay
+        self._lock = lock or get_redis_lock()
+        self._scripts = ScriptCache()
+
+        self._handlers: Dict[str, JobHandler] = {}
+        self._running_jobs: Dict[str, asyncio.Task] = {}
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._consumer: Optional[asyncio.Task] = None
+        self._reclaimer: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        # 카운터
+        self.completed_count = 0
+        self.reclaimed_count = 0
+
+    # ---------- 키 ----------
+
+    @property
+    def _pending_key(self) -> str:
+        return f"jobs:{self.name}:pending"
+
+    @property
+    def _processing_key(self) -> str:
+        return f"jobs:{self.name}:processing"
+
+    @property
+    def _data_key(self) -> str:
+        return f"jobs:{self.name}:data"
+
+    @property
+    def _claimed_key(self) -> str:
+        return f"jobs:{self.name}:claimed_at"
+
+    @property
+    def _attempts_key(self) -> str:
+        return f"jobs:{self.name}:attempts"
+
+    @staticmethod
+    def _lease_name(job_id: str) -> str:
+        return f"job:lease:{job_id}"
+
+    # ---------- 등록/제출 ----------
+
+    def register(self, job_type: str, handler: JobHandler) -> None:
+        """작업 타입별 핸들러 등록"""
+        self._handlers[job_type] = handler
+
+    async def enqueue(self, job_type: str, payload: Dict[str, Any], job_id: str) -> None:
+        """작업 제출 (어느 워커 프로세스에서든 실행될 수 있음)"""
+        client = await get_redis_client()
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._data_key, job_id, json.dumps({"type": job_type, "payload": payload}))
+            pipe.lpush(self._pending_key, job_id)
+            await pipe.execute()
+        logger.bind(job_id=job_id, job_type=job_type).debug("작업 제출")
+
+    def running_jobs(self) -> List[str]:
+        """현재 워커에서 실행 중인 작업 ID 목록"""
+        return list(self._running_jobs)
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 워커의 작업 큐 상태 조회"""
+        return {
+            "running": len(self._running_jobs),
+            "completed": self.completed_count,
+            "reclaimed": self.reclaimed_count,
+        }
+
+    # ---------- 생명주기 ----------
+
+    async def start(self) -> None:
+        """작업 소비/회수 루프 시작"""
+        self._stopping = False
+        if self._consumer is None:
+            self._consumer = asyncio.create_task(self._consume())
+        if self._reclaimer is None:
+            self._reclaimer = asyncio.create_task(self._reclaim_loop())
+        logger.bind(
+            queue=self.name,
+            lease_ttl=self.lease_ttl,
+            max_concurrency=self.max_concurrency
+        ).info("작업 큐 워커 시작")
+
+    async def stop(self) -> None:
+        """
+        작업 소비 중단
+
+        - 실행 중인 작업은 취소 후 즉시 pending으로 되돌려 다른 워커가 이어받게 함
+        """
+        self._stopping = True
+        for task in (self._consumer, self._reclaimer):
+            if task:
+                task.cancel()
+        await asyncio.gather(
+            *(t for t in (self._consumer, self._reclaimer) if t), return_exceptions=True
+        )
+        self._consumer = self._reclaimer = None
+
+        running = list(self._running_jobs.values())
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        logger.bind(queue=self.name, requeued=len(running)).info("작업 큐 워커 종료")
+
+    # ---------- 내부 ----------
+
+    async def _consume(self) -> None:
+        client = await get_redis_client()
+        while not self._stopping:
+            await self._slots.acquire()
+            try:
+                job_id = await client.blmove(
+                    self._pending_key, self._processing_key, timeout=1, src="RIGHT", dest="LEFT"
+                )
+            except asyncio.CancelledError:
+                self._slots.release()
+                raise
+            except Exception as e:
+                self._slots.release()
+                logger.bind(queue=self.name, error=str(e)).error("작업 가져오기 실패")
+                await asyncio.sleep(1)
+                continue
+
+            if job_id is None:
+                self._slots.release()
+                continue
+
+            await client.hset(self._claimed_key, job_id, int(time.time()))
+            self._running_jobs[job_id] = asyncio.create_task(self._execute(job_id))
+
+    async def _execute(self, job_id: str) -> None:
+        """lease 획득 → 하트비트와 함께 핸들러 실행 → 완료 처리"""
+        lease_name = self._lease_name(job_id)
+        leased = requeue = False
+        try:
+            if not await self._lock.acquire(lease_name, ttl=self.lease_ttl):
+                # 바로 되돌리면 워커들이 가져오기/반환을 반복하므로 잠시 후 반환 (실행하지 않았으므로 시도 횟수는 유지)
+                logger.bind(job_id=job_id).warning("작업 lease 획득 실패 - 잠시 후 pending으로 반환")
+                await asyncio.sleep(random.uniform(self.requeue_delay / 2, self.requeue_delay))
+                requeue = True
+                return
+            leased = True
+
+            client = await get_redis_client()
+            raw, attempts = await asyncio.gather(
+                client.hget(self._data_key, job_id),
+                client.hincrby(self._attempts_key, job_id, 1),
+            )
+            job = json.loads(raw) if raw else None
+            handler = self._handlers.get(job["type"]) if job else None
+
+            if handler is None or attempts > self.max_attempts:
+                logger.bind(job_id=job_id, attempts=attempts).error("실행할 수 없는 작업 - 폐기")
+                await self._complete(job_id)
+                return
+
+            heartbeat = asyncio.create_task(self._heartbeat(lease_name, asyncio.current_task()))
+            try:
+                await handler(job["payload"])
+            finally:
+                heartbeat.cancel()
+            await self._complete(job_id)
+            self.completed_count += 1
+        except asyncio.CancelledError:
+            # 종료(stop)면 즉시 pending으로 반환, lease 상실이면 소유한 워커에 맡김
+            requeue = self._stopping
+        except Exception as e:
+            logger.bind(job_id=job_id, error=str(e)).error("작업 실행 중 오류")
+            await self._complete(job_id)
+        finally:
+            # lease를 먼저 해제해야 반환된 작업을 가져간 워커가 lease를 얻을 수 있음
+            if leased:
+                await self._lock.release(lease_name)
+            if requeue:
+                await self._requeue(job_id, attempted=leased)
+            self._running_jobs.pop(job_id, None)
+            self._slots.release()
+
+    async def _heartbeat(self, lease_name: str, job_task: asyncio.Task) -> None:
+        """lease TTL의 1/3 주기로 연장, 연장 실패 시(lease 상실) 작업 취소"""
+        interval = max(self.lease_ttl / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            if not await self._lock.extend(lease_name, self.lease_ttl):
+                logger.bind(lease=lease_name).warning("작업 lease 상실 - 중복 실행 방지를 위해 취소")
+                job_task.cancel()
+                return
+
+    async def _complete(self, job_id: str) -> None:
+        client = await get_redis_client()
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.lrem(self._processing_key, 1, job_id)
+            pipe.hdel(self._data_key, job_id)
+            pipe.hdel(self._claimed_key, job_id)
+            pipe.hdel(self._attempts_key, job_id)
+            await pipe.execute()
+
+    async def _requeue(self, job_id: str, attempted: bool = True) -> None:
+        """processing → pending 반환 (attempted면 이번 시도는 횟수에서 제외)"""
+        client = await get_redis_client()
+        await self._scripts.get(client, self.REQUEUE_SCRIPT)(
+            keys=[self._pending_key, self._processing_key, self._claimed_key, self._attempts_key],
+            args=[job_id, 1 if attempted else 0],
+        )
+
+    async def _reclaim_loop(self) -> None:
+        lease_prefix = self._lock.lock_key(self._lease_name(""))
+        while not self._stopping:
+            try:
+                client = await get_redis_client()
+                reclaimed = await self._scripts.get(client, self.RECLAIM_SCRIPT)(
+                    keys=[self._pending_key, self._processing_key, self._claimed_key],
+                    args=[int(time.time()), self.lease_ttl, lease_prefix],
+                )
+                if reclaimed:
+                    self.reclaimed_count += len(reclaimed)
+                    logger.bind(queue=self.name, job_ids=reclaimed).warning("만료된 작업 lease 회수")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.bind(queue=self.name, error=str(e)).error("작업 회수 실패")
+            await asyncio.sleep(self.reclaim_interval)
+
+
+@lru_cache(maxsize=1)
+def get_job_queue() -> RedisJobQueue:
+    """RedisJobQueue 싱글톤 인스턴스를 반환합니다."""
+    return RedisJobQueue(
+        lease_ttl=settings.JOB_LEASE_TTL,
+        max_concurrency=settings.JOB_MAX_CONCURRENCY,
+        reclaim_interval=settings.JOB_RECLAIM_INTERVAL,
+        max_attempts=settings.JOB_MAX_ATTEMPTS,
+        requeue_delay=settings.JOB_REQUEUE_DELAY,
+    )
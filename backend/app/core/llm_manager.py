@@ -1,9 +1,10 @@
-from typing import Dict, List
+from typing import AsyncContextManager, Dict, List
 from langchain_openai import ChatOpenAI
 from enum import Enum
 from functools import lru_cache
 
 from app.config.setting import settings
+from app.core.lock import LockLease, get_redis_semaphore
 
 
 class ModelName(str, Enum):
@@ -24,6 +25,7 @@ class LLMManager:
     def __init__(self):
         self._models: Dict[str, ChatOpenAI] = {}
         self._initialized = False
+        self._semaphore = get_redis_semaphore()
     
     def initialize(self) -> bool:
         """모든 LLM 모델을 초기화합니다."""
@@ -33,6 +35,10 @@ class LLMManager:
                     api_key=settings.OPENAI_API_KEY,
                     model=model.value
                 )
+                if model.value in settings.LLM_CONCURRENCY_LIMITS:
+                    self._semaphore.set_limit(
+                        self._slot_name(model.value), settings.LLM_CONCURRENCY_LIMITS[model.value]
+                    )
             self._initialized = True
         
         return self._initialized
@@ -50,6 +56,24 @@ class LLMManager:
         
         return self._models[model_name]
     
+    @staticmethod
+    def _slot_name(model_name: str) -> str:
+        return f"llm:{ModelName(model_name).value}"
+    
+    def concurrency_slot(self, model_name: str) -> AsyncContextManager[LockLease]:
+        """
+        모델별 클러스터 전체 동시 호출 슬롯 (async with)
+        
+        - LLM_CONCURRENCY_TIMEOUT 동안 슬롯을 얻지 못하면 LockLease가 False로 평가됨
+        - 호출이 길어져도 lease가 만료되지 않도록 자동 연장
+        """
+        return self._semaphore.lock(
+            self._slot_name(model_name),
+            ttl=60,
+            timeout=settings.LLM_CONCURRENCY_TIMEOUT,
+            auto_renew=True
+        )
+    
     def is_initialized(self) -> bool:
         """초기화 상태를 반환합니다."""
         return self._initialized
@@ -0,0 +1,87 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+
+@dataclass
+class _Entry:
+    """로컬 캐시 항목 (값, 직렬화 기준 크기, 만료 시각)"""
+    value: Any
+    size: int
+    expires_at: float
+
+
+class LocalCache:
+    """
+    프로세스 내 LRU 캐시 (Redis 캐시 앞단의 L1)
+
+    - 항목 수와 바이트(직렬화 크기 기준) 두 가지 한도를 넘으면 가장 오래 안 쓴 항목부터 제거
+    - 항목마다 TTL을 가지며, 네임스페이스 단위 일괄 무효화 지원
+    - 단일 이벤트 루프에서만 사용 (잠금 없음)
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024, ttl: float = 30.0) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._namespaces: Dict[str, Set[str]] = {}
+        self.size_bytes = 0
+        self.evictions = 0
+
+    def get(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """(적중 여부, 값) 반환 — None 값도 적중일 수 있으므로 적중 여부를 함께 반환"""
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return False, None
+        if entry.expires_at <= time.monotonic():
+            self._remove(namespace, key)
+            return False, None
+        self._entries.move_to_end((namespace, key))
+        return True, entry.value
+
+    def set(self, namespace: str, key: str, value: Any, size: int, ttl: Optional[float] = None) -> None:
+        """값 저장 (ttl은 기본 TTL을 넘지 않음, 한도보다 큰 값은 저장하지 않음)"""
+        if size > self.max_bytes:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._remove(namespace, key)
+        self._entries[(namespace, key)] = _Entry(value, size, time.monotonic() + ttl)
+        self._namespaces.setdefault(namespace, set()).add(key)
+        self.size_bytes += size
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            (old_namespace, old_key), _ = next(iter(self._entries.items()))
+            self._remove(old_namespace, old_key)
+            self.evictions += 1
+
+    def invalidate(self, namespace: str, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._remove(namespace, key)
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        for key in list(self._namespaces.get(namespace, ())):
+            self._remove(namespace, key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._namespaces.clear()
+        self.size_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size_bytes,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, namespace: str, key: str) -> None:
+        entry = self._entries.pop((namespace, key), None)
+        if entry is None:
+            return
+        self.size_bytes -= entry.size
+        keys = self._namespaces.get(namespace)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._namespaces[namespace]
@@ -1,12 +1,36 @@
 from functools import lru_cache
 
-from app.core.lock.base import DistributedLock
+from app.core.lock.base import DistributedLock, LockLease
 from app.core.lock.redis_lock import RedisLock
+from app.core.lock.redis_rw_lock import RedisReadWriteLock
+from app.core.lock.redis_semaphore import RedisSemaphore
 
-__all__ = ["DistributedLock", "RedisLock", "get_redis_lock"]
+__all__ = [
+    "DistributedLock",
+    "LockLease",
+    "RedisLock",
+    "RedisReadWriteLock",
+    "RedisSemaphore",
+    "get_redis_lock",
+    "get_redis_rw_lock",
+    "get_redis_semaphore",
+]
 
 
 @lru_cache(maxsize=1)
 def get_redis_lock() -> RedisLock:
     """Redis Lock 싱글톤 인스턴스를 반환합니다"""
-    return RedisLock()
\ No newline at end of file
+    return RedisLock()
+
+
+@lru_cache(maxsize=1)
+def get_redis_rw_lock() -> RedisReadWriteLock:
+    """Redis Read/Write Lock 싱글톤 인스턴스를 반환합니다"""
+    return RedisReadWriteLock()
+
+
+
+@lru_cache(maxsize=1)
+def get_redis_semaphore() -> RedisSemaphore:
+    """Redis Semaphore 싱글톤 인스턴스를 반환합니다"""
+    return RedisSemaphore()
@@ -1,13 +1,42 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, AsyncIterator
+from typing import Optional, AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 
+from app.core.logger import get_logger
+
+logger = get_logger("lock")
+
+
+class LockLease:
+    """
+    lock() 컨텍스트가 반환하는 락 보유 상태
+
+    - bool 평가 시 획득 여부를 반환 (기존 `if acquired:` 사용법 유지)
+    - fencing_token: 배타 락 획득 시 발급된 단조 증가 토큰 (보호 자원에 함께 전달해 오래된 보유자의 쓰기를 거부)
+    - auto_renew 중 TTL 연장에 실패하면 lost가 True가 되며, 호출자는 작업을 중단해야 함
+    """
+
+    def __init__(self, name: str, acquired: bool, fencing_token: Optional[int] = None) -> None:
+        self.name = name
+        self.acquired = acquired
+        self.fencing_token = fencing_token
+        self.lost_event = asyncio.Event()
+
+    @property
+    def lost(self) -> bool:
+        """보유 중 lease를 잃었는지 여부"""
+        return self.lost_event.is_set()
+
+    def __bool__(self) -> bool:
+        return self.acquired
+
 
 class DistributedLock(ABC):
     """분산 락을 위한 추상 기본 클래스"""
     
     @abstractmethod
-    async def acquire(self, name: str, ttl: int = 30, timeout: Optional[float] = None) -> bool:
+    async def acquire(self, name: str, ttl: int = 30, timeout: Optional[float] = None) -> Optional[int]:
         """
         락을 획득합니다.
         
@@ -17,7 +46,7 @@ class DistributedLock(ABC):
             timeout: 락 획득 대기 시간 (None이면 즉시 반환)
             
         Returns:
-            bool: 락 획득 성공 여부
+            Optional[int]: 획득 성공 시 단조 증가하는 fencing token, 실패 시 None
         """
         pass
     
@@ -62,7 +91,14 @@ class DistributedLock(ABC):
         pass
     
     @asynccontextmanager
-    async def lock(self, name: str, ttl: int = 30, timeout: Optional[float] = None) -> AsyncIterator[bool]:
+    async def lock(
+        self,
+        name: str,
+        ttl: int = 30,
+        timeout: Optional[float] = None,
+        auto_renew: bool = False,
+        renew_ratio: float = 1 / 3,
+    ) -> AsyncIterator[LockLease]:
         """
         컨텍스트 매니저로 락을 사용합니다.
         
@@ -70,13 +106,54 @@ class DistributedLock(ABC):
             name: 락의 이름
             ttl: 락의 생존 시간 (초 단위)
             timeout: 락 획득 대기 시간
+            auto_renew: 보유 중 백그라운드에서 TTL을 자동 연장할지 여부
+            renew_ratio: 자동 연장 주기 (ttl 대비 비율)
             
         Yields:
-            bool: 락 획득 성공 여부
+            LockLease: 락 보유 상태 (bool 평가 시 획득 성공 여부)
         """
-        acquired = await self.acquire(name, ttl, timeout)
+        fencing_token = await self.acquire(name, ttl, timeout)
+        lease = LockLease(name, fencing_token is not None, fencing_token)
+        async with self._hold(lease, ttl, auto_renew, renew_ratio, self.extend, self.release):
+            yield lease
+
+    @asynccontextmanager
+    async def _hold(
+        self,
+        lease: LockLease,
+        ttl: int,
+        auto_renew: bool,
+        renew_ratio: float,
+        extend: Callable[[str, int], Awaitable[bool]],
+        release: Callable[[str], Awaitable[bool]],
+    ) -> AsyncIterator[None]:
+        """획득한 lease를 보유하는 동안 (옵션) TTL 자동 연장, 종료 시 해제"""
+        watchdog = None
+        if lease.acquired and auto_renew:
+            watchdog = asyncio.create_task(self._renew(lease, extend, ttl, ttl * renew_ratio))
         try:
-            yield acquired
+            yield
         finally:
-            if acquired:
-                await self.release(name)
\ No newline at end of file
+            if watchdog:
+                watchdog.cancel()
+                try:
+                    await watchdog
+                except asyncio.CancelledError:
+                    pass
+            if lease.acquired:
+                await release(lease.name)
+
+    async def _renew(
+        self,
+        lease: LockLease,
+        extend: Callable[[str, int], Awaitable[bool]],
+        ttl: int,
+        interval: float,
+    ) -> None:
+        """interval 주기로 TTL 연장, 실패 시 lease 상실로 표시하고 종료"""
+        while True:
+            await asyncio.sleep(interval)
+            if not await extend(lease.name, ttl):
+                logger.warning(f"Lock '{lease.name}' lease lost while held")
+                lease.lost_event.set()
+                return
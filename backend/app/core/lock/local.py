@@ -0,0 +1,70 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class _Entry:
+    """락 이름 하나에 대한 로컬 asyncio.Lock과 사용자(보유자 + 대기자) 수"""
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
+class LocalLockRegistry:
+    """
+    프로세스 단위 락 이름별 asyncio.Lock 레지스트리
+
+    - 같은 프로세스의 여러 코루틴 중 한 번에 하나만 Redis 락 경합에 참여하도록 앞단에서 직렬화
+    - 보유자/대기자가 없는 이름은 즉시 정리
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, _Entry] = {}
+
+    async def acquire(self, name: str, timeout: Optional[float] = None) -> bool:
+        """
+        로컬 락 획득 (timeout 의미는 RedisLock.acquire와 동일)
+        - timeout=None: 이미 잠겨 있으면 즉시 실패
+          timeout==0  : 무제한 대기
+          timeout>0   : 해당 시간까지만 대기
+        """
+        entry = self._entries.setdefault(name, _Entry())
+        if timeout is None and entry.lock.locked():
+            self._cleanup(name, entry)
+            return False
+
+        entry.users += 1
+        try:
+            if timeout:
+                await asyncio.wait_for(entry.lock.acquire(), timeout=timeout)
+            else:
+                await entry.lock.acquire()
+            return True
+        except asyncio.TimeoutError:
+            entry.users -= 1
+            self._cleanup(name, entry)
+            return False
+        except asyncio.CancelledError:
+            entry.users -= 1
+            self._cleanup(name, entry)
+            raise
+
+    def release(self, name: str) -> None:
+        """로컬 락 해제"""
+        entry = self._entries.get(name)
+        if entry is None or not entry.lock.locked():
+            return
+        entry.lock.release()
+        entry.users -= 1
+        self._cleanup(name, entry)
+
+    def waiters(self, name: str) -> int:
+        """해당 이름의 로컬 대기자 수 (보유자 제외)"""
+        entry = self._entries.get(name)
+        if entry is None:
+            return 0
+        return entry.users - (1 if entry.lock.locked() else 0)
+
+    def _cleanup(self, name: str, entry: _Entry) -> None:
+        if entry.users <= 0 and not entry.lock.locked():
+            self._entries.pop(name, None)
@@ -1,39 +1,125 @@
 import uuid
+import random
 import asyncio
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, Callable, Awaitable, TypeVar
+from contextlib import AsyncExitStack
 from contextvars import ContextVar
 
 from app.core.lock.base import DistributedLock
+from app.core.lock.local import LocalLockRegistry
+from app.core.lock.scripts import ScriptCache
 from app.core.redis import get_redis_client
+from app.core.pubsub_hub import get_pubsub_hub
 from app.core.logger import get_logger
 
 logger = get_logger("redis.lock")
 
+T = TypeVar("T")
 
-_LOCK_TOKENS: ContextVar[Dict[str, str]] = ContextVar("_LOCK_TOKENS", default=None)
 
+class _TokenMap(dict):
+    """락 이름 -> 토큰 맵 (owner: 이 맵을 만든 태스크)"""
+    owner: Optional[asyncio.Task] = None
 
-def _get_token_map() -> Dict[str, str]:
-    """현재 실행 컨텍스트(태스크) 전용 토큰 맵을 가져온다."""
-    try:
-        m = _LOCK_TOKENS.get()
-        if m is None:
-            m = {}
-            _LOCK_TOKENS.set(m)
-        return m
-    except LookupError:
-        m = {}
+
+_LOCK_TOKENS: ContextVar[Optional[_TokenMap]] = ContextVar("_LOCK_TOKENS", default=None)
+
+
+def _get_token_map(for_write: bool = False) -> Dict[str, str]:
+    """
+    현재 실행 컨텍스트(태스크) 전용 토큰 맵을 가져온다.
+
+    - 자식 태스크(하트비트 등)는 부모의 맵을 그대로 조회
+    - 토큰을 새로 저장할 때(for_write) 맵이 다른 태스크 소유면 복사본을 만들어
+      같은 부모를 둔 형제 태스크끼리 토큰을 덮어쓰지 않게 함
+    """
+    m = _LOCK_TOKENS.get()
+    task = asyncio.current_task()
+    if m is None or (for_write and m.owner is not task):
+        m = _TokenMap(m or {})
+        m.owner = task
         _LOCK_TOKENS.set(m)
-        return m
+    return m
+
+
+# 해제 알림 유실(TTL 만료 등)에 대비한 재시도 대기 시간 (초)
+BACKOFF_BASE = 0.05
+BACKOFF_MAX = 2.0
+
+
+async def wait_for_release(
+    channel: str,
+    attempt: Callable[[], Awaitable[Optional[T]]],
+    timeout: Optional[float],
+) -> Optional[T]:
+    """
+    attempt()가 값을 반환할 때까지 재시도
+
+    - timeout=None이면 한 번만 시도, 0이면 무제한, 양수면 해당 시간까지
+    - 재시도 사이에는 channel의 해제 알림(Pub/Sub)을 기다리고,
+      알림이 없으면 지터가 있는 지수 백오프로 재시도
+    - 구독이 실패하거나 timeout 안에 끝나지 않으면 알림 없이 백오프 폴링만으로 재시도
+    """
+    result = await attempt()
+    if result is not None or timeout is None:
+        return result
+
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    backoff = BACKOFF_BASE
+
+    async with AsyncExitStack() as stack:
+        released: Optional[asyncio.Queue] = None
+        try:
+            # 구독 대기 시간도 호출자의 timeout 안으로 제한
+            released = await asyncio.wait_for(
+                stack.enter_async_context(get_pubsub_hub().subscribe(channel)),
+                timeout=timeout if timeout > 0 else None,
+            )
+        except Exception as e:
+            logger.warning(f"Subscribe to '{channel}' failed, falling back to polling: {e!r}")
+
+        # 구독 후 재시도해야 구독 직전에 발생한 해제를 놓치지 않음
+        while True:
+            result = await attempt()
+            if result is not None:
+                return result
+
+            wait = random.uniform(backoff / 2, backoff)
+            if timeout > 0:
+                elapsed = loop.time() - start_time
+                if elapsed >= timeout:
+                    logger.debug(f"Acquisition on '{channel}' timed out after {elapsed:.2f}s")
+                    return None
+                wait = min(wait, timeout - elapsed)
+
+            if released is None:
+                await asyncio.sleep(wait)
+                backoff = min(backoff * 2, BACKOFF_MAX)
+                continue
+            try:
+                await asyncio.wait_for(released.get(), timeout=wait)
+            except asyncio.TimeoutError:
+                backoff = min(backoff * 2, BACKOFF_MAX)
 
 
 class RedisLock(DistributedLock):
     """Redis를 사용한 분산 락 구현체"""
 
-    # 락 소유자만 해제
+    # 락 획득 + 단조 증가 fencing token 발급 (카운터는 만료시키지 않음, 다시 1부터 시작하면 단조성이 깨짐)
+    ACQUIRE_SCRIPT = """
+    if redis.call("set", KEYS[1], ARGV[1], "NX", "EX", ARGV[2]) then
+        return redis.call("incr", KEYS[2])
+    end
+    return false
+    """
+
+    # 락 소유자만 해제 + 대기자에게 해제 알림 발행
     RELEASE_SCRIPT = """
     if redis.call("get", KEYS[1]) == ARGV[1] then
-        return redis.call("del", KEYS[1])
+        redis.call("del", KEYS[1])
+        redis.call("publish", ARGV[2], "1")
+        return 1
     else
         return 0
     end
@@ -48,70 +134,143 @@ class RedisLock(DistributedLock):
     end
     """
 
-    def __init__(self) -> None:
+    # 여러 락 일괄 해제 (ARGV: 토큰 N개, 채널 N개)
+    RELEASE_MANY_SCRIPT = """
+    local n = #KEYS
+    local result = {}
+    for i = 1, n do
+        if redis.call("get", KEYS[i]) == ARGV[i] then
+            redis.call("del", KEYS[i])
+            redis.call("publish", ARGV[n + i], "1")
+            result[i] = 1
+        else
+            result[i] = 0
+        end
+    end
+    return result
+    """
+
+    # 여러 락 일괄 TTL 연장 (ARGV: ttl, 토큰 N개)
+    EXTEND_MANY_SCRIPT = """
+    local result = {}
+    for i = 1, #KEYS do
+        if redis.call("get", KEYS[i]) == ARGV[i + 1] then
+            result[i] = redis.call("expire", KEYS[i], ARGV[1])
+        else
+            result[i] = 0
+        end
+    end
+    return result
+    """
+
+    def __init__(self, coalesce_local: bool = True) -> None:
         self._lock_prefix = "lock:"
+        self._channel_prefix = "lock:released:"
+        # 같은 프로세스 내 경합은 로컬 락으로 먼저 직렬화 (Redis 왕복 감소)
+        self._local = LocalLockRegistry() if coalesce_local else None
+        # Lua 스크립트는 한 번 등록 후 EVALSHA로 호출
+        self._scripts = ScriptCache()
 
-    def _get_lock_key(self, name: str) -> str:
+    def lock_key(self, name: str) -> str:
+        """락 이름에 해당하는 Redis 키 (다른 Lua 스크립트에서 락 보유 여부를 볼 때 사용)"""
         return f"{self._lock_prefix}{name}"
 
-    async def acquire(self, name: str, ttl: int = 30, timeout: Optional[float] = None) -> bool:
+    def _get_channel(self, name: str) -> str:
+        return f"{self._channel_prefix}{name}"
+
+    def _get_fence_key(self, name: str) -> str:
+        return f"{self._lock_prefix}{name}:fence"
+
+    def _script(self, client, source: str):
+        return self._scripts.get(client, source)
+
+    async def load_scripts(self) -> None:
+        """앱 시작 시 Lua 스크립트를 미리 SCRIPT LOAD"""
+        client = await get_redis_client()
+        await self._scripts.load(client, (
+            self.ACQUIRE_SCRIPT,
+            self.RELEASE_SCRIPT,
+            self.EXTEND_SCRIPT,
+            self.RELEASE_MANY_SCRIPT,
+            self.EXTEND_MANY_SCRIPT,
+        ))
+
+    async def _try_acquire(self, client, name: str, token: str, ttl: int) -> Optional[int]:
+        """SET NX + fencing token 발급을 한 번 시도, 성공 시 현재 태스크 토큰 맵에 저장"""
+        fence = await self._script(client, self.ACQUIRE_SCRIPT)(
+            keys=[self.lock_key(name), self._get_fence_key(name)],
+            args=[token, ttl]
+        )
+        if not fence:
+            return None
+        token_map = _get_token_map(for_write=True)
+        if name in token_map:
+            logger.warning(f"Overwriting existing token for lock '{name}' in current task")
+        token_map[name] = token
+        logger.debug(f"Lock '{name}' acquired (ttl={ttl}s, fence={fence})")
+        return fence
+
+    async def acquire(self, name: str, ttl: int = 30, timeout: Optional[float] = None) -> Optional[int]:
         """
         Redis 락 획득
-        - 성공 시, 현재 태스크의 토큰 맵에 name->token 저장
+        - 성공 시, 현재 태스크의 토큰 맵에 name->token 저장 후 fencing token 반환 (실패 시 None)
         - timeout=None: 즉시 실패 반환
           timeout==0  : 무제한 대기
-          timeout>0   : 해당 시간까지만 polling
+          timeout>0   : 해당 시간까지만 대기
+        - 대기 중에는 해제 알림(Pub/Sub)을 기다리고, 알림이 없으면 지터가 있는 지수 백오프로 재시도
+        - 같은 프로세스의 코루틴끼리는 로컬 락에서 먼저 대기하므로 Redis 경합에는 하나만 참여
         """
-        client = await get_redis_client()
-        lock_key = self._get_lock_key(name)
-
         loop = asyncio.get_running_loop()
         start_time = loop.time()
+
+        if self._local and not await self._local.acquire(name, timeout):
+            return None
+
+        fence = None
+        try:
+            if timeout:
+                # 로컬 대기에 쓴 시간을 제외, 남은 시간이 없으면 한 번만 시도
+                remaining = timeout - (loop.time() - start_time)
+                timeout = remaining if remaining > 0 else None
+            fence = await self._acquire_redis(name, ttl, timeout)
+            return fence
+        finally:
+            if self._local and fence is None:
+                self._local.release(name)
+
+    async def _acquire_redis(self, name: str, ttl: int, timeout: Optional[float]) -> Optional[int]:
+        client = await get_redis_client()
         token = str(uuid.uuid4())
 
-        while True:
-            try:
-                acquired = await client.set(lock_key, token, nx=True, ex=ttl)
-                if acquired:
-                    token_map = _get_token_map()
-                    if name in token_map:
-                        logger.warning(f"Overwriting existing token for lock '{name}' in current task")
-                    token_map[name] = token
-                    logger.debug(f"Lock '{name}' acquired (ttl={ttl}s)")
-                    return True
-
-                if timeout is None:
-                    return False
-                elif timeout == 0:
-                    await asyncio.sleep(0.1)
-                else:
-                    elapsed = loop.time() - start_time
-                    if elapsed >= timeout:
-                        logger.debug(f"Lock '{name}' acquisition timed out after {elapsed:.2f}s")
-                        return False
-                    await asyncio.sleep(min(0.1, timeout - elapsed))
-
-            except Exception as e:
-                logger.error(f"Error acquiring lock '{name}': {e}")
-                return False
+        try:
+            return await wait_for_release(
+                self._get_channel(name),
+                lambda: self._try_acquire(client, name, token, ttl),
+                timeout,
+            )
+        except Exception as e:
+            logger.error(f"Error acquiring lock '{name}': {e}")
+            return None
 
     async def release(self, name: str) -> bool:
         """
         Redis 락 해제
-        - 현재 태스크의 토큰 맵에서 token을 찾아 Lua로 소유자 검증 후 삭제
+        - 현재 태스크의 토큰 맵에서 token을 꺼내 Lua로 소유자 검증 후 삭제
+        - 해제 시도 후 토큰과 로컬 락은 결과와 관계없이 반납 (실패 시 Redis 키는 TTL로 만료)
         """
         client = await get_redis_client()
-        lock_key = self._get_lock_key(name)
+        lock_key = self.lock_key(name)
 
-        token = _get_token_map().get(name)
+        token = _get_token_map().pop(name, None)
         if not token:
             logger.warning(f"No token found for lock '{name}' in current task")
             return False
 
         try:
-            result = await client.eval(self.RELEASE_SCRIPT, 1, lock_key, token)
+            result = await self._script(client, self.RELEASE_SCRIPT)(
+                keys=[lock_key], args=[token, self._get_channel(name)]
+            )
             if result:
-                _get_token_map().pop(name, None)
                 logger.debug(f"Lock '{name}' released")
                 return True
             else:
@@ -120,6 +279,9 @@ class RedisLock(DistributedLock):
         except Exception as e:
             logger.error(f"Error releasing lock '{name}': {e}")
             return False
+        finally:
+            if self._local:
+                self._local.release(name)
 
     async def extend(self, name: str, ttl: int) -> bool:
         """
@@ -127,7 +289,7 @@ class RedisLock(DistributedLock):
         - 현재 태스크 보유 토큰으로만 연장 가능
         """
         client = await get_redis_client()
-        lock_key = self._get_lock_key(name)
+        lock_key = self.lock_key(name)
 
         token = _get_token_map().get(name)
         if not token:
@@ -135,7 +297,9 @@ class RedisLock(DistributedLock):
             return False
 
         try:
-            result = await client.eval(self.EXTEND_SCRIPT, 1, lock_key, token, ttl)
+            result = await self._script(client, self.EXTEND_SCRIPT)(
+                keys=[lock_key], args=[token, ttl]
+            )
             if result:
                 logger.debug(f"Lock '{name}' TTL extended by {ttl}s")
                 return True
@@ -146,10 +310,73 @@ class RedisLock(DistributedLock):
             logger.error(f"Error extending lock '{name}': {e}")
             return False
 
+    async def release_many(self, names: Iterable[str]) -> Dict[str, bool]:
+        """
+        현재 태스크가 보유한 여러 락을 한 번의 왕복으로 해제
+        - 토큰이 없는 이름은 False
+        """
+        client = await get_redis_client()
+        token_map = _get_token_map()
+        results: Dict[str, bool] = {}
+        owned: Dict[str, str] = {}
+        for name in names:
+            token = token_map.pop(name, None)
+            if token:
+                owned[name] = token
+            else:
+                results[name] = False
+        if not owned:
+            return results
+
+        try:
+            released = await self._script(client, self.RELEASE_MANY_SCRIPT)(
+                keys=[self.lock_key(name) for name in owned],
+                args=[*owned.values(), *(self._get_channel(name) for name in owned)]
+            )
+            results.update({name: bool(r) for name, r in zip(owned, released)})
+            logger.debug(f"Locks released in batch: {results}")
+        except Exception as e:
+            logger.error(f"Error releasing locks {list(owned)}: {e}")
+            results.update({name: False for name in owned})
+        finally:
+            if self._local:
+                for name in owned:
+                    self._local.release(name)
+        return results
+
+    async def extend_many(self, names: Iterable[str], ttl: int) -> Dict[str, bool]:
+        """
+        현재 태스크가 보유한 여러 락의 TTL을 한 번의 왕복으로 연장
+        - 토큰이 없는 이름은 False
+        """
+        client = await get_redis_client()
+        token_map = _get_token_map()
+        results: Dict[str, bool] = {}
+        owned: Dict[str, str] = {}
+        for name in names:
+            token = token_map.get(name)
+            if token:
+                owned[name] = token
+            else:
+                results[name] = False
+        if not owned:
+            return results
+
+        try:
+            extended = await self._script(client, self.EXTEND_MANY_SCRIPT)(
+                keys=[self.lock_key(name) for name in owned],
+                args=[ttl, *owned.values()]
+            )
+            results.update({name: bool(r) for name, r in zip(owned, extended)})
+        except Exception as e:
+            logger.error(f"Error extending locks {list(owned)}: {e}")
+            results.update({name: False for name in owned})
+        return results
+
     async def is_locked(self, name: str) -> bool:
         """락 존재 여부"""
         client = await get_redis_client()
-        lock_key = self._get_lock_key(name)
+        lock_key = self.lock_key(name)
         try:
             return bool(await client.exists(lock_key))
         except Exception as e:
@@ -162,7 +389,7 @@ class RedisLock(DistributedLock):
         - Redis의 값(value)과 현재 태스크의 token 일치 여부 검사
         """
         client = await get_redis_client()
-        lock_key = self._get_lock_key(name)
+        lock_key = self.lock_key(name)
 
         token = _get_token_map().get(name)
         if not token:
@@ -0,0 +1,369 @@
+import uuid
+import asyncio
+from typing import AsyncIterator, List, Optional
+from contextlib import asynccontextmanager
+
+from app.core.lock.base import DistributedLock, LockLease
+from app.core.lock.local import LocalLockRegistry
+from app.core.lock.redis_lock import _get_token_map, wait_for_release
+from app.core.lock.scripts import ScriptCache
+from app.core.redis import get_redis_client
+from app.core.logger import get_logger
+
+logger = get_logger("redis.rw_lock")
+
+
+class RedisReadWriteLock(DistributedLock):
+    """
+    Redis를 사용한 읽기/쓰기 분산 락 구현체
+
+    - 쓰기 락(acquire/release/extend, lock): 배타적, fencing token 발급
+    - 읽기 락(acquire_read/release_read/extend_read, read_lock): 쓰기 락이 없으면 여러 reader가 동시에 보유
+    - reader는 만료 시각을 score로 가진 sorted set 멤버로 관리 (비정상 종료 시 자동 만료)
+    - 쓰기 대기자가 있으면 새 reader 진입을 막아 writer 기아를 방지
+    - 같은 프로세스 안에서는 로컬 락으로 먼저 줄을 세워 Redis 경합에는 하나만 참여
+      (writer는 보유 기간 동안, 대기가 필요한 reader는 대기하는 동안만)
+    - 같은 태스크에서 같은 이름의 읽기 락을 중첩해 잡을 수 있음 (토큰을 스택으로 보관, 나중에 잡은 것부터 해제)
+    """
+
+    # KEYS: writer, readers, intent, fence / ARGV: token, ttl(ms), intent ttl(ms)
+    # fence 카운터는 만료시키지 않음 (다시 1부터 시작하면 단조성이 깨짐)
+    ACQUIRE_WRITE_SCRIPT = """
+    local t = redis.call("TIME")
+    local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+    redis.call("ZREMRANGEBYSCORE", KEYS[2], "-inf", now)
+    if redis.call("EXISTS", KEYS[1]) == 0 and redis.call("ZCARD", KEYS[2]) == 0 then
+        redis.call("SET", KEYS[1], ARGV[1], "PX", ARGV[2])
+        redis.call("DEL", KEYS[3])
+        return redis.call("INCR", KEYS[4])
+    end
+    if tonumber(ARGV[3]) > 0 then
+        redis.call("SET", KEYS[3], "1", "PX", ARGV[3])
+    end
+    return false
+    """
+
+    # KEYS: writer, readers, intent / ARGV: token, ttl(ms)
+    ACQUIRE_READ_SCRIPT = """
+    if redis.call("EXISTS", KEYS[1]) == 1 or redis.call("EXISTS", KEYS[3]) == 1 then
+        return 0
+    end
+    local t = redis.call("TIME")
+    local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+    redis.call("ZREMRANGEBYSCORE", KEYS[2], "-inf", now)
+    redis.call("ZADD", KEYS[2], now + tonumber(ARGV[2]), ARGV[1])
+    if redis.call("PTTL", KEYS[2]) < tonumber(ARGV[2]) then
+        redis.call("PEXPIRE", KEYS[2], ARGV[2])
+    end
+    return 1
+    """
+
+    # KEYS: writer / ARGV: token, channel
+    RELEASE_WRITE_SCRIPT = """
+    if redis.call("GET", KEYS[1]) == ARGV[1] then
+        redis.call("DEL", KEYS[1])
+        redis.call("PUBLISH", ARGV[2], "1")
+        return 1
+    end
+    return 0
+    """
+
+    # KEYS: readers / ARGV: token, channel (마지막 reader가 나가면 writer에게 알림)
+    RELEASE_READ_SCRIPT = """
+    local removed = redis.call("ZREM", KEYS[1], ARGV[1])
+    local t = redis.call("TIME")
+    redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", tonumber(t[1]) * 1000)
+    if removed == 1 and redis.call("ZCARD", KEYS[1]) == 0 then
+        redis.call("PUBLISH", ARGV[2], "1")
+    end
+    return removed
+    """
+
+    # KEYS: writer / ARGV: token, ttl(ms)
+    EXTEND_WRITE_SCRIPT = """
+    if redis.call("GET", KEYS[1]) == ARGV[1] then
+        return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+    end
+    return 0
+    """
+
+    # KEYS: readers / ARGV: token, ttl(ms)
+    EXTEND_READ_SCRIPT = """
+    if not redis.call("ZSCORE", KEYS[1], ARGV[1]) then
+        return 0
+    end
+    local t = redis.call("TIME")
+    local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+    redis.call("ZADD", KEYS[1], now + tonumber(ARGV[2]), ARGV[1])
+    if redis.call("PTTL", KEYS[1]) < tonumber(ARGV[2]) then
+        redis.call("PEXPIRE", KEYS[1], ARGV[2])
+    end
+    return 1
+    """
+
+    # 쓰기 대기 의사 표시 유지 시간 (ms), 대기 중 재시도마다 갱신
+    WRITE_INTENT_TTL = 3000
+
+    def __init__(self, coalesce_local: bool = True) -> None:
+        self._prefix = "rwlock:"
+        self._scripts = ScriptCache()
+        # 같은 프로세스 내 경합은 로컬 락으로 먼저 직렬화 (Redis 왕복 감소)
+        self._local = LocalLockRegistry() if coalesce_local else None
+
+    def _keys(self, name: str) -> dict:
+        base = f"{self._prefix}{name}"
+        return {
+            "writer": f"{base}:writer",
+            "readers": f"{base}:readers",
+            "intent": f"{base}:intent",
+            "fence": f"{base}:fence",
+        }
+
+    def _get_channel(self, name: str) -> str:
+        return f"{self._prefix}released:{name}"
+
+    @staticmethod
+    def _write_token_name(name: str) -> str:
+        return f"rw:{name}:write"
+
+    @staticmethod
+    def _read_token_name(name: str) -> str:
+        return f"rw:{name}:read"
+
+    @staticmethod
+    def _read_wait_name(name: str) -> str:
+        """읽기 대기용 로컬 락 이름 (쓰기 락의 로컬 락과 분리)"""
+        return f"{name}:read-wait"
+
+    def _read_tokens(self, name: str) -> List[str]:
+        """현재 태스크가 보유한 읽기 토큰 스택 (중첩 획득 순서)"""
+        return _get_token_map().get(self._read_token_name(name)) or []
+
+    async def load_scripts(self) -> None:
+        """앱 시작 시 Lua 스크립트를 미리 SCRIPT LOAD"""
+        client = await get_redis_client()
+        await self._scripts.load(client, (
+            self.ACQUIRE_WRITE_SCRIPT,
+            self.ACQUIRE_READ_SCRIPT,
+            self.RELEASE_WRITE_SCRIPT,
+            self.RELEASE_READ_SCRIPT,
+            self.EXTEND_WRITE_SCRIPT,
+            self.EXTEND_READ_SCRIPT,
+        ))
+
+    # ---------- 쓰기 락 ----------
+
+    async def acquire(self, name: str, ttl: int = 30, timeout: Optional[float] = None) -> Optional[int]:
+        """
+        쓰기 락 획득 (reader와 writer 모두 없을 때만)
+        - 성공 시 fencing token 반환, 실패 시 None
+        - 대기 중에는 새 reader 진입을 막음
+        - 같은 프로세스의 writer끼리는 로컬 락에서 먼저 대기 (로컬 락은 release까지 보유)
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+
+        if self._local and not await self._local.acquire(name, timeout):
+            return None
+
+        fence = None
+        try:
+            fence = await self._acquire_write(name, ttl, self._remaining(timeout, start_time))
+            return fence
+        finally:
+            if self._local and fence is None:
+                self._local.release(name)
+
+    @staticmethod
+    def _remaining(timeout: Optional[float], start_time: float) -> Optional[float]:
+        """로컬 대기에 쓴 시간을 뺀 Redis 대기 timeout (남은 시간이 없으면 한 번만 시도)"""
+        if not timeout:
+            return timeout
+        remaining = timeout - (asyncio.get_running_loop().time() - start_time)
+        return remaining if remaining > 0 else None
+
+    async def _acquire_write(self, name: str, ttl: int, timeout: Optional[float]) -> Optional[int]:
+        client = await get_redis_client()
+        keys = self._keys(name)
+        token = str(uuid.uuid4())
+        intent_ttl = self.WRITE_INTENT_TTL if timeout is not None else 0
+        script = self._scripts.get(client, self.ACQUIRE_WRITE_SCRIPT)
+
+        async def attempt() -> Optional[int]:
+            return await script(
+                keys=[keys["writer"], keys["readers"], keys["intent"], keys["fence"]],
+                args=[token, ttl * 1000, intent_ttl]
+            )
+
+        try:
+            fence = await wait_for_release(self._get_channel(name), attempt, timeout)
+        except Exception as e:
+            logger.error(f"Error acquiring write lock '{name}': {e}")
+            return None
+
+        if fence is not None:
+            _get_token_map(for_write=True)[self._write_token_name(name)] = token
+            logger.debug(f"Write lock '{name}' acquired (ttl={ttl}s, fence={fence})")
+        return fence
+
+    async def release(self, name: str) -> bool:
+        """쓰기 락 해제 (소유자 검증 후 삭제, 대기자에게 알림)"""
+        token = _get_token_map().pop(self._write_token_name(name), None)
+        if not token:
+            logger.warning(f"No write token found for lock '{name}' in current task")
+            return False
+
+        client = await get_redis_client()
+        try:
+            result = await self._scripts.get(client, self.RELEASE_WRITE_SCRIPT)(
+                keys=[self._keys(name)["writer"]], args=[token, self._get_channel(name)]
+            )
+            if not result:
+                logger.warning(f"Failed to release write lock '{name}' - not owned by current task/token")
+            return bool(result)
+        except Exception as e:
+            logger.error(f"Error releasing write lock '{name}': {e}")
+            return False
+        finally:
+            if self._local:
+                self._local.release(name)
+
+    async def extend(self, name: str, ttl: int) -> bool:
+        """쓰기 락 TTL 연장"""
+        token = _get_token_map().get(self._write_token_name(name))
+        if not token:
+            logger.warning(f"No write token found for lock '{name}' in current task")
+            return False
+
+        client = await get_redis_client()
+        try:
+            result = await self._scripts.get(client, self.EXTEND_WRITE_SCRIPT)(
+                keys=[self._keys(name)["writer"]], args=[token, ttl * 1000]
+            )
+            return bool(result)
+        except Exception as e:
+            logger.error(f"Error extending write lock '{name}': {e}")
+            return False
+
+    async def is_locked(self, name: str) -> bool:
+        """쓰기 락 또는 읽기 락이 하나라도 있는지 여부"""
+        client = await get_redis_client()
+        keys = self._keys(name)
+        try:
+            return bool(await client.exists(keys["writer"], keys["readers"]))
+        except Exception as e:
+            logger.error(f"Error checking rw lock '{name}': {e}")
+            return False
+
+    # ---------- 읽기 락 ----------
+
+    async def acquire_read(self, name: str, ttl: int = 30, timeout: Optional[float] = None) -> bool:
+        """
+        읽기 락 획득 (쓰기 락 보유자/대기자가 없으면 즉시 공유)
+        - timeout 의미는 acquire와 동일
+        - 바로 얻지 못하면 같은 프로세스의 대기 reader 중 하나만 Redis에서 기다리고,
+          그 reader가 들어가면 다음 reader가 이어서 시도 (로컬 락은 대기하는 동안만 보유)
+        """
+        if await self._acquire_read(name, ttl, None):
+            return True
+        if timeout is None:
+            return False
+        if not self._local:
+            return await self._acquire_read(name, ttl, timeout)
+
+        wait_name = self._read_wait_name(name)
+        start_time = asyncio.get_running_loop().time()
+        if not await self._local.acquire(wait_name, timeout):
+            return False
+        try:
+            return await self._acquire_read(name, ttl, self._remaining(timeout, start_time))
+        finally:
+            self._local.release(wait_name)
+
+    async def _acquire_read(self, name: str, ttl: int, timeout: Optional[float]) -> bool:
+        client = await get_redis_client()
+        keys = self._keys(name)
+        token = str(uuid.uuid4())
+        script = self._scripts.get(client, self.ACQUIRE_READ_SCRIPT)
+
+        async def attempt() -> Optional[bool]:
+            result = await script(
+                keys=[keys["writer"], keys["readers"], keys["intent"]],
+                args=[token, ttl * 1000]
+            )
+            return True if result else None
+
+        try:
+            acquired = await wait_for_release(self._get_channel(name), attempt, timeout)
+        except Exception as e:
+            logger.error(f"Error acquiring read lock '{name}': {e}")
+            return False
+
+        if acquired:
+            # 중첩 획득이면 스택에 쌓음 (다른 태스크와 공유될 수 있는 리스트는 수정하지 않고 교체)
+            token_map = _get_token_map(for_write=True)
+            token_map[self._read_token_name(name)] = [*self._read_tokens(name), token]
+            logger.debug(f"Read lock '{name}' acquired (ttl={ttl}s)")
+        return bool(acquired)
+
+    async def release_read(self, name: str) -> bool:
+        """읽기 락 해제 (중첩 보유 중이면 가장 나중에 잡은 것부터, 마지막 reader면 대기 중인 writer에게 알림)"""
+        token_map = _get_token_map()
+        key = self._read_token_name(name)
+        tokens = token_map.get(key)
+        if not tokens:
+            logger.warning(f"No read token found for lock '{name}' in current task")
+            return False
+        token = tokens[-1]
+        if len(tokens) > 1:
+            token_map[key] = tokens[:-1]
+        else:
+            del token_map[key]
+
+        client = await get_redis_client()
+        try:
+            result = await self._scripts.get(client, self.RELEASE_READ_SCRIPT)(
+                keys=[self._keys(name)["readers"]], args=[token, self._get_channel(name)]
+            )
+            return bool(result)
+        except Exception as e:
+            logger.error(f"Error releasing read lock '{name}': {e}")
+            return False
+
+    async def extend_read(self, name: str, ttl: int) -> bool:
+        """읽기 락 TTL 연장 (현재 태스크가 중첩 보유한 읽기 락 모두)"""
+        tokens = self._read_tokens(name)
+        if not tokens:
+            logger.warning(f"No read token found for lock '{name}' in current task")
+            return False
+
+        client = await get_redis_client()
+        script = self._scripts.get(client, self.EXTEND_READ_SCRIPT)
+        try:
+            results = [
+                await script(keys=[self._keys(name)["readers"]], args=[token, ttl * 1000])
+                for token in tokens
+            ]
+            return all(results)
+        except Exception as e:
+            logger.error(f"Error extending read lock '{name}': {e}")
+            return False
+
+    @asynccontextmanager
+    async def read_lock(
+        self,
+        name: str,
+        ttl: int = 30,
+        timeout: Optional[float] = None,
+        auto_renew: bool = False,
+        renew_ratio: float = 1 / 3,
+    ) -> AsyncIterator[LockLease]:
+        """
+        읽기 락 컨텍스트 매니저 (쓰기 락은 lock() 사용)
+
+        Yields:
+            LockLease: 락 보유 상태 (bool 평가 시 획득 성공 여부)
+        """
+        lease = LockLease(name, await self.acquire_read(name, ttl, timeout))
+        async with self._hold(lease, ttl, auto_renew, renew_ratio, self.extend_read, self.release_read):
+            yield lease
@@ -0,0 +1,172 @@
+import uuid
+from typing import Dict, Optional
+
+from app.core.lock.base import DistributedLock
+from app.core.lock.redis_lock import _get_token_map, wait_for_release
+from app.core.lock.scripts import ScriptCache
+from app.core.redis import get_redis_client
+from app.core.logger import get_logger
+
+logger = get_logger("redis.semaphore")
+
+
+class RedisSemaphore(DistributedLock):
+    """
+    Redis sorted set 기반 분산 카운팅 세마포어
+
+    - 이름별로 클러스터 전체에서 최대 limit개의 lease만 동시에 보유
+    - lease는 만료 시각을 score로 가진 멤버이므로 보유자가 비정상 종료해도 TTL 후 자동 반환
+    - lock(..., auto_renew=True)로 장시간 호출 중 lease 연장
+    """
+
+    # KEYS: holders, fence / ARGV: token, ttl(ms), limit
+    # fence 카운터는 만료시키지 않음 (다시 1부터 시작하면 단조성이 깨짐)
+    ACQUIRE_SCRIPT = """
+    local t = redis.call("TIME")
+    local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+    redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now)
+    if redis.call("ZCARD", KEYS[1]) >= tonumber(ARGV[3]) then
+        return false
+    end
+    redis.call("ZADD", KEYS[1], now + tonumber(ARGV[2]), ARGV[1])
+    if redis.call("PTTL", KEYS[1]) < tonumber(ARGV[2]) then
+        redis.call("PEXPIRE", KEYS[1], ARGV[2])
+    end
+    return redis.call("INCR", KEYS[2])
+    """
+
+    # KEYS: holders / ARGV: token, channel
+    RELEASE_SCRIPT = """
+    local removed = redis.call("ZREM", KEYS[1], ARGV[1])
+    if removed == 1 then
+        redis.call("PUBLISH", ARGV[2], "1")
+    end
+    return removed
+    """
+
+    # KEYS: holders / ARGV: token, ttl(ms)
+    EXTEND_SCRIPT = """
+    if not redis.call("ZSCORE", KEYS[1], ARGV[1]) then
+        return 0
+    end
+    local t = redis.call("TIME")
+    local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+    redis.call("ZADD", KEYS[1], now + tonumber(ARGV[2]), ARGV[1])
+    if redis.call("PTTL", KEYS[1]) < tonumber(ARGV[2]) then
+        redis.call("PEXPIRE", KEYS[1], ARGV[2])
+    end
+    return 1
+    """
+
+    def __init__(self, default_limit: int = 10) -> None:
+        self._prefix = "semaphore:"
+        self._scripts = ScriptCache()
+        self.default_limit = default_limit
+        self._limits: Dict[str, int] = {}
+
+    def set_limit(self, name: str, limit: int) -> None:
+        """이름별 동시 보유 한도 설정 (모든 워커에서 같은 값을 사용해야 함)"""
+        self._limits[name] = limit
+
+    def get_limit(self, name: str) -> int:
+        return self._limits.get(name, self.default_limit)
+
+    def _get_key(self, name: str) -> str:
+        return f"{self._prefix}{name}"
+
+    def _get_fence_key(self, name: str) -> str:
+        return f"{self._prefix}{name}:fence"
+
+    def _get_channel(self, name: str) -> str:
+        return f"{self._prefix}released:{name}"
+
+    @staticmethod
+    def _token_name(name: str) -> str:
+        return f"semaphore:{name}"
+
+    async def load_scripts(self) -> None:
+        """앱 시작 시 Lua 스크립트를 미리 SCRIPT LOAD"""
+        client = await get_redis_client()
+        await self._scripts.load(client, (self.ACQUIRE_SCRIPT, self.RELEASE_SCRIPT, self.EXTEND_SCRIPT))
+
+    async def acquire(self, name: str, ttl: int = 30, timeout: Optional[float] = None) -> Optional[int]:
+        """
+        세마포어 lease 획득
+        - 성공 시 획득 순번(fencing token) 반환, 실패 시 None
+        - timeout 의미는 RedisLock.acquire와 동일 (대기 중에는 반환 알림으로 재시도)
+        """
+        client = await get_redis_client()
+        token = str(uuid.uuid4())
+        limit = self.get_limit(name)
+        script = self._scripts.get(client, self.ACQUIRE_SCRIPT)
+
+        async def attempt() -> Optional[int]:
+            return await script(
+                keys=[self._get_key(name), self._get_fence_key(name)],
+                args=[token, ttl * 1000, limit]
+            )
+
+        try:
+            fence = await wait_for_release(self._get_channel(name), attempt, timeout)
+        except Exception as e:
+            logger.error(f"Error acquiring semaphore '{name}': {e}")
+            return None
+
+        if fence is not None:
+            token_map = _get_token_map(for_write=True)
+            if self._token_name(name) in token_map:
+                logger.warning(f"Overwriting existing token for semaphore '{name}' in current task")
+            token_map[self._token_name(name)] = token
+            logger.debug(f"Semaphore '{name}' acquired (limit={limit}, ttl={ttl}s)")
+        return fence
+
+    async def release(self, name: str) -> bool:
+        """세마포어 lease 반환 (대기자에게 알림)"""
+        token = _get_token_map().pop(self._token_name(name), None)
+        if not token:
+            logger.warning(f"No token found for semaphore '{name}' in current task")
+            return False
+
+        client = await get_redis_client()
+        try:
+            result = await self._scripts.get(client, self.RELEASE_SCRIPT)(
+                keys=[self._get_key(name)], args=[token, self._get_channel(name)]
+            )
+            if not result:
+                logger.warning(f"Failed to release semaphore '{name}' - lease expired")
+            return bool(result)
+        except Exception as e:
+            logger.error(f"Error releasing semaphore '{name}': {e}")
+            return False
+
+    async def extend(self, name: str, ttl: int) -> bool:
+        """세마포어 lease TTL 연장"""
+        token = _get_token_map().get(self._token_name(name))
+        if not token:
+            logger.warning(f"No token found for semaphore '{name}' in current task")
+            return False
+
+        client = await get_redis_client()
+        try:
+            result = await self._scripts.get(client, self.EXTEND_SCRIPT)(
+                keys=[self._get_key(name)], args=[token, ttl * 1000]
+            )
+            return bool(result)
+        except Exception as e:
+            logger.error(f"Error extending semaphore '{name}': {e}")
+            return False
+
+    async def is_locked(self, name: str) -> bool:
+        """한도까지 모두 사용 중인지 여부"""
+        return await self.count(name) >= self.get_limit(name)
+
+    async def count(self, name: str) -> int:
+        """현재 유효한 lease 수"""
+        client = await get_redis_client()
+        try:
+            seconds, micros = await client.time()
+            now = seconds * 1000 + micros // 1000
+            return await client.zcount(self._get_key(name), f"({now}", "+inf")
+        except Exception as e:
+            logger.error(f"Error counting semaphore '{name}': {e}")
+            return 0
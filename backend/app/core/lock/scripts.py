@@ -0,0 +1,31 @@
+from typing import Dict, Iterable
+
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+
+
+class ScriptCache:
+    """
+    Redis 클라이언트별 Lua 스크립트 등록 캐시
+
+    - register_script로 한 번만 등록하고 EVALSHA로 호출 (NOSCRIPT 시 redis-py가 자동 재등록)
+    - Redis 클라이언트가 바뀌면(재연결) 다시 등록
+    """
+
+    def __init__(self) -> None:
+        self._scripts: Dict[str, AsyncScript] = {}
+        self._client = None
+
+    def get(self, client: Redis, source: str) -> AsyncScript:
+        if client is not self._client:
+            self._scripts = {}
+            self._client = client
+        script = self._scripts.get(source)
+        if script is None:
+            script = self._scripts[source] = client.register_script(source)
+        return script
+
+    async def load(self, client: Redis, sources: Iterable[str]) -> None:
+        """SCRIPT LOAD로 미리 등록 (첫 호출의 NOSCRIPT 왕복 제거)"""
+        for source in sources:
+            await client.script_load(self.get(client, source).script)
@@ -0,0 +1,199 @@
+import asyncio
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from app.config.setting import settings
+from app.core.logger import get_logger
+from app.repository.log import LogRepository
+
+logger = get_logger("log.writer")
+
+
+class LogWriter:
+    """
+    API 호출 로그 배치 기록기
+
+    - 요청 경로에서는 bounded queue에 로그 레코드(dict)를 넣기만 함
+    - lifespan에서 시작한 백그라운드 태스크가 크기/시간 기준으로 insert_many
+    - 큐가 가득 찼을 때 정책
+        drop  : 새 로그를 즉시 버림 (응답 지연 없음)
+        block : put_timeout 동안 대기 후에도 가득 차 있으면 버림 (backpressure)
+    """
+
+    POLICY_DROP = "drop"
+    POLICY_BLOCK = "block"
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        overflow_policy: str = POLICY_DROP,
+        put_timeout: float = 0.05,
+    ) -> None:
+        if overflow_policy not in (self.POLICY_DROP, self.POLICY_BLOCK):
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.put_timeout = put_timeout
+
+        self._queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(maxsize=max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
+
+        # 카운터
+        self.enqueued_count = 0
+        self.flushed_count = 0
+        self.dropped_count = 0
+        self.failed_count = 0
+        self.invalid_count = 0
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # ---------- 생명주기 ----------
+
+    async def start(self) -> None:
+        """백그라운드 flush 태스크 시작"""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run())
+        logger.bind(
+            max_queue_size=self.max_queue_size,
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+            overflow_policy=self.overflow_policy
+        ).info("로그 배치 기록기 시작")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """flush 태스크 종료 후 남은 로그를 모두 기록"""
+        if self._task is not None:
+            self._stop_event.set()
+            try:
+                await asyncio.wait_for(self._task, timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning("로그 기록기 종료 대기 시간 초과 - 태스크 취소")
+                self._task.cancel()
+            self._task = None
+
+        # 최종 flush
+        while not self._queue.empty():
+            await self._flush(self._drain(self.batch_size))
+
+        logger.bind(**self.stats()).info("로그 배치 기록기 종료")
+
+    # ---------- 기록 ----------
+
+    async def enqueue(self, record: Dict[str, Any]) -> bool:
+        """
+        로그 레코드를 큐에 추가 (정책에 따라 버려질 수 있음)
+
+        Args:
+            record: LogRepository.create와 동일한 필드의 dict
+        """
+        record.setdefault("created_at", datetime.now(timezone.utc))
+        try:
+            self._queue.put_nowait(record)
+            self.enqueued_count += 1
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if self.overflow_policy == self.POLICY_BLOCK:
+            try:
+                await asyncio.wait_for(self._queue.put(record), timeout=self.put_timeout)
+                self.enqueued_count += 1
+                return True
+            except asyncio.TimeoutError:
+                pass
+
+        self.dropped_count += 1
+        logger.bind(called_api=record.get("called_api")).debug("로그 큐가 가득 차 로그를 버림")
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        """카운터 조회 (dropped: 큐 초과 + 저장 실패 + 잘못된 레코드, failed: 저장 실패, invalid: 잘못된 레코드)"""
+        return {
+            "queue_size": self._queue.qsize(),
+            "enqueued": self.enqueued_count,
+            "flushed": self.flushed_count,
+            "dropped": self.dropped_count,
+            "failed": self.failed_count,
+            "invalid": self.invalid_count,
+        }
+
+    # ---------- 내부 ----------
+
+    def _drain(self, limit: int) -> List[Dict[str, Any]]:
+        batch: List[Dict[str, Any]] = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _next_batch(self) -> List[Dict[str, Any]]:
+        """첫 로그가 도착한 시점부터 flush_interval 또는 batch_size까지 수집"""
+        loop = asyncio.get_running_loop()
+        try:
+            first = await asyncio.wait_for(self._queue.get(), timeout=self.flush_interval)
+        except asyncio.TimeoutError:
+            return []
+
+        batch = [first]
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            batch.extend(self._drain(self.batch_size - len(batch)))
+            if len(batch) >= self.batch_size:
+                break
+            remaining = deadline - loop.time()
+            if remaining <= 0 or self._stop_event.is_set():
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            batch = await self._next_batch()
+            if batch:
+                await self._flush(batch)
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        if not batch:
+            return
+        try:
+            saved = await LogRepository.create_many(batch)
+        except Exception as e:
+            self.failed_count += len(batch)
+            self.dropped_count += len(batch)
+            logger.bind(error=str(e), batch_size=len(batch)).error("MongoDB 로그 배치 저장 실패")
+            return
+
+        # 검증에 실패한 레코드는 배치 전체가 아니라 해당 레코드만 버려짐
+        self.flushed_count += saved
+        invalid = len(batch) - saved
+        if invalid:
+            self.invalid_count += invalid
+            self.dropped_count += invalid
+            logger.bind(invalid=invalid, batch_size=len(batch)).warning("잘못된 로그 레코드를 건너뜀")
+
+
+@lru_cache(maxsize=1)
+def get_log_writer() -> LogWriter:
+    """LogWriter 싱글톤 인스턴스를 반환합니다."""
+    return LogWriter(
+        max_queue_size=settings.LOG_WRITER_QUEUE_SIZE,
+        batch_size=settings.LOG_WRITER_BATCH_SIZE,
+        flush_interval=settings.LOG_WRITER_FLUSH_INTERVAL,
+        overflow_policy=settings.LOG_WRITER_OVERFLOW_POLICY,
+        put_timeout=settings.LOG_WRITER_PUT_TIMEOUT,
+    )
@@ -0,0 +1,212 @@
+import json
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from redis.asyncio.client import PubSub
+
+from app.core.logger import get_logger
+from app.core.redis import get_redis_pubsub_client
+
+logger = get_logger("redis.pubsub_hub")
+
+
+@dataclass
+class _Topic:
+    """채널 하나에 대한 upstream 구독과 로컬 구독자 큐 목록"""
+    pubsub: Optional[PubSub] = None
+    queues: Set[asyncio.Queue] = field(default_factory=set)
+    reader: Optional[asyncio.Task] = None
+    # 채널별 구독/해제 직렬화 (네트워크 왕복 동안 다른 채널을 막지 않도록 채널마다 따로 둠)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class PubSubHub:
+    """
+    프로세스 단위 Redis Pub/Sub 팬아웃 허브
+
+    - 채널마다 Redis 구독은 하나만 유지하고, 수신한 메시지를 로컬 구독자 큐(N개)로 복사
+    - 구독자 큐는 크기가 제한되며, 가득 차면 가장 오래된 메시지를 버림 (진행률은 최신 값이 중요)
+    - 수신이 끊기면 구독자가 남아 있는 동안 재구독 (끊긴 사이의 메시지는 각 구독자의 폴백 경로로 확인)
+    - 마지막 구독자가 떠나면 upstream 구독을 해제
+    """
+
+    # 재구독 실패 시 다음 시도까지 대기 시간 (초)
+    RESUBSCRIBE_INTERVAL = 1.0
+
+    def __init__(self, queue_size: int = 100, subscribe_timeout: float = 5.0) -> None:
+        self.queue_size = queue_size
+        self.subscribe_timeout = subscribe_timeout
+        self._topics: Dict[str, _Topic] = {}
+        self.dropped_count = 0
+        self.resubscribe_count = 0
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[asyncio.Queue]:
+        """
+        채널을 구독하고 메시지(dict)가 들어오는 큐를 반환
+
+        - 컨텍스트 진입 시점에 upstream SUBSCRIBE 확인 응답까지 받은 상태임이 보장됨
+          (subscribe_timeout 안에 확인을 받지 못하면 예외)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        await self._join(channel, queue)
+        try:
+            yield queue
+        finally:
+            await self._leave(channel, queue)
+
+    def stats(self) -> Dict[str, Any]:
+        """허브 상태 조회"""
+        return {
+            "channels": len(self._topics),
+            "subscribers": sum(len(topic.queues) for topic in self._topics.values()),
+            "dropped": self.dropped_count,
+            "resubscribes": self.resubscribe_count,
+        }
+
+    async def close(self) -> None:
+        """모든 upstream 구독 해제 (앱 종료 시 호출)"""
+        for channel, topic in list(self._topics.items()):
+            async with topic.lock:
+                await self._teardown(channel, topic)
+
+    # ---------- 내부 ----------
+
+    async def _join(self, channel: str, queue: asyncio.Queue) -> None:
+        while True:
+            topic = self._topics.get(channel)
+            if topic is None:
+                topic = self._topics[channel] = _Topic()
+            async with topic.lock:
+                if self._topics.get(channel) is not topic:
+                    # 기다리는 동안 해제된 채널 → 새로 등록
+                    continue
+                if topic.pubsub is None:
+                    try:
+                        await self._connect(channel, topic)
+                    except Exception:
+                        if not topic.queues:
+                            self._topics.pop(channel, None)
+                        raise
+                topic.queues.add(queue)
+                return
+
+    async def _leave(self, channel: str, queue: asyncio.Queue) -> None:
+        topic = self._topics.get(channel)
+        if topic is None:
+            return
+        async with topic.lock:
+            topic.queues.discard(queue)
+            if not topic.queues and self._topics.get(channel) is topic:
+                await self._teardown(channel, topic)
+
+    async def _connect(self, channel: str, topic: _Topic) -> None:
+        """upstream 구독 후 확인 응답까지 대기하고 수신 태스크 시작 (topic.lock 보유 상태에서 호출)"""
+        client = await get_redis_pubsub_client()
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(channel)
+            await self._wait_subscribed(channel, pubsub)
+        except BaseException:
+            await self._close_pubsub(channel, pubsub)
+            raise
+        topic.pubsub = pubsub
+        topic.reader = asyncio.create_task(self._read(channel, topic, pubsub))
+        logger.bind(channel=channel).debug("upstream 구독 시작")
+
+    async def _wait_subscribed(self, channel: str, pubsub: PubSub) -> None:
+        """SUBSCRIBE 확인 응답 대기 (redis-py subscribe()는 명령 전송만 하고 반환)"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.subscribe_timeout
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeoutError(f"SUBSCRIBE 확인 응답 시간 초과: {channel}")
+            message = await pubsub.get_message(timeout=remaining)
+            if message and message.get("type") == "subscribe":
+                return
+
+    async def _teardown(self, channel: str, topic: _Topic) -> None:
+        """채널 등록 해제 + 수신 태스크 종료 + upstream 구독 해제 (topic.lock 보유 상태에서 호출)"""
+        if self._topics.get(channel) is topic:
+            del self._topics[channel]
+        reader, topic.reader = topic.reader, None
+        if reader and reader is not asyncio.current_task():
+            reader.cancel()
+            try:
+                await reader
+            except (asyncio.CancelledError, Exception):
+                pass
+        pubsub, topic.pubsub = topic.pubsub, None
+        if pubsub is not None:
+            await self._close_pubsub(channel, pubsub)
+            logger.bind(channel=channel).debug("upstream 구독 해제")
+
+    async def _close_pubsub(self, channel: str, pubsub: PubSub) -> None:
+        try:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+        except Exception as e:
+            logger.bind(channel=channel, error=str(e)).warning("upstream 구독 해제 실패")
+
+    async def _read(self, channel: str, topic: _Topic, pubsub: PubSub) -> None:
+        """upstream 메시지를 모든 로컬 구독자 큐로 복사, 수신이 끊기면 재구독"""
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    data = json.loads(message["data"])
+                except (TypeError, ValueError):
+                    logger.bind(channel=channel).warning("잘못된 메시지 형식")
+                    continue
+                for queue in list(topic.queues):
+                    self._put_latest(queue, data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 재구독 전까지 구독자는 각자의 폴백 경로로 상태를 확인함
+            logger.bind(channel=channel, error=str(e)).error("upstream 구독 수신 중 오류 - 재구독")
+        await self._resubscribe(channel, topic, pubsub)
+
+    async def _resubscribe(self, channel: str, topic: _Topic, failed: PubSub) -> None:
+        """끊긴 구독을 정리하고, 구독자가 남아 있는 동안 새 구독으로 교체"""
+        async with topic.lock:
+            if topic.pubsub is failed:
+                topic.pubsub = None
+        await self._close_pubsub(channel, failed)
+
+        while True:
+            async with topic.lock:
+                if self._topics.get(channel) is not topic or not topic.queues or topic.pubsub is not None:
+                    # 해제됐거나, 구독자가 없거나, 새 구독자가 이미 재구독함
+                    if self._topics.get(channel) is topic and not topic.queues:
+                        await self._teardown(channel, topic)
+                    return
+                try:
+                    await self._connect(channel, topic)
+                    self.resubscribe_count += 1
+                    logger.bind(channel=channel).info("upstream 재구독 완료")
+                    return
+                except Exception as e:
+                    logger.bind(channel=channel, error=str(e)).warning("upstream 재구독 실패")
+            await asyncio.sleep(self.RESUBSCRIBE_INTERVAL)
+
+    def _put_latest(self, queue: asyncio.Queue, data: Dict[str, Any]) -> None:
+        """큐가 가득 차면 가장 오래된 메시지를 버리고 추가"""
+        if queue.full():
+            try:
+                queue.get_nowait()
+                self.dropped_count += 1
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait(data)
+
+
+@lru_cache(maxsize=1)
+def get_pubsub_hub() -> PubSubHub:
+    """PubSubHub 싱글톤 인스턴스를 반환합니다."""
+    return PubSubHub()
@@ -1,4 +1,8 @@
 import redis.asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialWithJitterBackoff
+from redis.exceptions import ConnectionError, TimeoutError
+
 from app.config.setting import settings
 
 
@@ -7,6 +11,7 @@ class RedisClient:
     
     _instance = None
     _client = None
+    _pubsub_client = None
     
     # 캐시 TTL 상수
     DEFAULT_CACHE_TTL = 86400  # 24 hours in seconds
@@ -14,23 +19,57 @@ class RedisClient:
     MEDIUM_CACHE_TTL = 43200   # 12 hours in seconds
     PROGRESS_TTL = 300         # 5 minutes in seconds
     
+    @staticmethod
+    def _build(**overrides) -> redis.Redis:
+        """Settings의 풀 크기/타임아웃/재시도 정책으로 클라이언트 생성"""
+        options = dict(
+            decode_responses=True,
+            encoding="utf-8",
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+            socket_keepalive=True,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+            retry=Retry(
+                ExponentialWithJitterBackoff(
+                    cap=settings.REDIS_RETRY_BACKOFF_CAP,
+                    base=settings.REDIS_RETRY_BACKOFF_BASE
+                ),
+                settings.REDIS_RETRY_ATTEMPTS
+            ),
+            retry_on_error=[ConnectionError, TimeoutError],
+        )
+        options.update(overrides)
+        return redis.from_url(settings.REDIS_URL, **options)
+    
     @classmethod
     async def get_client(cls) -> redis.Redis:
         """Redis 클라이언트를 반환하는 메서드"""
         if cls._client is None:
-            cls._client = redis.from_url(
-                settings.REDIS_URL,
-                decode_responses=True,
-                encoding="utf-8"
-            )
+            cls._client = cls._build()
         return cls._client
     
+    @classmethod
+    async def get_pubsub_client(cls) -> redis.Redis:
+        """
+        Pub/Sub 전용 Redis 클라이언트를 반환하는 메서드
+        
+        - 구독 연결은 메시지가 없는 동안 오래 대기하므로 소켓 읽기 타임아웃을 두지 않음
+        - 요청용 커넥션 풀과 분리해 채널 수만큼 늘어나는 장기 구독이 풀 한도를 점유하지 않게 함
+        """
+        if cls._pubsub_client is None:
+            cls._pubsub_client = cls._build(socket_timeout=None, max_connections=None)
+        return cls._pubsub_client
+    
     @classmethod
     async def close(cls):
         """Redis 연결 종료"""
         if cls._client:
             await cls._client.close()
             cls._client = None
+        if cls._pubsub_client:
+            await cls._pubsub_client.close()
+            cls._pubsub_client = None
 
 
 async def get_redis_client() -> redis.Redis:
@@ -38,6 +77,16 @@ async def get_redis_client() -> redis.Redis:
     return await RedisClient.get_client()
 
 
+async def get_redis_pubsub_client() -> redis.Redis:
+    """Pub/Sub 전용 Redis 클라이언트를 반환하는 함수"""
+    return await RedisClient.get_pubsub_client()
+
+
+def create_redis_client(**overrides) -> redis.Redis:
+    """공유 풀과 별도인 전용 클라이언트를 같은 타임아웃/재시도 설정으로 생성 (overrides로 일부 옵션 변경)"""
+    return RedisClient._build(**overrides)
+
+
 async def close_redis():
     """Redis 연결 종료"""
-    await RedisClient.close()
\ No newline at end of file
+    await RedisClient.close()
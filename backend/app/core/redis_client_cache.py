@@ -0,0 +1,254 @@
+import asyncio
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import redis.asyncio as redis
+from redis.asyncio.client import PubSub
+
+from app.config.setting import settings
+from app.core.logger import get_logger
+from app.core.redis import create_redis_client, get_redis_client, get_redis_pubsub_client
+
+logger = get_logger("redis.client_cache")
+
+# (명령어, 키, 인자...) 형태의 캐시 항목 식별자
+CacheKey = Tuple[Any, ...]
+
+
+class RedisClientCache:
+    """
+    서버 invalidation 추적 기반 Redis 클라이언트 사이드 캐시
+
+    - CLIENT TRACKING BCAST 모드로 prefix에 해당하는 키가 변경되면 서버가 invalidation을 발행
+    - invalidation은 전용 Pub/Sub 연결(__redis__:invalidate)로 REDIRECT 받아 로컬 항목을 즉시 제거
+    - 추적/구독 연결이 끊기면 캐시를 비우고 재구성하며, 그동안은 Redis를 직접 조회
+    - 읽기 도중 invalidation이 도착한 값은 저장하지 않음 (오래된 값 캐싱 방지)
+    """
+
+    INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+    def __init__(
+        self,
+        prefixes: List[str],
+        max_entries: int = 10000,
+        max_age: float = 60.0,
+        check_interval: float = 5.0,
+    ) -> None:
+        self.prefixes = list(prefixes)
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.check_interval = check_interval
+
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, float]]" = OrderedDict()
+        self._key_index: Dict[str, Set[CacheKey]] = {}
+        self._inflight: Dict[str, int] = {}
+        self._dirty: Set[str] = set()
+        self._epoch = 0
+        self._ready = False
+
+        self._pubsub: Optional[PubSub] = None
+        self._tracker: Optional[redis.Redis] = None
+        self._supervisor: Optional[asyncio.Task] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.resets = 0
+
+    # ---------- 생명주기 ----------
+
+    async def start(self) -> None:
+        """추적 연결 구성 후 감시 루프 시작 (앱 시작 시 호출)"""
+        if self._supervisor is not None:
+            return
+        try:
+            await self._connect()
+        except Exception as e:
+            logger.bind(error=str(e)).warning("클라이언트 캐시 초기화 실패 - 감시 루프에서 재시도")
+        self._supervisor = asyncio.create_task(self._supervise())
+        logger.bind(prefixes=self.prefixes).info("Redis 클라이언트 캐시 시작")
+
+    async def stop(self) -> None:
+        """감시 루프 종료 및 연결 정리 (앱 종료 시 호출)"""
+        if self._supervisor:
+            self._supervisor.cancel()
+            try:
+                await self._supervisor
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._supervisor = None
+        await self._disconnect()
+        logger.bind(**self.stats()).info("Redis 클라이언트 캐시 종료")
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 상태 조회"""
+        total = self.hits + self.misses
+        return {
+            "ready": self._ready,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "invalidations": self.invalidations,
+            "resets": self.resets,
+        }
+
+    # ---------- 조회 ----------
+
+    def is_cacheable(self, key: str) -> bool:
+        return any(key.startswith(prefix) for prefix in self.prefixes)
+
+    async def execute(self, command: str, key: str, *args: Any) -> Any:
+        """
+        읽기 명령 실행 (추적 대상 키면 로컬 캐시 우선)
+
+        - 캐시가 준비되지 않았거나 추적 대상이 아닌 키는 Redis로 그대로 전달
+        """
+        client = await get_redis_client()
+        if not self._ready or not self.is_cacheable(key):
+            return await client.execute_command(command, key, *args)
+
+        cache_key: CacheKey = (command.upper(), key, *args)
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            value, stored_at = entry
+            if time.monotonic() - stored_at < self.max_age:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return value
+            self._remove(cache_key)
+
+        self.misses += 1
+        epoch = self._epoch
+        self._inflight[key] = self._inflight.get(key, 0) + 1
+        try:
+            value = await client.execute_command(command, key, *args)
+            if self._ready and epoch == self._epoch and key not in self._dirty:
+                self._store(cache_key, key, value)
+            return value
+        finally:
+            self._inflight[key] -= 1
+            if not self._inflight[key]:
+                del self._inflight[key]
+                self._dirty.discard(key)
+
+    # ---------- 내부: 저장소 ----------
+
+    def _store(self, cache_key: CacheKey, key: str, value: Any) -> None:
+        self._entries[cache_key] = (value, time.monotonic())
+        self._entries.move_to_end(cache_key)
+        self._key_index.setdefault(key, set()).add(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, cache_key: CacheKey) -> None:
+        if self._entries.pop(cache_key, None) is None:
+            return
+        key = cache_key[1]
+        cache_keys = self._key_index.get(key)
+        if cache_keys is not None:
+            cache_keys.discard(cache_key)
+            if not cache_keys:
+                del self._key_index[key]
+
+    def _invalidate(self, keys: Optional[List[str]]) -> None:
+        """서버 invalidation 반영 (keys가 None이면 FLUSHDB/FLUSHALL)"""
+        if keys is None:
+            self._clear()
+            return
+        for key in keys:
+            self.invalidations += 1
+            for cache_key in list(self._key_index.get(key, ())):
+                self._remove(cache_key)
+            if key in self._inflight:
+                self._dirty.add(key)
+
+    def _clear(self) -> None:
+        """전체 항목 제거 + 진행 중인 조회 결과 폐기"""
+        self._entries.clear()
+        self._key_index.clear()
+        self._epoch += 1
+
+    # ---------- 내부: 추적 연결 ----------
+
+    async def _connect(self) -> None:
+        """
+        invalidation 구독 연결 → 추적 활성화 순서로 구성
+
+        - 구독 연결의 CLIENT ID를 먼저 얻어 추적 연결이 그쪽으로 REDIRECT 하도록 설정
+        """
+        pubsub_client = await get_redis_pubsub_client()
+        pubsub = pubsub_client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.execute_command("CLIENT", "ID")
+        redirect_id = await pubsub.parse_response(block=True)
+        await pubsub.subscribe(self.INVALIDATE_CHANNEL)
+
+        # 추적 연결도 소켓/연결/재시도 설정은 공유 클라이언트와 같게, 읽기 타임아웃만 구독 연결처럼 없앰
+        tracker = create_redis_client(socket_timeout=None, single_connection_client=True)
+        prefix_args: List[str] = []
+        for prefix in self.prefixes:
+            prefix_args += ["PREFIX", prefix]
+        await tracker.execute_command(
+            "CLIENT", "TRACKING", "ON", "REDIRECT", redirect_id, "BCAST", *prefix_args
+        )
+
+        self._pubsub = pubsub
+        self._tracker = tracker
+        self._clear()
+        self._ready = True
+        logger.bind(redirect_id=redirect_id).debug("invalidation 추적 활성화")
+
+    async def _disconnect(self) -> None:
+        self._ready = False
+        self._clear()
+        pubsub, self._pubsub = self._pubsub, None
+        tracker, self._tracker = self._tracker, None
+        for resource in (pubsub, tracker):
+            if resource is None:
+                continue
+            try:
+                await resource.aclose()
+            except Exception as e:
+                logger.bind(error=str(e)).debug("추적 연결 정리 실패")
+
+    async def _tracking_alive(self) -> bool:
+        """추적 연결이 살아 있고 REDIRECT 대상이 유효한지 확인"""
+        info = await self._tracker.execute_command("CLIENT", "TRACKINGINFO")
+        flags = info.get("flags", []) if isinstance(info, dict) else info[1]
+        return "on" in flags and "broken_redirect" not in flags
+
+    async def _supervise(self) -> None:
+        """invalidation 수신 + 주기적 추적 상태 확인, 실패 시 캐시를 비우고 재구성"""
+        while True:
+            try:
+                if not self._ready:
+                    await self._connect()
+
+                message = await self._pubsub.get_message(timeout=self.check_interval)
+                if message is None:
+                    if not await self._tracking_alive():
+                        raise ConnectionError("tracking redirect broken")
+                    continue
+                if message.get("type") == "message" and message.get("channel") == self.INVALIDATE_CHANNEL:
+                    data = message.get("data")
+                    self._invalidate([data] if isinstance(data, str) else data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._ready:
+                    self.resets += 1
+                    logger.bind(error=str(e)).warning("invalidation 추적 중단 - 캐시 비우고 재연결")
+                await self._disconnect()
+                await asyncio.sleep(self.check_interval)
+
+
+@lru_cache(maxsize=1)
+def get_redis_client_cache() -> RedisClientCache:
+    """RedisClientCache 싱글톤 인스턴스를 반환합니다."""
+    return RedisClientCache(
+        prefixes=settings.REDIS_CLIENT_CACHE_PREFIXES,
+        max_entries=settings.REDIS_CLIENT_CACHE_MAX_ENTRIES,
+        max_age=settings.REDIS_CLIENT_CACHE_MAX_AGE,
+    )
@@ -0,0 +1,237 @@
+import json
+import uuid
+import asyncio
+from collections import Counter
+from functools import lru_cache, wraps
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from redis.asyncio import Redis
+
+from app.config.setting import settings
+from app.core.cache import JsonSerializer, KeyBuilder, Serializer, key_builder
+from app.core.lock.scripts import ScriptCache
+from app.core.logger import get_logger
+from app.core.pubsub_hub import get_pubsub_hub
+from app.core.redis import get_redis_client
+from app.database.session import in_transaction, outside_transaction
+
+logger = get_logger("single_flight")
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 호출을 하나의 실행으로 합치는 single-flight 유틸
+
+    - 프로세스 내: 먼저 들어온 호출(leader)만 실행하고 나머지는 같은 결과(예외 포함)를 공유
+    - 실행은 별도 태스크로 돌리므로 leader 요청이 취소돼도 대기 중인 호출은 계속 결과를 받음
+    - 실행 태스크는 열린 트랜잭션이 없는 컨텍스트에서 돌므로 leader의 세션을 공유하지 않음
+    - distributed=True: 워커 간에도 Redis 락으로 leader를 하나만 두고, 결과를 Pub/Sub으로 전달
+      (대기 시간 초과/leader 실패 시에는 각자 직접 실행)
+    """
+
+    # KEYS: lock, result / ARGV: flight id, 결과, 결과 보존(ms), 채널, 메시지
+    FINISH_SCRIPT = """
+    if redis.call("GET", KEYS[1]) == ARGV[1] then
+        redis.call("DEL", KEYS[1])
+    end
+    if ARGV[2] ~= "" then
+        redis.call("SET", KEYS[2], ARGV[2], "PX", ARGV[3])
+    end
+    redis.call("PUBLISH", ARGV[4], ARGV[5])
+    return 1
+    """
+
+    # 결과를 알림보다 늦게 구독한 대기자를 위한 결과 보존 시간 (ms)
+    RESULT_TTL_MS = 1000
+
+    def __init__(self, lease_ttl: float = 10.0, wait_timeout: float = 5.0) -> None:
+        self.lease_ttl = lease_ttl
+        self.wait_timeout = wait_timeout
+        self._flights: Dict[str, asyncio.Task] = {}
+        self._scripts = ScriptCache()
+        self._calls: Counter = Counter()
+        self._coalesced: Counter = Counter()
+        self._remote_coalesced: Counter = Counter()
+
+    def stats(self) -> Dict[str, Any]:
+        """이름별 호출/합쳐진 호출 수 (remote_coalesced는 다른 워커의 결과를 받은 수)"""
+        return {
+            "in_flight": len(self._flights),
+            "groups": {
+                name: {
+                    "calls": self._calls[name],
+                    "coalesced": self._coalesced[name],
+                    "remote_coalesced": self._remote_coalesced[name],
+                }
+                for name in self._calls
+            },
+        }
+
+    async def do(
+        self,
+        name: str,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        distributed: bool = False,
+        serializer: Optional[Serializer] = None,
+    ) -> Any:
+        """name/key가 같은 진행 중 호출이 있으면 그 결과를 기다리고, 없으면 fn 실행"""
+        self._calls[name] += 1
+        flight_key = f"{name}:{key}"
+        task = self._flights.get(flight_key)
+        if task is not None:
+            self._coalesced[name] += 1
+        else:
+            if distributed:
+                coro = self._run_distributed(name, flight_key, fn, serializer or JsonSerializer())
+            else:
+                coro = fn()
+            task = asyncio.get_running_loop().create_task(coro, context=outside_transaction())
+            self._flights[flight_key] = task
+            task.add_done_callback(lambda _: self._flights.pop(flight_key, None))
+        return await asyncio.shield(task)
+
+    # ---------- 워커 간 모드 ----------
+
+    async def _run_distributed(
+        self,
+        name: str,
+        flight_key: str,
+        fn: Callable[[], Awaitable[Any]],
+        serializer: Serializer,
+    ) -> Any:
+        """
+        Redis 락을 잡은 워커만 실행하고 결과를 발행, 나머지 워커는 결과를 기다림
+
+        - 결과 대기 채널을 먼저 구독한 뒤 락을 시도해 알림 유실을 막음
+        """
+        lock_key = f"singleflight:{flight_key}:lock"
+        channel = f"singleflight:{flight_key}"
+        flight_id = uuid.uuid4().hex
+        leading = False
+        try:
+            client = await get_redis_client()
+            async with get_pubsub_hub().subscribe(channel) as queue:
+                if await client.set(lock_key, flight_id, nx=True, px=int(self.lease_ttl * 1000)):
+                    leading = True
+                else:
+                    leader_id = await client.get(lock_key)
+                    if leader_id:
+                        found, value = await self._wait_remote(client, flight_key, leader_id, queue, serializer)
+                        if found:
+                            self._remote_coalesced[name] += 1
+                            return value
+        except Exception as e:
+            logger.bind(key=flight_key, error=str(e)).warning("분산 single-flight 실패 - 직접 실행")
+
+        if leading:
+            return await self._lead(client, flight_key, lock_key, channel, flight_id, fn, serializer)
+        return await fn()
+
+    async def _lead(
+        self,
+        client: Redis,
+        flight_key: str,
+        lock_key: str,
+        channel: str,
+        flight_id: str,
+        fn: Callable[[], Awaitable[Any]],
+        serializer: Serializer,
+    ) -> Any:
+        """leader 실행 후 결과(또는 실패) 발행"""
+        result_key = f"singleflight:{flight_key}:result:{flight_id}"
+        finish = self._scripts.get(client, self.FINISH_SCRIPT)
+
+        async def publish(data: str, message: Dict[str, Any]) -> None:
+            try:
+                await finish(
+                    keys=[lock_key, result_key],
+                    args=[flight_id, data, self.RESULT_TTL_MS, channel, json.dumps(message)]
+                )
+            except Exception as e:
+                # 대기 중인 워커는 wait_timeout 후 직접 실행
+                logger.bind(key=flight_key, error=str(e)).warning("single-flight 결과 발행 실패")
+
+        try:
+            value = await fn()
+        except BaseException:
+            # 대기 중인 워커가 즉시 직접 실행하도록 실패를 알림
+            await asyncio.shield(publish("", {"flight": flight_id, "ok": False}))
+            raise
+
+        data = json.dumps({"value": None if value is None else serializer.dumps(value)})
+        await publish(data, {"flight": flight_id, "ok": True, "result": data})
+        return value
+
+    async def _wait_remote(
+        self,
+        client: Redis,
+        flight_key: str,
+        leader_id: str,
+        queue: asyncio.Queue,
+        serializer: Serializer,
+    ) -> Tuple[bool, Any]:
+        """다른 워커의 leader 결과 대기, (받았는지, 값) 반환"""
+        result_key = f"singleflight:{flight_key}:result:{leader_id}"
+        data = await client.get(result_key)
+        if data is None:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.wait_timeout
+            while data is None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False, None
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    return False, None
+                if message.get("flight") != leader_id:
+                    continue
+                if not message.get("ok"):
+                    return False, None
+                data = message["result"]
+
+        raw = json.loads(data)["value"]
+        return True, None if raw is None else serializer.loads(raw)
+
+
+@lru_cache(maxsize=1)
+def get_single_flight() -> SingleFlight:
+    """SingleFlight 싱글톤 인스턴스를 반환합니다."""
+    return SingleFlight(
+        lease_ttl=settings.SINGLE_FLIGHT_LEASE_TTL,
+        wait_timeout=settings.SINGLE_FLIGHT_WAIT_TIMEOUT,
+    )
+
+
+def single_flight(
+    name: str,
+    key: KeyBuilder,
+    distributed: bool = False,
+    serializer: Optional[Serializer] = None,
+):
+    """
+    같은 키의 동시 호출을 하나로 합치는 데코레이터
+
+    - key: "{email}" 같은 인자 이름 템플릿 또는 함수와 같은 인자를 받는 callable
+    - distributed=True면 settings.SINGLE_FLIGHT_DISTRIBUTED가 켜진 경우에만 워커 간으로 확장
+    - @cached 아래(@transactional 위)에 두면 캐시 미스의 DB 조회만 합침
+      (캐시 적중 경로에 락/구독 같은 Redis 왕복을 더하지 않음)
+    - 열린 트랜잭션 안의 호출은 합치지 않고 직접 실행 (다른 요청의 커밋 전/롤백될 결과를 받지 않도록)
+    """
+    def decorator(fn):
+        build_key = key_builder(fn, key)
+
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if in_transaction():
+                return await fn(*args, **kwargs)
+            return await get_single_flight().do(
+                name,
+                build_key(*args, **kwargs),
+                lambda: fn(*args, **kwargs),
+                distributed=distributed and settings.SINGLE_FLIGHT_DISTRIBUTED,
+                serializer=serializer,
+            )
+        return wrapper
+    return decorator
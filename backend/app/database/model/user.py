@@ -1,10 +1,14 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index
 from sqlalchemy.sql import func
 from app.database.session import Base
 
 
 class User(Base):
     __tablename__ = "user"
+    __table_args__ = (
+        # 커서 페이지네이션 (ORDER BY created_at DESC, email DESC) 용 복합 인덱스
+        Index("ix_user_created_at_email", "created_at", "email"),
+    )
     
     email = Column(String(255), index=True, primary_key=True)
     name = Column(String(255), nullable=False)
@@ -0,0 +1,90 @@
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.config.setting import settings
+from app.core.logger import get_logger
+
+logger = get_logger("database.pool")
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    커넥션 획득 대기 시간/타임아웃을 기록하는 비동기 QueuePool
+
+    - 획득 시간에는 풀 대기 + (overflow일 때) 새 연결 생성 시간이 포함됨
+    - settings.POSTGRES_POOL_SLOW_WAIT 이상 기다린 획득은 경고 로그 (풀 고갈 추적용)
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.slow_wait_threshold = settings.POSTGRES_POOL_SLOW_WAIT
+        self.checkouts = 0
+        self.slow_waits = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            logger.bind(**self.stats()).error("DB 커넥션 풀 획득 타임아웃")
+            raise
+        finally:
+            self._record_wait(time.perf_counter() - start)
+
+    def _record_wait(self, elapsed: float) -> None:
+        self.checkouts += 1
+        self.wait_total += elapsed
+        self.wait_max = max(self.wait_max, elapsed)
+        if elapsed >= self.slow_wait_threshold:
+            self.slow_waits += 1
+            logger.bind(wait=round(elapsed, 3), checked_out=self.checkedout(), overflow=max(self.overflow(), 0)).warning(
+                "DB 커넥션 획득 지연"
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태 (checked_out/overflow는 현재 값, 나머지는 누적)"""
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "checkouts": self.checkouts,
+            "wait_avg_ms": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+            "slow_waits": self.slow_waits,
+            "timeouts": self.timeouts,
+        }
+
+
+def asyncpg_connect_args() -> Dict[str, Any]:
+    """asyncpg 연결 인자 (prepared statement 캐시, 서버 측 statement_timeout)"""
+    server_settings = {}
+    if settings.POSTGRES_STATEMENT_TIMEOUT_MS:
+        server_settings["statement_timeout"] = str(settings.POSTGRES_STATEMENT_TIMEOUT_MS)
+    return {
+        # PgBouncer(transaction 모드) 뒤에서는 0 권장
+        "prepared_statement_cache_size": settings.POSTGRES_PREPARED_STATEMENT_CACHE_SIZE,
+        "server_settings": server_settings,
+    }
+
+
+def engine_options() -> Dict[str, Any]:
+    """primary/replica 엔진 공통 create_async_engine 인자"""
+    return {
+        "echo": False,
+        "future": True,
+        "poolclass": InstrumentedAsyncPool,
+        "pool_size": settings.POSTGRES_POOL_SIZE,
+        "max_overflow": settings.POSTGRES_MAX_OVERFLOW,
+        "pool_timeout": settings.POSTGRES_POOL_TIMEOUT,
+        "pool_recycle": settings.POSTGRES_POOL_RECYCLE,
+        "pool_pre_ping": settings.POSTGRES_POOL_PRE_PING,
+        "connect_args": asyncpg_connect_args(),
+    }
@@ -0,0 +1,173 @@
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.logger import get_logger
+from app.database.pool import engine_options
+
+logger = get_logger("database.replica")
+
+
+def _mark_connect_failure(context) -> None:
+    # 연결 자체에 실패한 경우도 끊김으로 표시 (connection_invalidated → primary 재시도 대상)
+    if context.connection is None:
+        context.is_disconnect = True
+
+
+@dataclass
+class Replica:
+    """읽기 전용 replica 엔진과 상태"""
+    name: str
+    engine: AsyncEngine
+    session_factory: async_sessionmaker
+    healthy: bool = True
+    lag: Optional[float] = None
+    error: Optional[str] = field(default=None, repr=False)
+
+
+class ReplicaRouter:
+    """
+    읽기 전용 트랜잭션을 replica로 분산하는 라우터
+
+    - round_robin: 정상 replica를 돌아가며 선택 / least_loaded: 사용 중 커넥션이 가장 적은 replica
+    - check_interval마다 연결과 복제 지연을 확인해 실패하거나 max_lag를 넘은 replica는 제외
+    - 선택할 replica가 없으면 None (호출자는 primary 사용)
+    """
+
+    # WAL을 모두 재생했으면 지연 0, 아니면 마지막 재생 트랜잭션 이후 경과 시간 (primary면 0)
+    LAG_QUERY = text("""
+        SELECT CASE
+            WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+        END
+    """)
+
+    def __init__(
+        self,
+        urls: List[str],
+        strategy: str = "round_robin",
+        max_lag: float = 5.0,
+        check_interval: float = 5.0,
+    ) -> None:
+        self.strategy = strategy
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.replicas = [self._build(url) for url in urls]
+        self._counter = itertools.count()
+        self._checker: Optional[asyncio.Task] = None
+        self.routed = 0
+        self.fallbacks = 0
+
+    @staticmethod
+    def _build(url: str) -> Replica:
+        engine = create_async_engine(url, **engine_options())
+        event.listen(engine.sync_engine, "handle_error", _mark_connect_failure)
+        parsed = make_url(url)
+        return Replica(
+            name=f"{parsed.host}:{parsed.port}",
+            engine=engine,
+            session_factory=async_sessionmaker(
+                bind=engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autoflush=False,
+                autocommit=False,
+            ),
+        )
+
+    # ---------- 선택 ----------
+
+    def choose(self) -> Optional[Replica]:
+        """정상 replica 하나를 고름 (없으면 None)"""
+        candidates = [replica for replica in self.replicas if replica.healthy]
+        if not candidates:
+            if self.replicas:
+                self.fallbacks += 1
+            return None
+        self.routed += 1
+        if self.strategy == "least_loaded":
+            return min(candidates, key=lambda replica: replica.engine.pool.checkedout())
+        return candidates[next(self._counter) % len(candidates)]
+
+    def mark_unhealthy(self, replica: Replica, error: Exception) -> None:
+        """요청 중 연결 실패한 replica를 다음 상태 확인까지 제외"""
+        if replica.healthy:
+            logger.bind(replica=replica.name, error=str(error)).warning("replica 연결 실패 - primary로 대체")
+        replica.healthy = False
+        replica.error = str(error)
+
+    # ---------- 상태 확인 ----------
+
+    async def check(self) -> None:
+        """모든 replica의 연결/복제 지연 확인"""
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+
+    async def _check(self, replica: Replica) -> None:
+        try:
+            async with replica.engine.connect() as conn:
+                lag = float((await conn.execute(self.LAG_QUERY)).scalar() or 0)
+        except Exception as e:
+            self.mark_unhealthy(replica, e)
+            return
+
+        healthy = lag <= self.max_lag
+        if healthy != replica.healthy:
+            logger.bind(replica=replica.name, lag=round(lag, 3), max_lag=self.max_lag).info(
+                "replica 복귀" if healthy else "replica 복제 지연 초과 - 제외"
+            )
+        replica.healthy = healthy
+        replica.lag = lag
+        replica.error = None
+
+    async def _run_checks(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            try:
+                await self.check()
+            except Exception as e:
+                logger.bind(error=str(e)).warning("replica 상태 확인 실패")
+
+    # ---------- 생명주기 ----------
+
+    async def start(self) -> None:
+        """최초 상태 확인 후 주기 확인 시작 (앱 시작 시 호출)"""
+        if not self.replicas or self._checker is not None:
+            return
+        await self.check()
+        self._checker = asyncio.create_task(self._run_checks())
+        logger.bind(replicas=[replica.name for replica in self.replicas], strategy=self.strategy).info(
+            "replica 라우팅 시작"
+        )
+
+    async def stop(self) -> None:
+        """주기 확인 종료 및 replica 엔진 정리 (앱 종료 시 호출)"""
+        if self._checker:
+            self._checker.cancel()
+            try:
+                await self._checker
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._checker = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "strategy": self.strategy,
+            "routed": self.routed,
+            "fallbacks": self.fallbacks,
+            "replicas": {
+                replica.name: {
+                    "healthy": replica.healthy,
+                    "lag": None if replica.lag is None else round(replica.lag, 3),
+                    "error": replica.error,
+                    "pool": replica.engine.pool.stats(),
+                }
+                for replica in self.replicas
+            },
+        }
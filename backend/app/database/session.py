@@ -1,7 +1,16 @@
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError, InvalidRequestError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.ext.asyncio import async_sessionmaker
-from functools import wraps
-from contextvars import ContextVar
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+from functools import lru_cache, wraps
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from enum import Enum
+from typing import Awaitable, Callable, Iterator, Optional
+
+from app.core.logger import get_logger
+from app.database.replica import Replica, ReplicaRouter
 
 """
 RDB
@@ -9,40 +18,229 @@ RDB
 
 _current_session: ContextVar = ContextVar('_current_session', default=None) # 트랜잭션 전파 관리
 
+logger = get_logger("database.session")
+
+
+class Propagation(str, Enum):
+    """@transactional 트랜잭션 전파 방식"""
+    REQUIRED = "required"          # 열린 트랜잭션에 참여, 없으면 새로 시작
+    REQUIRES_NEW = "requires_new"  # 항상 별도 세션/커넥션으로 새 트랜잭션 (독립 커밋)
+    NESTED = "nested"              # 열린 트랜잭션 안에서 SAVEPOINT, 실패 시 SAVEPOINT까지만 롤백
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_write(orm_execute_state):
+    # SELECT가 아닌 문장(text() 포함)은 쓰기로 간주
+    if not orm_execute_state.is_select:
+        session = orm_execute_state.session
+        # 읽기 전용 세션은 AUTOCOMMIT이라 DB가 막지 않으므로 ORM 쓰기 문장을 여기서 거부
+        if session.info.get("read_only") and (
+            orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete
+        ):
+            raise InvalidRequestError("Write statement in read-only transaction")
+        session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_read_only_flush(session, flush_context, instances):
+    if session.info.get("read_only") and (session.new or session.dirty or session.deleted):
+        raise InvalidRequestError("Flush in read-only transaction")
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_write(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@lru_cache(maxsize=None)
+def _read_only_bind(engine: AsyncEngine) -> AsyncEngine:
+    """
+    읽기 전용 세션용 엔진 (풀은 공유)
+
+    - AUTOCOMMIT이라 BEGIN/ROLLBACK 없이 조회 문장만 전송 (조회 한 번에 왕복 3회 → 1회)
+    - 문장마다 스냅샷이 따로 잡히므로 여러 조회가 같은 시점을 보지는 않음
+    """
+    return engine.execution_options(isolation_level="AUTOCOMMIT")
+
+
+def _is_connection_error(error: BaseException) -> bool:
+    return isinstance(error, OSError) or (isinstance(error, DBAPIError) and error.connection_invalidated)
+
+
+@contextmanager
+def use_session(session: AsyncSession) -> Iterator[AsyncSession]:
+    """블록 안의 @transactional 호출이 모두 session에 참여하도록 설정 (요청 단위 트랜잭션용)"""
+    token = _current_session.set(session)
+    try:
+        yield session
+    finally:
+        _current_session.reset(token)
+
+
+def in_transaction() -> bool:
+    """현재 컨텍스트에 열린 트랜잭션(@transactional, 요청 단위 세션)이 있는지 여부"""
+    return _current_session.get() is not None
+
+
+def in_write_transaction() -> bool:
+    """현재 컨텍스트에 열린 트랜잭션이 읽기 전용이 아닌지 여부 (커밋 전 값을 읽을 수 있음)"""
+    session = _current_session.get()
+    return session is not None and not session.info.get("read_only")
+
+
+def outside_transaction() -> Context:
+    """현재 컨텍스트에서 열린 트랜잭션만 뺀 복사본 (공유 태스크가 호출자의 세션을 물려받지 않도록)"""
+    context = copy_context()
+    context.run(_current_session.set, None)
+    return context
+
+
+def after_commit(callback: Callable[[], Awaitable[None]]) -> bool:
+    """
+    열린 트랜잭션이 있으면 커밋 후 실행할 콜백 등록 (등록했으면 True, 열린 트랜잭션이 없으면 False)
+
+    - 롤백되면 콜백은 버려짐
+    """
+    session = _current_session.get()
+    if session is None:
+        return False
+    session.info.setdefault("after_commit", []).append(callback)
+    return True
+
+
 class UnitOfWork:
-    def __init__(self, session: async_sessionmaker):
+    """
+    세션 단위 트랜잭션
+
+    - 세션만 만들고 커넥션은 첫 쿼리 실행 시 풀에서 가져옴 (DB 작업 전에는 풀을 점유하지 않음)
+    - 읽기 전용(reader)은 AUTOCOMMIT 커넥션을 써서 BEGIN/ROLLBACK 왕복이 없음
+    - 쓰기가 없었으면 COMMIT을 호출하지 않음 (쓰기 세션은 닫을 때 ROLLBACK으로 정리)
+    """
+
+    def __init__(
+        self,
+        session: async_sessionmaker,
+        replicas: Optional[ReplicaRouter] = None,
+        read_only: bool = False,
+        use_replica: bool = True
+    ):
         self.session_factory = session
+        self.replicas = replicas
+        self.read_only = read_only
+        self.use_replica = use_replica
+        self.replica: Optional[Replica] = None
+
+    def reader(self, use_replica: bool = True) -> "UnitOfWork":
+        """읽기 전용 트랜잭션용 UnitOfWork (정상 replica가 있으면 replica, 없으면 primary)"""
+        return UnitOfWork(self.session_factory, self.replicas, read_only=True, use_replica=use_replica)
 
     async def __aenter__(self):
-        self.session = self.session_factory()
+        if not self.read_only:
+            self.session = self.session_factory()
+            return self.session
+
+        if self.use_replica and self.replicas:
+            self.replica = self.replicas.choose()
+        if self.replica is not None:
+            self.session = self.replica.session_factory(bind=_read_only_bind(self.replica.engine))
+        else:
+            self.session = self.session_factory(bind=_read_only_bind(self.session_factory.kw["bind"]))
+        self.session.info["read_only"] = True
         return self.session
 
     async def __aexit__(self, exc_type, exc, tb):
-        if exc:
-            await self.session.rollback()
-        else:
-            await self.session.commit()
-        await self.session.close()
+        try:
+            if exc:
+                await self.rollback()
+                if self.replica is not None and _is_connection_error(exc):
+                    self.replicas.mark_unhealthy(self.replica, exc)
+            else:
+                await self.commit()
+        finally:
+            await self.session.close()
 
+    async def commit(self) -> None:
+        """쓰기가 있었으면 커밋하고 after_commit 콜백 실행 (세션은 계속 사용 가능)"""
+        session = self.session
+        if self.has_writes:
+            await session.commit()
+            session.info.pop("has_writes", None)
+        for callback in session.info.pop("after_commit", []):
+            try:
+                await callback()
+            except Exception as e:
+                # 이미 커밋됐으므로 실패로 만들지 않음
+                logger.bind(error=str(e)).warning("after_commit 콜백 실패")
 
-def transactional(fn):
-    @wraps(fn)
-    async def wrapper(self, *args, **kwargs):
-        existing = _current_session.get()
-        if existing is not None:
-            # 이미 트랜잭션이 열려 있으면 기존 세션에 참여
-            self._session = existing
-            return await fn(self, *args, **kwargs)
+    async def rollback(self) -> None:
+        """롤백하고 after_commit 콜백 폐기"""
+        session = self.session
+        await session.rollback()
+        session.info.pop("has_writes", None)
+        session.info.pop("after_commit", None)
+
+    @property
+    def has_writes(self) -> bool:
+        session = self.session
+        return bool(session.info.get("has_writes") or session.new or session.dirty or session.deleted)
+
+
+def transactional(
+    fn=None,
+    *,
+    readonly: bool = False,
+    use_replica: bool = True,
+    propagation: Propagation = Propagation.REQUIRED,
+):
+    """
+    서비스 메서드를 트랜잭션으로 실행
 
-        # 새 트랜잭션 시작
-        async with self.uow as session:
+    - propagation: 열린 트랜잭션이 있을 때의 동작 (없으면 모두 새 트랜잭션 시작)
+    - @transactional(readonly=True): replica로 라우팅되는 읽기 전용 세션 (AUTOCOMMIT, ORM 쓰기는 예외),
+      replica 연결이 실패하면 primary에서 한 번 더 실행 (읽기 전용이라 재실행해도 안전)
+    - use_replica=False: 읽기 전용이지만 primary에서 실행 (캐시를 채우는 조회처럼 replica 지연 값을 오래 남기면 안 되는 경우)
+    - 열린 트랜잭션에 참여/중첩하면 readonly여도 같은 세션(primary) 사용
+    """
+    if fn is None:
+        return lambda f: transactional(f, readonly=readonly, use_replica=use_replica, propagation=propagation)
+
+    async def run(self, uow: UnitOfWork, args, kwargs):
+        previous = getattr(self, "_session", None)
+        async with uow as session:
             token = _current_session.set(session)
             self._session = session
             try:
                 return await fn(self, *args, **kwargs)
             finally:
                 _current_session.reset(token)
-                self._session = None
+                self._session = previous
+
+    async def start(self, args, kwargs):
+        if not readonly:
+            return await run(self, self.uow, args, kwargs)
+
+        uow = self.uow.reader(use_replica=use_replica)
+        try:
+            return await run(self, uow, args, kwargs)
+        except (DBAPIError, OSError) as e:
+            if uow.replica is None or not _is_connection_error(e):
+                raise
+            return await run(self, self.uow.reader(use_replica=False), args, kwargs)
+
+    @wraps(fn)
+    async def wrapper(self, *args, **kwargs):
+        existing = _current_session.get()
+        if existing is None or propagation == Propagation.REQUIRES_NEW:
+            return await start(self, args, kwargs)
+
+        self._session = existing
+        if propagation == Propagation.NESTED:
+            # 예외가 나면 SAVEPOINT까지만 롤백하고 예외는 그대로 전달
+            async with existing.begin_nested():
+                return await fn(self, *args, **kwargs)
+
+        # 이미 트랜잭션이 열려 있으면 기존 세션에 참여
+        return await fn(self, *args, **kwargs)
     return wrapper
 
 
@@ -65,7 +263,7 @@ class MongoDB:
     def __init__(self):
         self.client: Optional[AsyncIOMotorClient] = None # type: ignore
         self.database: Optional[AsyncIOMotorDatabase] = None # type: ignore
-        
+
     async def connect(self):
         """MongoDB 연결 및 초기화"""
         self.client = AsyncIOMotorClient(
@@ -75,12 +273,12 @@ class MongoDB:
             tz_aware=True,
         )
         self.database = self.client[settings.MONGODB_NAME]
-        
+
         await init_beanie(
             database=self.database,
             document_models=[Log, Progress]
         )
-        
+
     async def disconnect(self):
         """MongoDB 연결 종료"""
         if self.client:
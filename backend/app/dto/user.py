@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 from pydantic import BaseModel, Field, EmailStr
 
@@ -38,4 +39,29 @@ class UserUpdateDTO(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255, description="사용자 이름")
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class CountStrategy(str, Enum):
+    """목록 조회 시 전체 수 계산 방식"""
+    EXACT = "exact"          # SELECT count(*) (정확, 테이블이 크면 느림)
+    ESTIMATED = "estimated"  # 통계 기반 추정치 (PostgreSQL pg_class.reltuples)
+    CACHED = "cached"        # 정확한 수를 TTL 동안 캐싱
+    NONE = "none"            # 계산하지 않음 (total = None)
+
+
+class BulkStatus(str, Enum):
+    """일괄 생성 행별 결과"""
+    CREATED = "created"      # 새로 생성
+    UPDATED = "updated"      # 이미 있어 이름 갱신 (upsert)
+    SKIPPED = "skipped"      # 이미 있어 건너뜀
+    DUPLICATE = "duplicate"  # 같은 요청 안의 중복 이메일 (첫 행만 반영)
+    FAILED = "failed"        # DB 오류로 저장하지 못함 (나머지 행은 계속 처리)
+
+
+class UserBulkResultDTO(BaseModel):
+    """User 일괄 생성 행별 결과 DTO"""
+    email: EmailStr = Field(..., description="사용자 이메일")
+    status: BulkStatus = Field(..., description="처리 결과")
+    user: Optional[UserDTO] = Field(None, description="생성/갱신된 사용자 (created/updated일 때)")
+    error: Optional[str] = Field(None, description="실패 사유 (failed일 때)")
\ No newline at end of file
@@ -12,13 +12,22 @@ from app.middleware.tracking import (
     SecurityHeadersMiddleware
 )
 from app.middleware.auth import BearerTokenAuthMiddleware
+from app.middleware.transaction import RequestTransactionMiddleware
 from app.core.exception.handler import register_exception_handlers
 from app.database.session import init_mongodb, close_mongodb
 from app.core.redis import get_redis_client, close_redis
+from app.core.log_writer import get_log_writer
+from app.core.pubsub_hub import get_pubsub_hub
+from app.core.redis_client_cache import get_redis_client_cache
+from app.core.cache import get_cache_service
+from app.core.single_flight import get_single_flight
+from app.core.lock import get_redis_lock, get_redis_rw_lock, get_redis_semaphore
+from app.core.job_queue import get_job_queue
 from app.core.llm_manager import get_llm_manager
 from app.core.chroma_manager import get_chroma_manager
 from app.core.graph.example.graph_orchestrator import get_example_graph
 from app.api.v1.router import api_router
+from app.service.progress import ProgressService
 from app.container import Container
 
 
@@ -33,6 +42,10 @@ async def lifespan(app: FastAPI):
     await init_mongodb()
     logger.info("MongoDB 연결 완료")
     
+    # API 로그 배치 기록기 시작
+    log_writer = get_log_writer()
+    await log_writer.start()
+    
     # Redis 초기화
     redis_client = await get_redis_client()
     try:
@@ -42,6 +55,28 @@ async def lifespan(app: FastAPI):
         logger.error(f"Redis 연결 실패: {e}")
         raise
     
+    # 분산 락/캐시 Lua 스크립트 사전 등록 (이후 EVALSHA로 호출)
+    await get_redis_lock().load_scripts()
+    await get_redis_rw_lock().load_scripts()
+    await get_redis_semaphore().load_scripts()
+    await get_cache_service().load_scripts()
+    
+    # 캐시 무효화 채널 구독 (워커별 L1 캐시)
+    await get_cache_service().start()
+    
+    # Redis 클라이언트 사이드 캐시 (opt-in)
+    if settings.REDIS_CLIENT_CACHE_ENABLED:
+        await get_redis_client_cache().start()
+    
+    # 읽기 전용 replica 상태 확인 시작
+    replica_router = app.container.replica_router()
+    await replica_router.start()
+    
+    # 분산 작업 큐 워커 시작
+    job_queue = get_job_queue()
+    job_queue.register(ProgressService.JOB_TYPE, ProgressService.run_job)
+    await job_queue.start()
+    
     # LLM 초기화
     llm_manger = get_llm_manager()
     if llm_manger.initialize():
@@ -70,10 +105,21 @@ async def lifespan(app: FastAPI):
     
     yield
     
-    # 종료 시 정리
+    # 종료 시 정리 (실행 중인 작업은 다른 워커가 이어받도록 큐에 반환)
+    await job_queue.stop()
+    
+    # 남은 API 로그를 모두 기록한 뒤 MongoDB 종료
+    await log_writer.stop()
+    
     await close_mongodb()
     logger.info("MongoDB 연결 종료")
     
+    await replica_router.stop()
+    
+    await get_pubsub_hub().close()
+    await get_cache_service().stop()
+    if settings.REDIS_CLIENT_CACHE_ENABLED:
+        await get_redis_client_cache().stop()
     await close_redis()
     logger.info("Redis 연결 종료")
     
@@ -109,6 +155,7 @@ def create_app() -> FastAPI:
     ).info("FastAPI 앱 생성 완료")
     
     # 미들웨어 등록 (순서 중요함 -> 먼저 등록된 것이 나중에 실행됨)
+    app.add_middleware(RequestTransactionMiddleware, uow_factory=container.uow)  # 요청 단위 트랜잭션
     app.add_middleware(SecurityHeadersMiddleware)
     app.add_middleware(MongoDBLoggingMiddleware)
     app.add_middleware(ErrorTrackingMiddleware)
@@ -147,6 +194,17 @@ def create_app() -> FastAPI:
         except Exception as e:
             health_status["services"]["redis"] = f"unhealthy: {str(e)}"
             health_status["status"] = "degraded"
+        
+        health_status["log_writer"] = get_log_writer().stats()
+        health_status["pubsub_hub"] = get_pubsub_hub().stats()
+        health_status["job_queue"] = get_job_queue().stats()
+        health_status["cache"] = get_cache_service().stats()
+        health_status["single_flight"] = get_single_flight().stats()
+        health_status["db_pool"] = container.engine().pool.stats()
+        if settings.POSTGRES_REPLICA_HOSTS:
+            health_status["db_replicas"] = container.replica_router().stats()
+        if settings.REDIS_CLIENT_CACHE_ENABLED:
+            health_status["redis_client_cache"] = get_redis_client_cache().stats()
             
         logger.bind(**health_status).debug("헬스 체크")
         return health_status
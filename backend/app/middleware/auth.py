@@ -1,15 +1,15 @@
-from typing import Callable
-from fastapi import Request, Response, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from fastapi import status
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config.setting import settings
 from app.core.logger import get_logger
 
 
-class BearerTokenAuthMiddleware(BaseHTTPMiddleware):
-    """Bearer 토큰 인증 미들웨어"""
-    
+class BearerTokenAuthMiddleware:
+    """Bearer 토큰 인증 미들웨어 (순수 ASGI)"""
+
     EXCLUDED_PATHS = [
         "/docs",
         "/redoc",
@@ -17,33 +17,40 @@ class BearerTokenAuthMiddleware(BaseHTTPMiddleware):
         "/health",
         "/favicon.ico"
     ]
-    
+
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
         self.logger = get_logger("middleware.bearer_auth")
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # PROD 환경이 아니거나 ACCESS_TOKEN이 설정되지 않았으면 인증 스킵
         if settings.ENVIRONMENT != "PROD" or not settings.ACCESS_TOKEN:
-            return await call_next(request)
-        
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+
         # 제외 경로는 인증 스킵
-        if any(request.url.path.startswith(path) for path in self.EXCLUDED_PATHS):
-            return await call_next(request)
-        
+        if any(path.startswith(excluded) for excluded in self.EXCLUDED_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = scope.get("state", {}).get("request_id", "unknown")
+
         # Authorization 헤더 확인
-        auth_header = request.headers.get("Authorization")
+        auth_header = Headers(scope=scope).get("Authorization")
         if not auth_header:
             self.logger.bind(
-                request_id=getattr(request.state, "request_id", "unknown"),
-                path=request.url.path
+                request_id=request_id,
+                path=path
             ).warning("Authorization 헤더가 없음")
-            return Response(
-                content='{"detail":"Authorization header required"}',
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                media_type="application/json"
-            )
-        
+            await self._unauthorized('{"detail":"Authorization header required"}')(scope, receive, send)
+            return
+
         # Bearer 토큰 확인
         try:
             scheme, token = auth_header.split()
@@ -51,25 +58,28 @@ class BearerTokenAuthMiddleware(BaseHTTPMiddleware):
                 raise ValueError("Invalid authentication scheme")
         except ValueError:
             self.logger.bind(
-                request_id=getattr(request.state, "request_id", "unknown"),
-                path=request.url.path
+                request_id=request_id,
+                path=path
             ).warning("잘못된 Authorization 헤더 형식")
-            return Response(
-                content='{"detail":"Invalid authorization header format"}',
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                media_type="application/json"
-            )
-        
+            await self._unauthorized('{"detail":"Invalid authorization header format"}')(scope, receive, send)
+            return
+
         # 토큰 검증
         if token != settings.ACCESS_TOKEN:
             self.logger.bind(
-                request_id=getattr(request.state, "request_id", "unknown"),
-                path=request.url.path
+                request_id=request_id,
+                path=path
             ).warning("유효하지 않은 액세스 토큰")
-            return Response(
-                content='{"detail":"Invalid access token"}',
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                media_type="application/json"
-            )
-        
-        return await call_next(request)
\ No newline at end of file
+            await self._unauthorized('{"detail":"Invalid access token"}')(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _unauthorized(content: str) -> Response:
+        """401 응답 생성"""
+        return Response(
+            content=content,
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            media_type="application/json"
+        )
@@ -1,155 +1,204 @@
 import uuid
 import time
 from typing import Callable, Optional
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logger import get_logger
-from app.repository.log import LogRepository
+from app.core.log_writer import get_log_writer
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+"""
+순수 ASGI 미들웨어
+
+BaseHTTPMiddleware는 요청마다 태스크와 메모리 스트림을 추가로 만들고
+StreamingResponse 본문을 한 번 더 중계하기 때문에 SSE 스트림의 지연이 커진다.
+여기의 미들웨어들은 `send`만 감싸서 헤더/타이밍을 주입한다.
+"""
+
+
+def _client_host(scope: Scope) -> Optional[str]:
+    """scope에서 클라이언트 호스트 추출"""
+    client = scope.get("client")
+    return client[0] if client else None
+
+
+def _get_state(scope: Scope) -> dict:
+    """request.state와 동일한 저장소(scope["state"])를 반환"""
+    return scope.setdefault("state", {})
+
+
+class RequestIDMiddleware:
     """요청 ID를 생성하고 추적하는 미들웨어"""
-    
+
     def __init__(
         self,
         app: ASGIApp,
         header_name: str = "X-Request-ID",
         generator: Optional[Callable[[], str]] = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.header_name = header_name
         self.generator = generator or self._default_generator
         self.logger = get_logger("middleware.request_tracking")
-    
+
     @staticmethod
     def _default_generator() -> str:
         """기본 요청 ID 생성기"""
         return str(uuid.uuid4())
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        request_id = request.headers.get(self.header_name) or self.generator()
-        
-        request.state.request_id = request_id
-        
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(self.header_name) or self.generator()
+
+        _get_state(scope)["request_id"] = request_id
+
         self.logger.bind(
             request_id=request_id,
-            method=request.method,
-            path=request.url.path
+            method=scope["method"],
+            path=scope["path"]
         ).debug("요청 ID 할당됨")
-        
-        response = await call_next(request)
-        
-        response.headers[self.header_name] = request_id
-        
-        return response
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[self.header_name] = request_id
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
 
-class ErrorTrackingMiddleware(BaseHTTPMiddleware):
+class ErrorTrackingMiddleware:
     """에러 추적 및 모니터링 미들웨어"""
-    
+
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
         self.logger = get_logger("middleware.error_tracking")
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
-        request_id = getattr(request.state, "request_id", "unknown")
-        
+        request_id = _get_state(scope).get("request_id", "unknown")
+        headers = Headers(scope=scope)
+
         req_logger = self.logger.bind(
             request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            client_host=request.client.host if request.client else None
+            method=scope["method"],
+            path=scope["path"],
+            client_host=_client_host(scope)
         )
-        
+
         req_logger.bind(
-            query_params=dict(request.query_params),
-            user_agent=request.headers.get("user-agent")
+            query_params=dict(QueryParams(scope.get("query_string", b""))),
+            user_agent=headers.get("user-agent")
         ).info("요청 처리 시작")
-        
-        try:
-            response = await call_next(request)
-            
-            process_time = time.time() - start_time
-            response.headers["X-Process-Time"] = str(process_time)
-            
-            req_logger.bind(
-                status_code=response.status_code,
-                process_time=process_time
-            ).info("요청 처리 완료")
-            
-            return response
-            
-        except Exception:
-            # 에러 핸들러에서 잡음
-            raise
 
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                process_time = time.time() - start_time
+                MutableHeaders(scope=message)["X-Process-Time"] = str(process_time)
+
+                req_logger.bind(
+                    status_code=message["status"],
+                    process_time=process_time
+                ).info("요청 처리 완료")
+            await send(message)
+
+        # 예외는 에러 핸들러에서 잡음
+        await self.app(scope, receive, send_wrapper)
+
+
+class MongoDBLoggingMiddleware:
+    """
+    MongoDB에 API 호출 로그를 저장하는 미들웨어
+
+    - 로그는 LogWriter 큐에 넣기만 하고, 실제 저장은 백그라운드에서 배치로 수행
+    """
 
-class MongoDBLoggingMiddleware(BaseHTTPMiddleware):
-    """MongoDB에 API 호출 로그를 저장하는 미들웨어"""
-    
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
         self.logger = get_logger("middleware.mongodb_logging")
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        self.log_writer = get_log_writer()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
-        
+        # 응답 시간은 기존과 동일하게 응답 헤더가 나가는 시점까지로 측정
+        response_info = {"status_code": None, "response_time": None}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_info["status_code"] = message["status"]
+                response_info["response_time"] = (time.time() - start_time) * 1000
+            await send(message)
+
         try:
-            response = await call_next(request)
-            
-            response_time = (time.time() - start_time) * 1000
-            
-            client_host = request.client.host if request.client else None
-            
-            user_id = getattr(request.state, "user_id", None)
-            
-            try:
-                await LogRepository.create(
-                    called_api=request.url.path,
-                    method=request.method,
-                    status_code=response.status_code,
-                    user_id=user_id,
-                    response_time=response_time,
-                    ip_address=client_host
-                )
-            except Exception as e:
-                self.logger.bind(
-                    error=str(e),
-                    api_path=request.url.path
-                ).error("MongoDB 로그 저장 실패")
-            
-            return response
-            
-        except Exception as e:
-            response_time = (time.time() - start_time) * 1000
-            client_host = request.client.host if request.client else None
-            
-            try:
-                await LogRepository.create(
-                    called_api=request.url.path,
-                    method=request.method,
-                    status_code=500,
-                    response_time=response_time,
-                    ip_address=client_host
-                )
-            except Exception as log_error:
-                self.logger.bind(
-                    error=str(log_error),
-                    api_path=request.url.path
-                ).error("MongoDB 에러 로그 저장 실패")
-            
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            await self._save_log(
+                scope,
+                status_code=response_info["status_code"] or 500,
+                response_time=response_info["response_time"] or (time.time() - start_time) * 1000,
+                user_id=None,
+                error_message="MongoDB 에러 로그 저장 실패"
+            )
             raise
 
+        await self._save_log(
+            scope,
+            status_code=response_info["status_code"],
+            response_time=response_info["response_time"],
+            user_id=_get_state(scope).get("user_id"),
+            error_message="MongoDB 로그 저장 실패"
+        )
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+    async def _save_log(
+        self,
+        scope: Scope,
+        status_code: Optional[int],
+        response_time: Optional[float],
+        user_id,
+        error_message: str
+    ) -> None:
+        """API 호출 로그를 배치 기록 큐에 추가"""
+        try:
+            await self.log_writer.enqueue({
+                "called_api": scope["path"],
+                "method": scope["method"],
+                "status_code": status_code,
+                "user_id": user_id,
+                "response_time": response_time,
+                "ip_address": _client_host(scope),
+            })
+        except Exception as e:
+            self.logger.bind(
+                error=str(e),
+                api_path=scope["path"]
+            ).error(error_message)
+
+
+class SecurityHeadersMiddleware:
     """보안 헤더 추가 미들웨어"""
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-        
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        
-        return response
\ No newline at end of file
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Content-Type-Options"] = "nosniff"
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
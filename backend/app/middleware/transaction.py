@@ -0,0 +1,43 @@
+from typing import Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database.session import UnitOfWork, use_session
+
+
+class RequestTransactionMiddleware:
+    """
+    요청 단위 트랜잭션 미들웨어 (순수 ASGI)
+
+    - 쓰기 메서드(POST/PUT/PATCH/DELETE) 요청마다 UnitOfWork 하나를 열고,
+      요청 안의 @transactional 호출은 모두 그 세션에 참여 (호출마다 세션/커넥션/COMMIT을 만들지 않음)
+    - 응답 헤더를 보내기 직전에 상태 코드가 400 미만이면 커밋, 이상이면 롤백 (예외도 롤백)
+    - 커밋이 실패하면 원래 응답은 한 바이트도 보내지 않고 예외를 올려 에러 핸들러가 500으로 응답
+    - 커넥션은 첫 쿼리 때 가져오므로 DB를 쓰지 않는 요청은 풀을 점유하지 않음
+    - GET/HEAD/OPTIONS는 그대로 통과 (읽기 전용 트랜잭션의 replica 라우팅 유지)
+    """
+
+    SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    def __init__(self, app: ASGIApp, uow_factory: Callable[[], UnitOfWork]) -> None:
+        self.app = app
+        self.uow_factory = uow_factory
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in self.SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        uow = self.uow_factory()
+        async with uow as session:
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    if message["status"] < 400:
+                        # 실패하면 send 전에 예외가 올라가므로 응답이 시작되지 않음
+                        await uow.commit()
+                    else:
+                        await uow.rollback()
+                await send(message)
+
+            with use_session(session):
+                await self.app(scope, receive, send_wrapper)
@@ -1,6 +1,7 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta, timezone
 from beanie import PydanticObjectId
+from pydantic import ValidationError
 
 from app.database.model.log import Log
 
@@ -29,6 +30,23 @@ class LogRepository:
         await log.insert()
         return log
     
+    @staticmethod
+    async def create_many(records: List[Dict[str, Any]]) -> int:
+        """
+        여러 로그를 한 번의 insert_many로 저장 (records: create와 동일한 필드의 dict)
+        - 검증에 실패한 레코드는 건너뛰고 나머지만 저장, 저장한 수 반환
+        """
+        logs = []
+        for record in records:
+            try:
+                logs.append(Log(**record))
+            except ValidationError:
+                continue
+        if not logs:
+            return 0
+        await Log.insert_many(logs)
+        return len(logs)
+    
     @staticmethod
     async def find_by_id(log_id: PydanticObjectId) -> Optional[Log]:
         """ID로 로그 조회"""
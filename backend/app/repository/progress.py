@@ -19,11 +19,11 @@ class ProgressRepository:
 
     @staticmethod
     async def find_active_by_user(user_id: str) -> Optional[Progress]:
-        """사용자의 진행 중인(end=None) 레코드 조회"""
-        return await Progress.find_one(
+        """사용자의 진행 중인(end=None) 레코드 중 가장 최근 것 조회"""
+        return await Progress.find(
             Progress.user_id == user_id,
             Progress.end == None
-        )
+        ).sort(-Progress.created_at).first_or_none()
 
     @staticmethod
     async def find_by_key(progress_key: str) -> Optional[Progress]:
@@ -1,32 +1,43 @@
-from typing import List, Optional
+import uuid
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, update, delete, func, tuple_, text, literal_column
+from sqlalchemy.dialects import postgresql, sqlite
 
 from app.database.model.user import User
 from app.dto.user import UserCreateDTO, UserUpdateDTO, UserDTO
 
 
+# 일괄 INSERT ... RETURNING 으로 돌려받는 컬럼
+_BULK_RETURNING = (User.email, User.name, User.created_at)
+
+
+def _batches(users: List[UserCreateDTO], batch_size: int) -> Iterator[List[UserCreateDTO]]:
+    for start in range(0, len(users), batch_size):
+        yield users[start:start + batch_size]
+
+
 class UserRepository:
     """User Repository"""
     
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create(self, user_data: UserCreateDTO) -> UserDTO:
-        """사용자 생성"""
-        try:
-            user = User(
-                email=user_data.email,
-                name=user_data.name
-            )
-            self.session.add(user)
-            await self.session.flush()
-            await self.session.refresh(user)
-            return UserDTO.from_orm(user)
-        except IntegrityError:
-            await self.session.rollback()
-            raise ValueError(f"User with email {user_data.email} already exists")
+    async def create(self, user_data: UserCreateDTO) -> Optional[UserDTO]:
+        """
+        사용자 생성 (INSERT ... ON CONFLICT DO NOTHING RETURNING, 왕복 1회)
+
+        - 이미 있는 이메일이면 아무것도 하지 않고 None 반환
+        """
+        result = await self.session.execute(
+            self._insert()
+            .values(email=user_data.email, name=user_data.name)
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(*_BULK_RETURNING)
+        )
+        row = result.one_or_none()
+        return UserDTO.from_orm(row) if row else None
 
     async def get_by_email(self, email: str) -> Optional[UserDTO]:
         """이메일로 사용자 조회"""
@@ -42,13 +53,31 @@ class UserRepository:
             select(User)
             .offset(skip)
             .limit(limit)
-            .order_by(User.created_at.desc())
+            .order_by(User.created_at.desc(), User.email.desc())
         )
         users = result.scalars().all()
         return [UserDTO.from_orm(user) for user in users]
 
+    async def get_all_by_cursor(
+        self,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, str]] = None
+    ) -> List[UserDTO]:
+        """
+        모든 사용자 조회 (커서 페이징)
+
+        - after: 이전 페이지 마지막 사용자의 (created_at, email), 그 다음 사용자부터 조회
+        - (created_at, email) 인덱스를 따라 바로 위치를 찾으므로 페이지 깊이와 무관하게 일정한 비용
+        """
+        query = select(User).order_by(User.created_at.desc(), User.email.desc()).limit(limit)
+        if after is not None:
+            query = query.where(tuple_(User.created_at, User.email) < tuple_(*after))
+        result = await self.session.execute(query)
+        users = result.scalars().all()
+        return [UserDTO.from_orm(user) for user in users]
+
     async def update(self, email: str, user_data: UserUpdateDTO) -> Optional[UserDTO]:
-        """사용자 정보 업데이트"""
+        """사용자 정보 업데이트 (UPDATE ... RETURNING, 없는 사용자면 None)"""
         
         update_data = {k: v for k, v in user_data.model_dump().items() if v is not None}
         
@@ -65,7 +94,7 @@ class UserRepository:
         return UserDTO.from_orm(user) if user else None
 
     async def delete(self, email: str) -> bool:
-        """사용자 삭제"""
+        """사용자 삭제 (없는 사용자면 False)"""
         result = await self.session.execute(
             delete(User).where(User.email == email)
         )
@@ -82,4 +111,124 @@ class UserRepository:
     async def count_all(self) -> int:
         """전체 사용자 수 조회"""
         result = await self.session.execute(select(func.count(User.email)))
-        return result.scalar()
\ No newline at end of file
+        return result.scalar()
+
+    async def count_estimated(self) -> Optional[int]:
+        """
+        전체 사용자 수 추정치 (PostgreSQL 플래너 통계, 테이블 스캔 없음)
+
+        - ANALYZE/autovacuum 시점 기준이므로 최근 변경은 반영되지 않을 수 있음
+        - PostgreSQL이 아니거나 통계가 아직 없으면 None
+        """
+        if self._dialect_name() != "postgresql":
+            return None
+        result = await self.session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": f'"{User.__tablename__}"'}
+        )
+        estimate = result.scalar()
+        return estimate if estimate is not None and estimate >= 0 else None
+
+    async def bulk_create(
+        self,
+        users: List[UserCreateDTO],
+        batch_size: int = 1000,
+        copy_threshold: Optional[int] = None
+    ) -> List[UserDTO]:
+        """
+        사용자 일괄 생성 (INSERT ... ON CONFLICT DO NOTHING, batch_size 행씩 한 문장)
+
+        - 이미 있는 이메일은 건너뛰고, 실제로 생성된 사용자만 반환
+        - copy_threshold 이상이고 asyncpg면 COPY 경로 사용
+        """
+        if self._use_copy(users, copy_threshold):
+            return [user for user, _ in await self._copy_insert(users, upsert=False)]
+
+        created: List[UserDTO] = []
+        for batch in _batches(users, batch_size):
+            stmt = (
+                self._insert()
+                .values([{"email": user.email, "name": user.name} for user in batch])
+                .on_conflict_do_nothing(index_elements=[User.email])
+                .returning(*_BULK_RETURNING)
+            )
+            result = await self.session.execute(stmt)
+            created += [UserDTO.from_orm(row) for row in result]
+        return created
+
+    async def bulk_upsert(
+        self,
+        users: List[UserCreateDTO],
+        batch_size: int = 1000,
+        copy_threshold: Optional[int] = None
+    ) -> List[Tuple[UserDTO, bool]]:
+        """
+        사용자 일괄 생성/갱신 (INSERT ... ON CONFLICT DO UPDATE, batch_size 행씩 한 문장)
+
+        - (사용자, 새로 생성 여부) 목록 반환, 이미 있던 이메일은 이름만 갱신
+        - 같은 문장 안에 같은 이메일이 두 번 있으면 PostgreSQL이 거부하므로 호출자가 중복을 제거해야 함
+        """
+        if self._use_copy(users, copy_threshold):
+            return await self._copy_insert(users, upsert=True)
+
+        is_postgres = self._dialect_name() == "postgresql"
+        written: List[Tuple[UserDTO, bool]] = []
+        for batch in _batches(users, batch_size):
+            stmt = self._insert().values([{"email": user.email, "name": user.name} for user in batch])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[User.email],
+                set_={"name": stmt.excluded.name}
+            )
+            if is_postgres:
+                # 충돌로 갱신된 행은 xmax가 설정되므로 xmax = 0 이면 새로 삽입된 행
+                result = await self.session.execute(
+                    stmt.returning(*_BULK_RETURNING, literal_column("xmax = 0").label("inserted"))
+                )
+                written += [(UserDTO.from_orm(row), row.inserted) for row in result]
+            else:
+                existing = set((await self.session.execute(
+                    select(User.email).where(User.email.in_([user.email for user in batch]))
+                )).scalars())
+                result = await self.session.execute(stmt.returning(*_BULK_RETURNING))
+                written += [(UserDTO.from_orm(row), row.email not in existing) for row in result]
+        return written
+
+    async def _copy_insert(self, users: List[UserCreateDTO], upsert: bool) -> List[Tuple[UserDTO, bool]]:
+        """
+        asyncpg COPY로 임시 테이블에 적재한 뒤 INSERT ... SELECT ... ON CONFLICT 한 문장으로 반영
+
+        - 행 수와 무관하게 왕복 4회, 파라미터 바인딩/문장 파싱 비용이 없어 대량 적재에 유리
+        - 임시 테이블은 트랜잭션 종료 시 삭제
+        """
+        staging = f"user_import_{uuid.uuid4().hex[:12]}"
+        await self.session.execute(text(
+            f"CREATE TEMP TABLE {staging} (email varchar(255), name varchar(255)) ON COMMIT DROP"
+        ))
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            staging,
+            records=[(user.email, user.name) for user in users],
+            columns=["email", "name"]
+        )
+        on_conflict = "DO UPDATE SET name = EXCLUDED.name" if upsert else "DO NOTHING"
+        result = await self.session.execute(text(
+            f'INSERT INTO "{User.__tablename__}" (email, name) SELECT email, name FROM {staging} '
+            f"ON CONFLICT (email) {on_conflict} "
+            "RETURNING email, name, created_at, xmax = 0 AS inserted"
+        ))
+        return [(UserDTO.from_orm(row), row.inserted) for row in result]
+
+    def _dialect_name(self) -> str:
+        return self.session.get_bind().dialect.name
+
+    def _insert(self):
+        """ON CONFLICT를 지원하는 방언별 INSERT"""
+        if self._dialect_name() == "postgresql":
+            return postgresql.insert(User)
+        return sqlite.insert(User)
+
+    def _use_copy(self, users: List[UserCreateDTO], copy_threshold: Optional[int]) -> bool:
+        if copy_threshold is None or len(users) < copy_threshold:
+            return False
+        return self.session.get_bind().dialect.driver == "asyncpg"
\ No newline at end of file
@@ -29,6 +29,23 @@ class UserUpdateRequest(BaseModel):
         }
 
 
+class UserBulkCreateRequest(BaseModel):
+    """User 일괄 생성 요청 스키마"""
+    users: List[UserCreateRequest] = Field(..., min_length=1, description="생성할 사용자 목록")
+    upsert: bool = Field(False, description="이미 있는 이메일이면 이름 갱신 (false면 건너뜀)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "users": [
+                    {"email": "user1@example.com", "name": "홍길동"},
+                    {"email": "user2@example.com", "name": "김철수"}
+                ],
+                "upsert": False
+            }
+        }
+
+
 class UserResponse(BaseModel):
     """User 응답 스키마"""
     email: EmailStr = Field(..., description="사용자 이메일")
@@ -52,7 +69,8 @@ class UserResponse(BaseModel):
 class UserListResponse(BaseModel):
     """User 목록 응답 스키마"""
     users: List[UserResponse] = Field(..., description="사용자 목록")
-    total: int = Field(..., description="전체 사용자 수")
+    total: Optional[int] = Field(None, description="전체 사용자 수 (count 방식에 따라 추정치이거나 없음)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지거나 skip 페이징이면 없음)")
 
     class Config:
         json_schema_extra = {
@@ -69,7 +87,39 @@ class UserListResponse(BaseModel):
                         "created_at": "2024-01-02T00:00:00"
                     }
                 ],
-                "total": 2
+                "total": 2,
+                "next_cursor": "eyJjIjoiMjAyNC0wMS0wMlQwMDowMDowMCIsImUiOiJ1c2VyMkBleGFtcGxlLmNvbSJ9"
+            }
+        }
+
+
+class UserBulkResultResponse(BaseModel):
+    """User 일괄 생성 행별 결과 스키마"""
+    email: EmailStr = Field(..., description="사용자 이메일")
+    status: str = Field(..., description="처리 결과 (created/updated/skipped/duplicate/failed)")
+    created_at: Optional[datetime] = Field(None, description="생성 일시 (created/updated일 때)")
+    error: Optional[str] = Field(None, description="실패 사유 (failed일 때)")
+
+
+class UserBulkCreateResponse(BaseModel):
+    """User 일괄 생성 응답 스키마"""
+    results: List[UserBulkResultResponse] = Field(..., description="요청 순서대로의 행별 결과")
+    created: int = Field(..., description="생성된 사용자 수")
+    updated: int = Field(..., description="갱신된 사용자 수")
+    skipped: int = Field(..., description="건너뛴 행 수 (이미 있음 또는 요청 내 중복)")
+    failed: int = Field(0, description="DB 오류로 저장하지 못한 행 수")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "results": [
+                    {"email": "user1@example.com", "status": "created", "created_at": "2024-01-01T00:00:00"},
+                    {"email": "user2@example.com", "status": "skipped", "created_at": None}
+                ],
+                "created": 1,
+                "updated": 0,
+                "skipped": 1,
+                "failed": 0
             }
         }
 
@@ -1,9 +1,14 @@
+import re
 import json
 import asyncio
-from typing import AsyncGenerator, Optional, Dict, Any
+from typing import AsyncGenerator, List, Optional, Dict, Any, Tuple
 
 from app.core.logger import get_logger
+from app.core.lock.scripts import ScriptCache
 from app.core.redis import RedisClient
+from app.core.pubsub_hub import get_pubsub_hub
+from app.core.redis_client_cache import get_redis_client_cache
+from app.core.job_queue import get_job_queue
 from app.repository.progress import ProgressRepository
 from app.util.id_generator import generate_progress_id
 
@@ -12,6 +17,12 @@ logger = get_logger("progress_service")
 # Redis TTL 상수
 PROGRESS_TTL = 300  # 5분
 
+# 진행률 스트림 최대 길이 (근사 트리밍)
+PROGRESS_STREAM_MAXLEN = 100
+
+# Pub/Sub 메시지가 없을 때 스트림을 직접 확인하는 폴백 주기 (초)
+PROGRESS_FALLBACK_POLL_INTERVAL = 15
+
 # 진행 단계 정의
 PROGRESS_STEPS = [
     {"step": 1, "message": "요청 접수 완료"},
@@ -21,47 +32,140 @@ PROGRESS_STEPS = [
     {"step": 5, "message": "처리 완료"},
 ]
 
+# 스트림 엔트리 타입: (엔트리 ID, 진행률 데이터)
+StreamEntry = Tuple[str, Dict[str, Any]]
+
+# SSE 이벤트 ID: "{progress_key}:{스트림 엔트리 ID}" (progress_key 없이 엔트리 ID만 온 경우도 허용)
+_EVENT_ID_PATTERN = re.compile(r"^(?:(?P<key>\w+):)?(?P<entry>\d+-\d+)$")
+
+# 진행 이벤트보다 앞선 위치 (init 이벤트 ID, 스트림 처음부터 replay)
+_STREAM_START_ID = "0-0"
+
 
 class ProgressService:
     """진행률 관리 서비스"""
 
-    # 실행 중인 백그라운드 태스크 관리
-    _running_tasks: Dict[str, asyncio.Task] = {}
+    # 분산 작업 큐에 등록되는 작업 타입
+    JOB_TYPE = "progress"
+
+    # 스트림 추가 + TTL 갱신 + 엔트리 ID를 포함한 이벤트 발행을 원자적으로 수행
+    APPEND_SCRIPT = """
+    local id = redis.call("XADD", KEYS[1], "MAXLEN", "~", ARGV[1], "*", "data", ARGV[2])
+    redis.call("EXPIRE", KEYS[1], ARGV[3])
+    redis.call("PUBLISH", ARGV[4], '{"id":"' .. id .. '","data":' .. ARGV[2] .. '}')
+    return id
+    """
+    # 스크립트는 Redis 클라이언트별로 한 번만 등록하고 EVALSHA로 호출
+    _scripts = ScriptCache()
 
     @staticmethod
-    def _redis_key(progress_key: str) -> str:
-        """Redis 키 생성"""
-        return f"progress:{progress_key}"
+    def _stream_key(progress_key: str) -> str:
+        """진행률 스트림 키 생성"""
+        return f"progress:stream:{progress_key}"
 
     @staticmethod
-    async def _update_redis(progress_key: str, step_data: Dict[str, Any]) -> None:
-        """Redis에 진행률 업데이트"""
-        client = await RedisClient.get_client()
-        key = ProgressService._redis_key(progress_key)
-        await client.set(key, json.dumps(step_data), ex=PROGRESS_TTL)
+    def _channel(progress_key: str) -> str:
+        """진행률 이벤트 Pub/Sub 채널 생성"""
+        return f"progress:channel:{progress_key}"
+
+    @staticmethod
+    def _sse(event: str, data: Dict[str, Any], event_id: Optional[str] = None) -> str:
+        """SSE 이벤트 문자열 생성 (event_id가 있으면 id: 필드 포함)"""
+        prefix = f"id: {event_id}\n" if event_id else ""
+        return f"{prefix}event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    @staticmethod
+    def _event_id(progress_key: str, entry_id: str) -> str:
+        """SSE 이벤트 ID 생성 (재접속 시 Last-Event-ID만으로 작업과 위치를 찾을 수 있도록)"""
+        return f"{progress_key}:{entry_id}"
+
+    @staticmethod
+    def _parse_event_id(event_id: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """Last-Event-ID → (progress_key, 엔트리 ID), 형식이 잘못됐으면 (None, None)"""
+        match = _EVENT_ID_PATTERN.match(event_id or "")
+        if not match:
+            return None, None
+        return match.group("key"), match.group("entry")
+
+    @staticmethod
+    def _parse_stream_id(entry_id: str) -> Tuple[int, int]:
+        ms, _, seq = entry_id.partition("-")
+        return int(ms), int(seq or 0)
+
+    @staticmethod
+    def _is_after(entry_id: str, last_id: Optional[str]) -> bool:
+        """entry_id가 last_id 이후의 엔트리인지 비교"""
+        if not last_id:
+            return True
+        return ProgressService._parse_stream_id(entry_id) > ProgressService._parse_stream_id(last_id)
 
     @staticmethod
-    async def _get_redis(progress_key: str) -> Optional[Dict[str, Any]]:
-        """Redis에서 진행률 조회"""
+    async def _update_redis(progress_key: str, step_data: Dict[str, Any]) -> str:
+        """진행률 스트림에 단계 추가 + 구독자에게 발행 (한 번의 왕복), 엔트리 ID 반환"""
         client = await RedisClient.get_client()
-        key = ProgressService._redis_key(progress_key)
-        data = await client.get(key)
-        if data:
-            return json.loads(data)
-        return None
+        append = ProgressService._scripts.get(client, ProgressService.APPEND_SCRIPT)
+        return await append(
+            keys=[ProgressService._stream_key(progress_key)],
+            args=[
+                PROGRESS_STREAM_MAXLEN,
+                json.dumps(step_data),
+                PROGRESS_TTL,
+                ProgressService._channel(progress_key),
+            ]
+        )
 
     @staticmethod
-    async def _delete_redis(progress_key: str) -> None:
-        """Redis에서 진행률 삭제"""
+    async def _get_latest(progress_key: str) -> Optional[StreamEntry]:
+        """스트림의 마지막 엔트리 조회 (클라이언트 사이드 캐시 활성화 시 로컬 캐시 우선)"""
+        entries = await get_redis_client_cache().execute(
+            "XREVRANGE", ProgressService._stream_key(progress_key), "+", "-", "COUNT", 1
+        )
+        if not entries:
+            return None
+        entry_id, fields = entries[0]
+        return entry_id, json.loads(fields["data"])
+
+    @staticmethod
+    async def _read_after(progress_key: str, last_id: Optional[str]) -> Optional[List[StreamEntry]]:
+        """
+        last_id 이후의 엔트리를 XREAD로 조회
+
+        Returns:
+            스트림이 없으면 None, 있으면 (비어 있을 수 있는) 엔트리 목록
+        """
         client = await RedisClient.get_client()
-        key = ProgressService._redis_key(progress_key)
-        await client.delete(key)
+        key = ProgressService._stream_key(progress_key)
+        result = await client.xread({key: last_id or "0-0"})
+        if not result:
+            return [] if await client.exists(key) else None
+        _, entries = result[0]
+        return [(entry_id, json.loads(fields["data"])) for entry_id, fields in entries]
+
+    @staticmethod
+    async def run_job(payload: Dict[str, Any]) -> None:
+        """작업 큐 핸들러 (어느 워커 프로세스에서든 실행됨)"""
+        await ProgressService._run_progress(payload["user_id"], payload["progress_key"])
 
     @staticmethod
     async def _run_progress(user_id: str, progress_key: str) -> None:
-        """백그라운드에서 실행되는 실제 진행 작업 (SSE 연결과 독립적)"""
+        """
+        실제 진행 작업 (SSE 연결과 독립적)
+
+        - 다른 워커가 회수(reclaim)한 작업이면 스트림의 마지막 단계 이후부터 이어서 진행
+        """
+        latest = await ProgressService._get_latest(progress_key)
+        last_step = 0
+        if latest:
+            _, data = latest
+            if data.get("status") != "in_progress":
+                # 이전 워커가 완료/실패 처리까지 마친 작업
+                return
+            last_step = data.get("current_step", 0)
+            if last_step:
+                logger.bind(progress_key=progress_key, step=last_step).info("진행률 작업 이어서 실행")
+
         try:
-            for step_info in PROGRESS_STEPS:
+            for step_info in PROGRESS_STEPS[last_step:]:
                 await asyncio.sleep(10)  # 10초 간격
 
                 step_data = {
@@ -80,63 +184,98 @@ class ProgressService:
                     step=step_info["step"]
                 ).debug("진행률 업데이트")
 
-            # 완료 처리: MongoDB 먼저 업데이트 → Redis 삭제
+            # 완료 처리: 스트림은 재접속 replay를 위해 TTL까지 유지
             await ProgressRepository.update_end_status(progress_key, end=True)
-            await ProgressService._delete_redis(progress_key)
             logger.bind(progress_key=progress_key).info("진행률 추적 완료")
 
         except Exception as e:
             logger.bind(progress_key=progress_key, error=str(e)).error("진행률 처리 중 오류")
             await ProgressRepository.update_end_status(progress_key, end=False)
-            await ProgressService._delete_redis(progress_key)
-        finally:
-            ProgressService._running_tasks.pop(progress_key, None)
+            await ProgressService._update_redis(progress_key, {
+                "progress_key": progress_key,
+                "user_id": user_id,
+                "status": "failed"
+            })
+
+    @staticmethod
+    async def _final_event(progress_key: str, user_id: str) -> str:
+        """스트림이 사라졌거나 실패한 뒤 MongoDB의 최종 상태로 종료 이벤트 생성"""
+        progress = await ProgressRepository.find_by_key(progress_key)
+
+        if progress and progress.end is True:
+            return ProgressService._sse("done", {
+                "progress_key": progress_key,
+                "user_id": user_id,
+                "status": "completed",
+                "message": "처리 완료"
+            })
+
+        # end=None 또는 end=False → 실패
+        if progress and progress.end is None:
+            await ProgressRepository.update_end_status(progress_key, end=False)
+        return ProgressService._sse("failed", {
+            "progress_key": progress_key,
+            "user_id": user_id,
+            "status": "failed",
+            "message": "서버 비정상 종료로 인해 진행이 실패했습니다"
+        })
+
+    @staticmethod
+    def _subscription(progress_key: str):
+        """
+        진행률 채널 구독 (상태 조회/작업 시작 전에 구독해야 이벤트 유실이 없음)
+
+        - 같은 progress_key를 보는 여러 SSE 연결은 프로세스당 하나의 Redis 구독을 공유
+        """
+        return get_pubsub_hub().subscribe(ProgressService._channel(progress_key))
 
     @staticmethod
-    async def _poll_progress(progress_key: str, user_id: str) -> AsyncGenerator[str, None]:
-        """Redis를 폴링하며 진행률 변경 시 SSE 이벤트 전송"""
-        last_step = -1
+    async def _stream_progress(
+        progress_key: str,
+        user_id: str,
+        queue: asyncio.Queue,
+        last_id: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        last_id 이후의 진행률 이벤트를 전달
+
+        - 먼저 스트림에서 놓친 엔트리를 replay 한 뒤, Pub/Sub 이벤트를 즉시 전달
+        - 메시지가 PROGRESS_FALLBACK_POLL_INTERVAL 동안 없으면 스트림을 직접 확인 (폴백)
+        - 엔트리 ID로 중복을 제거하므로 replay와 Pub/Sub이 겹쳐도 한 번만 전송
+        """
+        entries = await ProgressService._read_after(progress_key, last_id)
 
         while True:
-            await asyncio.sleep(2)  # 2초 간격 폴링
-
-            current_data = await ProgressService._get_redis(progress_key)
-
-            if not current_data:
-                # Redis에서 사라짐 → MongoDB에서 최종 상태 확인
-                progress = await ProgressRepository.find_by_key(progress_key)
-
-                if progress and progress.end is True:
-                    data = json.dumps({
-                        "progress_key": progress_key,
-                        "user_id": user_id,
-                        "status": "completed",
-                        "message": "처리 완료"
-                    })
-                    yield f"event: done\ndata: {data}\n\n"
-                else:
-                    # end=None 또는 end=False → 실패
-                    if progress and progress.end is None:
-                        await ProgressRepository.update_end_status(progress_key, end=False)
-                    data = json.dumps({
-                        "progress_key": progress_key,
-                        "user_id": user_id,
-                        "status": "failed",
-                        "message": "서버 비정상 종료로 인해 진행이 실패했습니다"
-                    })
-                    yield f"event: failed\ndata: {data}\n\n"
+            if entries is None:
+                # 스트림 없음 → 만료(작업 프로세스 비정상 종료) 또는 정리됨
+                yield await ProgressService._final_event(progress_key, user_id)
                 return
 
-            current_step = current_data.get("current_step", -1)
+            for entry_id, data in entries:
+                if not ProgressService._is_after(entry_id, last_id):
+                    continue
+                last_id = entry_id
 
-            # 단계가 변경되었을 때만 이벤트 전송
-            if current_step != last_step:
-                yield f"event: progress\ndata: {json.dumps(current_data)}\n\n"
-                last_step = current_step
+                if data.get("status") == "failed":
+                    yield await ProgressService._final_event(progress_key, user_id)
+                    return
 
-            # 완료 상태면 종료
-            if current_data.get("status") == "completed":
-                return
+                yield ProgressService._sse(
+                    "progress", data, event_id=ProgressService._event_id(progress_key, entry_id)
+                )
+
+                # 완료 상태면 종료
+                if data.get("status") == "completed":
+                    return
+
+            try:
+                message = await asyncio.wait_for(
+                    queue.get(), timeout=PROGRESS_FALLBACK_POLL_INTERVAL
+                )
+                entries = [(message["id"], message["data"])]
+            except asyncio.TimeoutError:
+                # 폴백: 발행이 유실됐거나 작업 프로세스가 죽은 경우
+                entries = await ProgressService._read_after(progress_key, last_id)
 
     @staticmethod
     async def start_progress(user_id: str) -> AsyncGenerator[str, None]:
@@ -157,65 +296,104 @@ class ProgressService:
         )
         logger.bind(user_id=user_id, progress_key=progress_key).info("진행률 추적 시작")
 
-        # 백그라운드 태스크로 실제 작업 실행 (SSE 연결과 독립적)
-        task = asyncio.create_task(
-            ProgressService._run_progress(user_id, progress_key)
-        )
-        ProgressService._running_tasks[progress_key] = task
-
-        # 초기 이벤트: progress_key 전달
-        init_data = json.dumps({
-            "progress_key": progress_key,
-            "user_id": user_id,
-            "total_steps": len(PROGRESS_STEPS),
-            "status": "started"
-        })
-        yield f"event: init\ndata: {init_data}\n\n"
+        # 작업 시작 전에 구독해야 첫 단계 이벤트를 놓치지 않음
+        async with ProgressService._subscription(progress_key) as queue:
+            # 분산 작업 큐에 제출 (SSE 연결/프로세스와 독립적으로 실행)
+            await get_job_queue().enqueue(
+                ProgressService.JOB_TYPE,
+                {"user_id": user_id, "progress_key": progress_key},
+                job_id=progress_key
+            )
+
+            # 초기 이벤트: progress_key 전달 (ID가 있어 첫 단계 전에 끊겨도 처음부터 이어보기)
+            yield ProgressService._sse("init", {
+                "progress_key": progress_key,
+                "user_id": user_id,
+                "total_steps": len(PROGRESS_STEPS),
+                "status": "started"
+            }, event_id=ProgressService._event_id(progress_key, _STREAM_START_ID))
 
-        # Redis 폴링으로 진행률 스트리밍
-        async for event in ProgressService._poll_progress(progress_key, user_id):
-            yield event
+            # 스트림 처음부터 진행률 스트리밍
+            async for event in ProgressService._stream_progress(progress_key, user_id, queue):
+                yield event
 
     @staticmethod
-    async def search_progress(user_id: str) -> AsyncGenerator[str, None]:
-        """사용자의 진행률 이어보기 SSE 스트림 (/search)"""
-        # MongoDB에서 진행 중인(end=None) 레코드 조회
-        progress = await ProgressRepository.find_active_by_user(user_id)
-
-        if not progress:
-            data = json.dumps({"user_id": user_id, "status": "no_active_progress"})
-            yield f"event: done\ndata: {data}\n\n"
-            return
+    async def search_progress(
+        user_id: str,
+        last_event_id: Optional[str] = None,
+        progress_key: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        사용자의 진행률 이어보기 SSE 스트림 (/search)
+
+        - 대상 작업: progress_key → Last-Event-ID에 담긴 progress_key → 사용자의 가장 최근 진행 중 작업 순
+        - progress_key로 찾은 작업은 완료/실패 여부와 관계없이 이어보기 (끊긴 사이에 끝난 작업도 남은 이벤트 전달)
+        - last_event_id(SSE Last-Event-ID)가 있으면 그 이후의 엔트리만 replay
+        - 없으면 현재 상태를 resume 이벤트로 보낸 뒤 이어서 스트리밍
+        """
+        # 형식이 잘못된 Last-Event-ID는 무시하고 현재 상태부터 전송
+        event_key, last_id = ProgressService._parse_event_id(last_event_id)
+        if progress_key and event_key and event_key != progress_key:
+            # 다른 작업의 이벤트 ID → 위치 정보로 쓸 수 없음
+            last_id = None
+        progress_key = progress_key or event_key
+
+        if progress_key:
+            progress = await ProgressRepository.find_by_key(progress_key)
+            if progress and progress.user_id != user_id:
+                progress = None
+            if not progress:
+                yield ProgressService._sse("done", {
+                    "progress_key": progress_key,
+                    "user_id": user_id,
+                    "status": "not_found"
+                })
+                return
+        else:
+            # MongoDB에서 진행 중인(end=None) 가장 최근 레코드 조회
+            progress = await ProgressRepository.find_active_by_user(user_id)
+            if not progress:
+                yield ProgressService._sse("done", {"user_id": user_id, "status": "no_active_progress"})
+                return
+            progress_key = progress.progress_key
+
+        # 현재 상태 조회 전에 구독 (조회와 구독 사이의 이벤트 유실 방지)
+        async with ProgressService._subscription(progress_key) as queue:
+            if last_id:
+                async for event in ProgressService._stream_progress(
+                    progress_key, user_id, queue, last_id=last_id
+                ):
+                    yield event
+                return
 
-        progress_key = progress.progress_key
+            latest = await ProgressService._get_latest(progress_key)
 
-        # Redis에서 현재 진행 상태 조회
-        redis_data = await ProgressService._get_redis(progress_key)
+            if not latest:
+                # 스트림 없음 → 보존 기간이 지났거나 서버 비정상 종료 (최종 상태는 MongoDB 기준)
+                logger.bind(
+                    user_id=user_id,
+                    progress_key=progress_key
+                ).warning("Redis 데이터 없음 - 실패 처리")
+                yield await ProgressService._final_event(progress_key, user_id)
+                return
 
-        if not redis_data:
-            # end=None인데 Redis에도 없음 → 서버 비정상 종료로 인한 실패
-            await ProgressRepository.update_end_status(progress_key, end=False)
-            logger.bind(
-                user_id=user_id,
-                progress_key=progress_key
-            ).warning("Redis 데이터 없음 - 실패 처리")
+            entry_id, redis_data = latest
 
-            data = json.dumps({
-                "user_id": user_id,
-                "progress_key": progress_key,
-                "status": "failed",
-                "message": "서버 비정상 종료로 인해 진행이 실패했습니다"
-            })
-            yield f"event: failed\ndata: {data}\n\n"
-            return
+            if redis_data.get("status") == "failed":
+                yield await ProgressService._final_event(progress_key, user_id)
+                return
 
-        # 현재 상태를 resume 이벤트로 즉시 전송
-        yield f"event: resume\ndata: {json.dumps(redis_data)}\n\n"
+            # 현재 상태를 resume 이벤트로 즉시 전송
+            yield ProgressService._sse(
+                "resume", redis_data, event_id=ProgressService._event_id(progress_key, entry_id)
+            )
 
-        # 이미 완료 상태면 종료
-        if redis_data.get("status") == "completed":
-            return
+            # 이미 완료 상태면 종료
+            if redis_data.get("status") == "completed":
+                return
 
-        # Redis 폴링으로 나머지 진행률 이어서 스트리밍
-        async for event in ProgressService._poll_progress(progress_key, user_id):
-            yield event
+            # 나머지 진행률 이어서 스트리밍
+            async for event in ProgressService._stream_progress(
+                progress_key, user_id, queue, last_id=entry_id
+            ):
+                yield event
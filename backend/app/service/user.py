@@ -1,9 +1,28 @@
-from typing import List, Optional, Tuple
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.exc import DBAPIError
 
-from app.database.session import UnitOfWork, transactional
+from app.config.setting import settings
+from app.core.cache import PydanticSerializer, cached, cache_evict, get_cache_service
+from app.core.redis import RedisClient
+from app.core.single_flight import single_flight
+from app.database.session import Propagation, UnitOfWork, in_write_transaction, transactional
 from app.repository.user import UserRepository
-from app.dto.user import UserCreateDTO, UserUpdateDTO, UserDTO
+from app.dto.user import (
+    UserCreateDTO,
+    UserUpdateDTO,
+    UserDTO,
+    CountStrategy,
+    BulkStatus,
+    UserBulkResultDTO,
+)
+from app.util.cursor import encode_cursor, decode_cursor
+
+
+# 사용자 조회 캐시 네임스페이스 (키: 이메일)
+USER_CACHE_NAMESPACE = "user"
+
+# 전체 사용자 수 캐시 키 (이메일과 겹치지 않음)
+USER_COUNT_CACHE_KEY = "count"
 
 
 class UserService:
@@ -12,64 +31,206 @@ class UserService:
     def __init__(self, uow: UnitOfWork = None):
         self.uow = uow
 
+    @cache_evict(USER_CACHE_NAMESPACE, key="{user_data.email}")
     @transactional
     async def create_user(self, user_data: UserCreateDTO) -> UserDTO:
-        """사용자 생성"""
+        """사용자 생성 (중복 여부는 INSERT 결과로 판단)"""
         user_repo = UserRepository(self._session)
         
-        existing_user = await user_repo.get_by_email(user_data.email)
-        if existing_user:
+        created_user = await user_repo.create(user_data)
+        if created_user is None:
             raise ValueError(f"User with email {user_data.email} already exists")
         
-        return await user_repo.create(user_data)
+        return created_user
 
-    async def create_user_with_session(self, session: AsyncSession, user_data: UserCreateDTO) -> UserDTO:
-        """사용자 생성 (컨트롤러 레벨 트랜잭션용)"""
-        user_repo = UserRepository(session)
+    @cache_evict(USER_CACHE_NAMESPACE)
+    @transactional
+    async def bulk_create_users(self, users: List[UserCreateDTO], upsert: bool = False) -> List[UserBulkResultDTO]:
+        """
+        사용자 일괄 생성 (행별 결과를 입력 순서대로 반환)
+
+        - 같은 요청 안에서 중복된 이메일은 첫 행만 반영하고 나머지는 duplicate
+        - upsert=False면 이미 있는 이메일은 skipped, True면 이름을 갱신하고 updated
+        - 행 단위 조회 없이 배치 INSERT(대량이면 COPY)로 처리, 완료 후 사용자 캐시 네임스페이스 무효화
+        - 배치가 실패하면 그 배치만 SAVEPOINT로 되돌리고 반씩 나눠 다시 넣어, 실패한 행만 failed
+        """
+        if len(users) > settings.USER_BULK_MAX_ROWS:
+            raise ValueError(f"Too many users: {len(users)} > {settings.USER_BULK_MAX_ROWS}")
         
-        existing_user = await user_repo.get_by_email(user_data.email)
-        if existing_user:
-            raise ValueError(f"User with email {user_data.email} already exists")
+        unique: Dict[str, UserCreateDTO] = {}
+        for user in users:
+            unique.setdefault(user.email, user)
+        
+        rows = list(unique.values())
+        # COPY 대상이면 한 번에, 아니면 배치 크기만큼씩 시도
+        size = len(rows) if len(rows) >= settings.USER_BULK_COPY_THRESHOLD else settings.USER_BULK_BATCH_SIZE
+        by_email: Dict[str, Tuple[UserDTO, bool]] = {}
+        errors: Dict[str, str] = {}
+        for start in range(0, len(rows), size):
+            await self._write_chunk(rows[start:start + size], upsert, by_email, errors)
         
-        return await user_repo.create(user_data)
+        results: List[UserBulkResultDTO] = []
+        seen = set()
+        for user in users:
+            if user.email in seen:
+                results.append(UserBulkResultDTO(email=user.email, status=BulkStatus.DUPLICATE))
+                continue
+            seen.add(user.email)
+            if user.email in errors:
+                results.append(UserBulkResultDTO(email=user.email, status=BulkStatus.FAILED, error=errors[user.email]))
+                continue
+            if user.email not in by_email:
+                results.append(UserBulkResultDTO(email=user.email, status=BulkStatus.SKIPPED))
+                continue
+            saved, inserted = by_email[user.email]
+            status = BulkStatus.CREATED if inserted else BulkStatus.UPDATED
+            results.append(UserBulkResultDTO(email=user.email, status=status, user=saved))
+        
+        return results
 
-    @transactional
+    async def _write_chunk(
+        self,
+        rows: List[UserCreateDTO],
+        upsert: bool,
+        written: Dict[str, Tuple[UserDTO, bool]],
+        errors: Dict[str, str],
+    ) -> None:
+        """
+        한 묶음 쓰기, DB 오류가 나면 묶음을 반으로 나눠 다시 시도 (실패한 행만 errors에 기록)
+
+        - 실패한 행이 k개면 SAVEPOINT 왕복은 행 수가 아닌 약 k·log2(묶음 크기)회
+        """
+        try:
+            written.update(await self._write_users(rows, upsert))
+        except DBAPIError as e:
+            if len(rows) == 1:
+                errors[rows[0].email] = str(e.orig)
+                return
+            middle = len(rows) // 2
+            await self._write_chunk(rows[:middle], upsert, written, errors)
+            await self._write_chunk(rows[middle:], upsert, written, errors)
+
+    @transactional(propagation=Propagation.NESTED)
+    async def _write_users(self, rows: List[UserCreateDTO], upsert: bool) -> Dict[str, Tuple[UserDTO, bool]]:
+        """일괄 생성의 한 묶음 쓰기 (SAVEPOINT 안에서 실행), 이메일별 (사용자, 새로 생성 여부) 반환"""
+        user_repo = UserRepository(self._session)
+        
+        batch_size, copy_threshold = settings.USER_BULK_BATCH_SIZE, settings.USER_BULK_COPY_THRESHOLD
+        if upsert:
+            written = await user_repo.bulk_upsert(rows, batch_size=batch_size, copy_threshold=copy_threshold)
+        else:
+            created = await user_repo.bulk_create(rows, batch_size=batch_size, copy_threshold=copy_threshold)
+            written = [(user, True) for user in created]
+        
+        return {user.email: (user, inserted) for user, inserted in written}
+
+    @cached(
+        USER_CACHE_NAMESPACE,
+        key="{email}",
+        ttl=RedisClient.SHORT_CACHE_TTL,
+        serializer=PydanticSerializer(UserDTO),
+    )
+    @single_flight(
+        USER_CACHE_NAMESPACE,
+        key="{email}",
+        distributed=True,
+        serializer=PydanticSerializer(UserDTO),
+    )
+    @transactional(readonly=True, use_replica=False)
     async def get_user_by_email(self, email: str) -> Optional[UserDTO]:
-        """이메일로 사용자 조회"""
+        """이메일로 사용자 조회 (결과가 1시간 캐시되므로 지연이 있는 replica 대신 primary에서 조회)"""
         user_repo = UserRepository(self._session)
         return await user_repo.get_by_email(email)
 
-    @transactional
-    async def get_all_users(self, skip: int = 0, limit: int = 100) -> Tuple[List[UserDTO], int]:
-        """모든 사용자 조회 (페이징 포함)"""
+    async def _count_users(self, user_repo: UserRepository, count: Optional[CountStrategy]) -> Optional[int]:
+        """전체 사용자 수 계산 (count가 없으면 settings.USER_COUNT_STRATEGY)"""
+        strategy = CountStrategy(count or settings.USER_COUNT_STRATEGY)
+        
+        if strategy == CountStrategy.NONE:
+            return None
+        
+        if strategy == CountStrategy.ESTIMATED:
+            estimate = await user_repo.count_estimated()
+            # 통계가 없거나 작은 테이블은 정확히 계산해도 충분히 빠름
+            if estimate is not None and estimate >= settings.USER_COUNT_EXACT_THRESHOLD:
+                return estimate
+            return await user_repo.count_all()
+        
+        # 쓰기 트랜잭션에 참여 중이면 커밋 전 수가 캐시되지 않도록 직접 계산
+        if strategy == CountStrategy.CACHED and settings.CACHE_ENABLED and not in_write_transaction():
+            return await get_cache_service().get_or_load(
+                USER_CACHE_NAMESPACE,
+                USER_COUNT_CACHE_KEY,
+                user_repo.count_all,
+                ttl=settings.USER_COUNT_CACHE_TTL,
+            )
+        
+        return await user_repo.count_all()
+
+    @transactional(readonly=True)
+    async def get_all_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        count: Optional[CountStrategy] = None
+    ) -> Tuple[List[UserDTO], Optional[int]]:
+        """모든 사용자 조회 (페이징 포함, count 방식에 따라 전체 수는 추정치/캐시값/None일 수 있음)"""
         user_repo = UserRepository(self._session)
         
         users = await user_repo.get_all(skip=skip, limit=limit)
-        total = await user_repo.count_all()
+        total = await self._count_users(user_repo, count)
         
         return users, total
 
+    @transactional(readonly=True)
+    async def get_users_by_cursor(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        count: Optional[CountStrategy] = None
+    ) -> Tuple[List[UserDTO], Optional[int], Optional[str]]:
+        """
+        모든 사용자 조회 (커서 페이징, 전체 수는 get_all_users와 동일)
+
+        Returns:
+            (사용자 목록, 전체 수, 다음 페이지 커서 — 마지막 페이지면 None)
+        """
+        user_repo = UserRepository(self._session)
+        after = decode_cursor(cursor) if cursor else None
+        
+        # 한 건 더 조회해 다음 페이지 존재 여부 판단
+        users = await user_repo.get_all_by_cursor(limit=limit + 1, after=after)
+        total = await self._count_users(user_repo, count)
+        
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            next_cursor = encode_cursor(users[-1].created_at, users[-1].email)
+        
+        return users, total, next_cursor
+
+    @cache_evict(USER_CACHE_NAMESPACE, key="{email}")
     @transactional
     async def update_user(self, email: str, user_data: UserUpdateDTO) -> Optional[UserDTO]:
-        """사용자 정보 업데이트"""
+        """사용자 정보 업데이트 (존재 여부는 UPDATE 결과로 판단, 빈 업데이트는 조회만 수행)"""
         user_repo = UserRepository(self._session)
         
-        existing_user = await user_repo.get_by_email(email)
-        if not existing_user:
+        updated_user = await user_repo.update(email, user_data)
+        if updated_user is None:
             raise ValueError(f"User with email {email} not found")
         
         if not any(v is not None for v in user_data.model_dump().values()):
             raise ValueError("No data provided for update")
         
-        return await user_repo.update(email, user_data)
+        return updated_user
 
+    @cache_evict(USER_CACHE_NAMESPACE, key="{email}")
     @transactional
     async def delete_user(self, email: str) -> bool:
-        """사용자 삭제"""
+        """사용자 삭제 (존재 여부는 DELETE 결과로 판단)"""
         user_repo = UserRepository(self._session)
         
-        existing_user = await user_repo.get_by_email(email)
-        if not existing_user:
+        if not await user_repo.delete(email):
             raise ValueError(f"User with email {email} not found")
         
-        return await user_repo.delete(email)
\ No newline at end of file
+        return True
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+RedisLock 경합 벤치마크
+
+- polling : 100ms sleep polling 으로 SET NX 를 반복하는 기존 acquire
+- pubsub  : 해제 알림(Pub/Sub) 대기 + 지터 지수 백오프 폴백 (로컬 직렬화 없음)
+- coalesce: pubsub + 프로세스 내 로컬 락 직렬화 (현재 구조)
+
+여러 코루틴이 같은 락 이름을 두고 경합하며, 각자 획득 후 hold-ms 동안 보유합니다.
+획득 대기 시간(latency)과 서버 측 명령 수(INFO commandstats 차이)를 보고합니다.
+
+의존성: Redis (settings.REDIS_URL)
+
+실행:
+  uv run python -m benchmark.lock_contention --workers 20 --rounds 5 --hold-ms 5
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from app.core.lock import RedisLock
+from app.core.lock.redis_lock import _get_token_map
+from app.core.pubsub_hub import get_pubsub_hub
+from app.core.redis import get_redis_client, close_redis
+
+
+class _PollingRedisLock(RedisLock):
+    """기존 100ms polling acquire 를 재현하는 락"""
+
+    def __init__(self) -> None:
+        super().__init__(coalesce_local=False)
+
+    async def acquire(self, name: str, ttl: int = 30, timeout: Optional[float] = None) -> bool:
+        client = await get_redis_client()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        token = str(uuid.uuid4())
+        while True:
+            if await client.set(self._get_lock_key(name), token, nx=True, ex=ttl):
+                _get_token_map(for_write=True)[name] = token
+                return True
+            if timeout is None:
+                return False
+            elapsed = loop.time() - start_time
+            if timeout and elapsed >= timeout:
+                return False
+            await asyncio.sleep(0.1 if not timeout else min(0.1, timeout - elapsed))
+
+
+async def _command_counts() -> Dict[str, int]:
+    client = await get_redis_client()
+    stats = await client.info("commandstats")
+    return {
+        key.removeprefix("cmdstat_"): value["calls"]
+        for key, value in stats.items()
+        if key != "cmdstat_info"
+    }
+
+
+async def _worker(lock: RedisLock, name: str, rounds: int, hold: float, samples: List[float]) -> None:
+    for _ in range(rounds):
+        start = time.perf_counter()
+        acquired = await lock.acquire(name, ttl=10, timeout=60)
+        samples.append((time.perf_counter() - start) * 1000)
+        if acquired:
+            await asyncio.sleep(hold)
+            await lock.release(name)
+
+
+async def _measure(label: str, lock: RedisLock, workers: int, rounds: int, hold_ms: float) -> None:
+    name = f"bench:{uuid.uuid4().hex[:8]}"
+    samples: List[float] = []
+
+    before = await _command_counts()
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _worker(lock, name, rounds, hold_ms / 1000, samples) for _ in range(workers)
+    ))
+    elapsed = time.perf_counter() - start
+    after = await _command_counts()
+
+    diff = {cmd: after[cmd] - before.get(cmd, 0) for cmd in after if after[cmd] != before.get(cmd, 0)}
+    samples.sort()
+    p50 = samples[len(samples) // 2]
+    p99 = samples[max(int(len(samples) * 0.99) - 1, 0)]
+    print(
+        f"{label:<18} total={elapsed:6.2f}s  wait mean={statistics.mean(samples):8.1f}ms  "
+        f"p50={p50:8.1f}ms  p99={p99:8.1f}ms  redis commands={sum(diff.values())}"
+    )
+    print(f"{'':<18} {dict(sorted(diff.items()))}")
+
+
+async def main(workers: int, rounds: int, hold_ms: float) -> None:
+    print(f"workers={workers} rounds={rounds} hold={hold_ms}ms")
+    await _measure("polling", _PollingRedisLock(), workers, rounds, hold_ms)
+    await _measure("pubsub", RedisLock(coalesce_local=False), workers, rounds, hold_ms)
+    await _measure("coalesce", RedisLock(), workers, rounds, hold_ms)
+    await get_pubsub_hub().close()
+    await close_redis()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RedisLock 경합 벤치마크")
+    parser.add_argument("--workers", type=int, default=20, help="경합 코루틴 수")
+    parser.add_argument("--rounds", type=int, default=5, help="코루틴당 획득 횟수")
+    parser.add_argument("--hold-ms", type=float, default=5.0, help="락 보유 시간 (ms)")
+    args = parser.parse_args()
+    asyncio.run(main(args.workers, args.rounds, args.hold_ms))
@@ -0,0 +1,111 @@
+"""
+미들웨어 요청당 오버헤드 벤치마크
+
+- before: 동일한 헤더 주입을 하는 BaseHTTPMiddleware 5단 스택 (기존 구조)
+- after : app.middleware 의 순수 ASGI 미들웨어 5단 스택 (현재 구조)
+
+MongoDB 로그는 LogWriter 큐에만 쌓이고 실제 저장은 하지 않습니다 (기록기 미시작).
+
+실행:
+  uv run python -m benchmark.middleware_overhead --requests 2000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Callable, List
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.auth import BearerTokenAuthMiddleware
+from app.middleware.tracking import (
+    RequestIDMiddleware,
+    ErrorTrackingMiddleware,
+    MongoDBLoggingMiddleware,
+    SecurityHeadersMiddleware
+)
+
+
+class _LegacyHeaderMiddleware(BaseHTTPMiddleware):
+    """기존 BaseHTTPMiddleware 구조를 재현하는 헤더 주입 미들웨어"""
+
+    def __init__(self, app, header: str) -> None:
+        super().__init__(app)
+        self.header = header
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        response = await call_next(request)
+        response.headers[self.header] = "1"
+        return response
+
+
+def _build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def _gen():
+            for i in range(20):
+                yield f"event: progress\ndata: {i}\n\n"
+        return StreamingResponse(_gen(), media_type="text/event-stream")
+
+    if stack == "legacy":
+        for header in ("X-A", "X-B", "X-C", "X-D", "X-E"):
+            app.add_middleware(_LegacyHeaderMiddleware, header=header)
+    elif stack == "asgi":
+        app.add_middleware(SecurityHeadersMiddleware)
+        app.add_middleware(MongoDBLoggingMiddleware)
+        app.add_middleware(ErrorTrackingMiddleware)
+        app.add_middleware(BearerTokenAuthMiddleware)
+        app.add_middleware(RequestIDMiddleware)
+    return app
+
+
+async def _measure(app: FastAPI, path: str, requests: int) -> List[float]:
+    transport = httpx.ASGITransport(app=app)
+    samples: List[float] = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):
+            await client.get(path)
+        for _ in range(requests):
+            start = time.perf_counter()
+            response = await client.get(path)
+            await response.aread()
+            samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def _report(label: str, samples: List[float]) -> None:
+    samples = sorted(samples)
+    p50 = samples[len(samples) // 2]
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{label:<28} mean={statistics.mean(samples):8.1f}us  p50={p50:8.1f}us  p99={p99:8.1f}us")
+
+
+async def main(requests: int) -> None:
+    for path in ("/ping", "/stream"):
+        baseline = await _measure(_build_app("none"), path, requests)
+        before = await _measure(_build_app("legacy"), path, requests)
+        after = await _measure(_build_app("asgi"), path, requests)
+
+        print(f"[{path}] requests={requests}")
+        _report("no middleware", baseline)
+        _report("before (BaseHTTPMiddleware)", before)
+        _report("after  (pure ASGI)", after)
+        overhead_before = statistics.mean(before) - statistics.mean(baseline)
+        overhead_after = statistics.mean(after) - statistics.mean(baseline)
+        print(f"middleware overhead: before={overhead_before:.1f}us after={overhead_after:.1f}us\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="미들웨어 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000, help="측정 요청 수")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,100 @@
+"""
+사용자 일괄 생성 처리량 벤치마크 (rows/s)
+
+- single: 행마다 UserService.create_user (get_by_email + INSERT + refresh, 행마다 트랜잭션)
+- batch : UserService.bulk_create_users (다중 행 INSERT ... ON CONFLICT, USER_BULK_BATCH_SIZE 행씩)
+- copy  : UserService.bulk_create_users (COPY → 임시 테이블 → INSERT ... SELECT, asyncpg 전용)
+
+각 방식은 서로 다른 이메일 접두사로 rows 건을 넣고, 끝나면 넣은 행을 삭제합니다.
+캐시(Redis)는 끈 상태로 측정합니다.
+
+의존성: PostgreSQL (settings.POSTGRES_URL), --url 로 sqlite+aiosqlite 도 가능 (copy 제외)
+
+실행:
+  uv run python -m benchmark.user_bulk_insert --rows 5000
+  uv run python -m benchmark.user_bulk_insert --rows 5000 --url sqlite+aiosqlite:///bench.db
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from typing import List
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config.setting import settings
+from app.database.model.user import User
+from app.database.session import Base, UnitOfWork
+from app.dto.user import BulkStatus, UserCreateDTO
+from app.service.user import UserService
+
+
+def _rows(label: str, count: int) -> List[UserCreateDTO]:
+    run = uuid.uuid4().hex[:8]
+    return [
+        UserCreateDTO(email=f"bench-{label}-{run}-{i}@bench.com", name=f"Bench {i}")
+        for i in range(count)
+    ]
+
+
+async def _single(service: UserService, rows: List[UserCreateDTO]) -> int:
+    for row in rows:
+        await service.create_user(row)
+    return len(rows)
+
+
+async def _bulk(service: UserService, rows: List[UserCreateDTO]) -> int:
+    created = 0
+    for start in range(0, len(rows), settings.USER_BULK_MAX_ROWS):
+        results = await service.bulk_create_users(rows[start:start + settings.USER_BULK_MAX_ROWS])
+        created += sum(result.status == BulkStatus.CREATED for result in results)
+    return created
+
+
+async def _cleanup(session_factory: async_sessionmaker, rows: List[UserCreateDTO]) -> None:
+    emails = [row.email for row in rows]
+    async with session_factory() as session:
+        for start in range(0, len(emails), 1000):
+            await session.execute(delete(User).where(User.email.in_(emails[start:start + 1000])))
+        await session.commit()
+
+
+async def main(url: str, rows: int) -> None:
+    settings.CACHE_ENABLED = False
+    engine = create_async_engine(url)
+    if engine.dialect.name == "sqlite":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    service = UserService(uow=UnitOfWork(session=session_factory))
+
+    modes = ["single", "batch"]
+    if engine.dialect.driver == "asyncpg":
+        modes.append("copy")
+
+    print(f"[{engine.dialect.name}+{engine.dialect.driver}] rows={rows} batch_size={settings.USER_BULK_BATCH_SIZE}")
+    baseline = None
+    for mode in modes:
+        data = _rows(mode, rows)
+        # batch는 COPY로 넘어가지 않게, copy는 항상 COPY를 쓰게 임계값 조정
+        settings.USER_BULK_COPY_THRESHOLD = 1 if mode == "copy" else rows + 1
+        start = time.perf_counter()
+        try:
+            created = await (_single(service, data) if mode == "single" else _bulk(service, data))
+        finally:
+            elapsed = time.perf_counter() - start
+            await _cleanup(session_factory, data)
+        rate = created / elapsed
+        baseline = baseline or rate
+        print(f"{mode:<8} {created:>7} rows  {elapsed:8.3f}s  {rate:10.0f} rows/s  x{rate / baseline:.1f}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사용자 일괄 생성 처리량 벤치마크")
+    parser.add_argument("--rows", type=int, default=5000, help="방식별 생성 행 수")
+    parser.add_argument("--url", default=settings.POSTGRES_URL, help="비동기 SQLAlchemy DB URL")
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.rows))
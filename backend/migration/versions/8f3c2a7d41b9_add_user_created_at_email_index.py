@@ -0,0 +1,41 @@
+"""add user (created_at, email) index for cursor pagination
+
+Revision ID: 8f3c2a7d41b9
+Revises: 23c65e963f26
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3c2a7d41b9'
+down_revision: Union[str, Sequence[str], None] = '23c65e963f26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 대용량 테이블에서 쓰기를 막지 않도록 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_created_at_email',
+            'user',
+            ['created_at', 'email'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_user_created_at_email',
+            table_name='user',
+            postgresql_concurrently=True,
+        )
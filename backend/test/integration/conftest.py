@@ -3,6 +3,7 @@ import asyncio
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy import text
 
+from app.config.setting import settings
 from app.database.session import UnitOfWork, Base
 from app.database.model.user import User
 from app.service.user import UserService
@@ -83,6 +84,12 @@ async def clean_database(test_session):
     await test_session.commit()
 
 
+@pytest.fixture(autouse=True)
+def disable_cache(monkeypatch):
+    """Redis 캐시 비활성화 (통합 테스트는 DB만 사용)"""
+    monkeypatch.setattr(settings, "CACHE_ENABLED", False)
+
+
 @pytest.fixture(autouse=True)
 async def integration_test_setup(clean_database):
     """Auto-used fixture for integration test setup"""
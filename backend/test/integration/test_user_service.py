@@ -1,7 +1,11 @@
 import pytest
-from sqlalchemy import text
+from datetime import datetime
+from sqlalchemy import event, text
 
-from app.dto.user import UserCreateDTO, UserUpdateDTO, UserDTO
+from app.config.setting import settings
+from app.database.model.user import User
+from app.database.session import use_session
+from app.dto.user import UserCreateDTO, UserUpdateDTO, UserDTO, CountStrategy, BulkStatus
 
 
 @pytest.mark.integration
@@ -80,6 +84,48 @@ class TestUserServiceIntegration:
         assert len(users_page2) == 1
         assert total_count == 3
 
+    async def test_get_all_users_count_strategies(self, multiple_users_in_db):
+        """전체 수 계산 방식 통합 테스트 - 통계가 없는 DB에서 추정치는 정확한 COUNT로 대체"""
+        # When
+        _, estimated = await self.user_service.get_all_users(limit=2, count=CountStrategy.ESTIMATED)
+        _, skipped = await self.user_service.get_all_users(limit=2, count=CountStrategy.NONE)
+
+        # Then
+        assert estimated == 3
+        assert skipped is None
+
+    async def test_get_users_by_cursor_pages_in_order(self, test_session):
+        """커서 페이징 통합 테스트 - 중복/누락 없이 (created_at, email) 역순으로 순회"""
+        # Given - created_at이 같은 사용자 포함 (email로 순서 결정)
+        same_time = datetime(2024, 1, 2, 12, 0, 0)
+        test_session.add_all([
+            User(email="a@cursor.com", name="A", created_at=datetime(2024, 1, 1, 12, 0, 0)),
+            User(email="b@cursor.com", name="B", created_at=same_time),
+            User(email="c@cursor.com", name="C", created_at=same_time),
+            User(email="d@cursor.com", name="D", created_at=datetime(2024, 1, 3, 12, 0, 0)),
+        ])
+        await test_session.commit()
+
+        # When - 2개씩 끝까지 조회
+        emails, cursor, pages = [], None, 0
+        while True:
+            users, total, cursor = await self.user_service.get_users_by_cursor(limit=2, cursor=cursor)
+            emails += [user.email for user in users]
+            pages += 1
+            if cursor is None:
+                break
+
+        # Then
+        assert emails == ["d@cursor.com", "c@cursor.com", "b@cursor.com", "a@cursor.com"]
+        assert pages == 2
+        assert total == 4
+
+    async def test_get_users_by_cursor_invalid_cursor(self):
+        """잘못된 커서 통합 테스트"""
+        # When & Then
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await self.user_service.get_users_by_cursor(limit=2, cursor="not-a-cursor")
+
     async def test_get_all_users_empty_database(self):
         """빈 데이터베이스에서 사용자 목록 조회 통합 테스트"""
         # When
@@ -158,26 +204,113 @@ class TestUserServiceIntegration:
         with pytest.raises(ValueError, match="not found"):
             await self.user_service.delete_user(nonexistent_email)
 
-    async def test_create_user_with_session_full_flow(self, test_session):
-        """세션 기반 사용자 생성 전체 플로우 통합 테스트"""
+    async def test_request_session_shared_across_service_calls(self, test_engine, test_uow):
+        """요청 단위 세션 - 여러 서비스 호출이 커넥션 하나, COMMIT 한 번을 공유"""
         # Given
-        create_dto = UserCreateDTO(email="session@example.com", name="Session User")
-        
+        checkouts, commits = [], []
+        pool, engine = test_engine.sync_engine.pool, test_engine.sync_engine
+        on_checkout = lambda *args: checkouts.append(1)
+        on_commit = lambda conn: commits.append(1)
+        event.listen(pool, "checkout", on_checkout)
+        event.listen(engine, "commit", on_commit)
+        try:
+            # When
+            async with test_uow as session:
+                with use_session(session):
+                    await self.user_service.create_user(UserCreateDTO(email="req1@integration.com", name="Req 1"))
+                    await self.user_service.create_user(UserCreateDTO(email="req2@integration.com", name="Req 2"))
+                    # 같은 트랜잭션의 쓰기 결과를 읽음
+                    found = await self.user_service.get_user_by_email("req1@integration.com")
+            # Then
+            assert found is not None
+            assert (len(checkouts), len(commits)) == (1, 1)
+        finally:
+            event.remove(pool, "checkout", on_checkout)
+            event.remove(engine, "commit", on_commit)
+
+        users, total = await self.user_service.get_all_users(count=CountStrategy.EXACT)
+        assert total == 2
+
+    async def test_request_session_rolls_back_all_calls(self, test_uow):
+        """요청 단위 세션 - 중간에 실패하면 앞선 호출의 쓰기까지 모두 롤백"""
         # When
-        created_user = await self.user_service.create_user_with_session(test_session, create_dto)
-        await test_session.commit()
-        
+        with pytest.raises(ValueError, match="already exists"):
+            async with test_uow as session:
+                with use_session(session):
+                    create_dto = UserCreateDTO(email="req@integration.com", name="Req")
+                    await self.user_service.create_user(create_dto)
+                    await self.user_service.create_user(create_dto)
+
         # Then
-        assert created_user.email == create_dto.email
-        assert created_user.name == create_dto.name
-        
-        # Database에서 직접 확인
-        result = await test_session.execute(
-            text("SELECT email, name FROM user WHERE email = :email"),
-            {"email": create_dto.email}
-        )
-        db_user = result.fetchone()
-        assert db_user is not None
+        assert await self.user_service.get_user_by_email("req@integration.com") is None
+
+    async def test_bulk_create_users_full_flow(self, sample_user_in_db, monkeypatch):
+        """일괄 생성/업서트 통합 테스트 - 배치 경계를 넘어도 행별 결과 유지"""
+        # Given - 기존 사용자 1명 + 새 사용자 3명 (batch_size보다 많게)
+        monkeypatch.setattr(settings, "USER_BULK_BATCH_SIZE", 2)
+        rows = [
+            UserCreateDTO(email=f"bulk{i}@integration.com", name=f"Bulk {i}") for i in range(3)
+        ] + [UserCreateDTO(email=sample_user_in_db.email, name="Renamed")]
+
+        # When
+        created = await self.user_service.bulk_create_users(rows)
+        upserted = await self.user_service.bulk_create_users(rows[2:], upsert=True)
+
+        # Then
+        assert [result.status for result in created] == [BulkStatus.CREATED] * 3 + [BulkStatus.SKIPPED]
+        assert [result.status for result in upserted] == [BulkStatus.UPDATED, BulkStatus.UPDATED]
+        renamed = await self.user_service.get_user_by_email(sample_user_in_db.email)
+        assert renamed.name == "Renamed"
+        users, total = await self.user_service.get_all_users(count=CountStrategy.EXACT)
+        assert total == 4
+
+    async def test_bulk_create_users_keeps_rows_around_failed_row(self):
+        """일괄 생성 통합 테스트 - 실패한 행만 SAVEPOINT로 되돌리고 나머지는 저장"""
+        # Given - 가운데 행은 NOT NULL 위반
+        rows = [
+            UserCreateDTO(email="ok1@integration.com", name="Ok 1"),
+            UserCreateDTO.model_construct(email="bad@integration.com", name=None),
+            UserCreateDTO(email="ok2@integration.com", name="Ok 2"),
+        ]
+
+        # When
+        results = await self.user_service.bulk_create_users(rows)
+
+        # Then
+        assert [result.status for result in results] == [BulkStatus.CREATED, BulkStatus.FAILED, BulkStatus.CREATED]
+        assert "NOT NULL" in results[1].error
+        users, total = await self.user_service.get_all_users(count=CountStrategy.EXACT)
+        assert sorted(user.email for user in users) == ["ok1@integration.com", "ok2@integration.com"]
+
+    async def test_connection_checkout_and_commit_only_when_needed(self, test_engine, sample_user_in_db):
+        """DB 작업 전 실패는 커넥션을 쓰지 않고, 읽기만 한 트랜잭션은 COMMIT 생략"""
+        # Given
+        checkouts, commits = [], []
+        pool, engine = test_engine.sync_engine.pool, test_engine.sync_engine
+        on_checkout = lambda *args: checkouts.append(1)
+        on_commit = lambda conn: commits.append(1)
+        event.listen(pool, "checkout", on_checkout)
+        event.listen(engine, "commit", on_commit)
+        try:
+            # When - DB 작업 전에 끝난 트랜잭션
+            async with self.user_service.uow:
+                pass
+            # Then
+            assert (len(checkouts), len(commits)) == (0, 0)
+
+            # When - 쓰기 트랜잭션이지만 조회만 수행 (빈 업데이트)
+            with pytest.raises(ValueError, match="No data provided"):
+                await self.user_service.update_user(sample_user_in_db.email, UserUpdateDTO())
+            # Then
+            assert (len(checkouts), len(commits)) == (1, 0)
+
+            # When - 쓰기 수행
+            await self.user_service.create_user(UserCreateDTO(email="lazy@integration.com", name="Lazy"))
+            # Then
+            assert (len(checkouts), len(commits)) == (2, 1)
+        finally:
+            event.remove(pool, "checkout", on_checkout)
+            event.remove(engine, "commit", on_commit)
 
     async def test_multiple_user_creation(self):
         """여러 사용자 생성 시나리오 통합 테스트"""
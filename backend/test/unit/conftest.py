@@ -1,8 +1,13 @@
+import fakeredis
 import pytest
 from unittest.mock import AsyncMock, Mock
 from datetime import datetime
 from typing import Optional, List
 
+from app.config.setting import settings
+from app.core.cache import CacheService
+from app.core.pubsub_hub import get_pubsub_hub
+from app.core.redis import RedisClient
 from app.dto.user import UserDTO, UserCreateDTO, UserUpdateDTO
 from app.service.user import UserService
 from app.database.session import UnitOfWork
@@ -14,18 +19,70 @@ from app.repository.user import UserRepository
 """
 
 
-@pytest.fixture
-def mock_uow():
-    """Mock UnitOfWork fixture for unit tests"""
-    uow = Mock(spec=UnitOfWork)
+def _mock_savepoint():
+    """session.begin_nested()가 반환하는 SAVEPOINT 컨텍스트 Mock (예외는 그대로 전파)"""
+    savepoint = AsyncMock()
+    savepoint.__aexit__.return_value = False
+    return savepoint
+
+
+def _mock_uow_session(uow: Mock, read_only: bool = False) -> AsyncMock:
+    """UnitOfWork Mock의 진입/종료와 세션 Mock 구성 (reader()는 읽기 전용 세션을 여는 UnitOfWork Mock 반환)"""
     mock_session = AsyncMock()
+    mock_session.info = {"read_only": True} if read_only else {}
+    mock_session.begin_nested = Mock(side_effect=lambda: _mock_savepoint())
     
     uow.__aenter__ = AsyncMock(return_value=mock_session)
     uow.__aexit__ = AsyncMock(return_value=None)
+    if not read_only:
+        reader = Mock(spec=UnitOfWork)
+        _mock_uow_session(reader, read_only=True)
+        uow.reader = Mock(return_value=reader)
+    return mock_session
+
+
+@pytest.fixture
+def mock_uow():
+    """Mock UnitOfWork fixture for unit tests"""
+    uow = Mock(spec=UnitOfWork)
+    _mock_uow_session(uow)
     
     return uow
 
 
+@pytest.fixture(autouse=True)
+def disable_cache(monkeypatch):
+    """Redis 캐시 비활성화 (캐시 동작은 mock_cache_service로 검증)"""
+    monkeypatch.setattr(settings, "CACHE_ENABLED", False)
+
+
+@pytest.fixture
+def mock_cache_service(monkeypatch):
+    """Mock CacheService fixture — 캐시를 활성화하고 싱글톤을 Mock으로 교체"""
+    cache = AsyncMock(spec=CacheService)
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    monkeypatch.setattr("app.core.cache.get_cache_service", lambda: cache)
+    monkeypatch.setattr("app.service.user.get_cache_service", lambda: cache)
+    return cache
+
+
+@pytest.fixture
+async def fake_redis(monkeypatch):
+    """fakeredis(Lua 스크립트, Pub/Sub 포함)로 RedisClient 싱글톤 교체 — 요청용/구독용 클라이언트는 같은 서버 공유"""
+    server = fakeredis.FakeServer()
+    client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    pubsub_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(RedisClient, "_client", client)
+    monkeypatch.setattr(RedisClient, "_pubsub_client", pubsub_client)
+    # 락 대기에 쓰는 PubSubHub 싱글톤은 테스트(이벤트 루프)마다 새로 생성
+    get_pubsub_hub.cache_clear()
+    yield client
+    await get_pubsub_hub().close()
+    get_pubsub_hub.cache_clear()
+    await client.aclose()
+    await pubsub_client.aclose()
+
+
 @pytest.fixture
 def mock_repository_factory():
     """Factory for creating common mock objects for any Repository class"""
@@ -45,8 +102,12 @@ def mock_user_repository(mock_repository_factory):
         UserRepository,
         get_by_email=None,
         get_all=[],
+        get_all_by_cursor=[],
         count_all=0,
+        count_estimated=None,
         create=None,
+        bulk_create=[],
+        bulk_upsert=[],
         update=None,
         delete=False,
     )
@@ -79,9 +140,7 @@ def service_di_factory(monkeypatch):
 
         # UnitOfWork Mock 구성
         mock_uow = Mock()
-        mock_session = AsyncMock()
-        mock_uow.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_uow.__aexit__ = AsyncMock(return_value=None)
+        _mock_uow_session(mock_uow)
 
         # 서비스 인스턴스 생성
         service = service_cls(uow=mock_uow)
@@ -0,0 +1,203 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from app.core.cache import CacheService
+from app.core.local_cache import LocalCache
+
+
+async def _until(condition, timeout: float = 2.0) -> None:
+    """조건이 참이 될 때까지 대기"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "조건 대기 시간 초과"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.unit
+class TestLocalCache:
+    """LocalCache(L1) 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        # 만료 판단에 쓰는 시계를 직접 움직임 (이 모듈의 time만 교체)
+        self.now = 1000.0
+        monkeypatch.setattr("app.core.local_cache.time", SimpleNamespace(monotonic=lambda: self.now))
+
+    def test_entry_limit_evicts_least_recently_used(self):
+        """항목 수 한도를 넘으면 가장 오래 안 쓴 항목부터 제거"""
+        # Given
+        cache = LocalCache(max_entries=2, max_bytes=1000, ttl=60)
+        cache.set("ns", "a", 1, size=1)
+        cache.set("ns", "b", 2, size=1)
+        cache.get("ns", "a")  # a를 최근 사용으로
+
+        # When
+        cache.set("ns", "c", 3, size=1)
+
+        # Then
+        assert cache.get("ns", "a") == (True, 1)
+        assert cache.get("ns", "b") == (False, None)
+        assert cache.get("ns", "c") == (True, 3)
+        assert cache.stats() == {"entries": 2, "bytes": 2, "evictions": 1}
+
+    def test_byte_limit_evicts_until_under_limit(self):
+        """바이트 한도를 넘으면 한도 아래가 될 때까지 제거"""
+        # Given
+        cache = LocalCache(max_entries=100, max_bytes=10, ttl=60)
+        cache.set("ns", "a", "a", size=4)
+        cache.set("ns", "b", "b", size=4)
+
+        # When
+        cache.set("ns", "c", "c", size=7)
+
+        # Then
+        assert cache.get("ns", "a") == (False, None)
+        assert cache.get("ns", "b") == (False, None)
+        assert cache.get("ns", "c") == (True, "c")
+        assert cache.size_bytes == 7
+        assert cache.evictions == 2
+
+    def test_value_larger_than_limit_is_not_stored(self):
+        """바이트 한도보다 큰 값은 저장하지 않음 (기존 항목도 밀어내지 않음)"""
+        # Given
+        cache = LocalCache(max_entries=100, max_bytes=10, ttl=60)
+        cache.set("ns", "a", "a", size=4)
+
+        # When
+        cache.set("ns", "big", "x" * 11, size=11)
+
+        # Then
+        assert cache.get("ns", "big") == (False, None)
+        assert cache.get("ns", "a") == (True, "a")
+        assert cache.evictions == 0
+
+    def test_overwrite_keeps_byte_count(self):
+        """같은 키를 덮어쓰면 이전 크기를 빼고 다시 계산"""
+        cache = LocalCache(max_entries=100, max_bytes=100, ttl=60)
+        cache.set("ns", "a", 1, size=10)
+        cache.set("ns", "a", 2, size=3)
+        assert cache.size_bytes == 3
+        assert cache.get("ns", "a") == (True, 2)
+
+    def test_ttl_expires_entry(self):
+        """항목 TTL이 지나면 미적중 (TTL은 기본 TTL을 넘지 않음)"""
+        # Given
+        cache = LocalCache(max_entries=100, max_bytes=100, ttl=30)
+        cache.set("ns", "short", 1, size=1, ttl=5)
+        cache.set("ns", "long", 2, size=1, ttl=3600)
+
+        # When / Then
+        self.now += 5
+        assert cache.get("ns", "short") == (False, None)
+        assert cache.get("ns", "long") == (True, 2)
+        self.now += 25
+        assert cache.get("ns", "long") == (False, None)
+        assert cache.size_bytes == 0
+
+    def test_none_value_is_a_hit(self):
+        """None 값도 적중으로 구분"""
+        cache = LocalCache()
+        cache.set("ns", "missing", None, size=1)
+        assert cache.get("ns", "missing") == (True, None)
+
+    def test_invalidate_namespace(self):
+        """네임스페이스 단위 무효화는 다른 네임스페이스를 건드리지 않음"""
+        # Given
+        cache = LocalCache()
+        cache.set("user", "a", 1, size=1)
+        cache.set("user", "b", 2, size=1)
+        cache.set("chroma", "a", 3, size=1)
+
+        # When
+        cache.invalidate_namespace("user")
+
+        # Then
+        assert cache.get("user", "a") == (False, None)
+        assert cache.get("user", "b") == (False, None)
+        assert cache.get("chroma", "a") == (True, 3)
+        assert cache.size_bytes == 1
+
+
+@pytest.mark.unit
+class TestCacheServiceLocalInvalidation:
+    """워커(CacheService) 간 L1 무효화 전파 단위 테스트 (fakeredis Pub/Sub)"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, fake_redis):
+        self.redis = fake_redis
+        # 같은 Redis를 보는 두 워커 프로세스 역할
+        self.a = CacheService(local=LocalCache(ttl=60))
+        self.b = CacheService(local=LocalCache(ttl=60))
+        await self.a.start()
+        await self.b.start()
+        await _until(lambda: self.a._listening and self.b._listening)
+        yield
+        await self.a.stop()
+        await self.b.stop()
+
+    async def _load(self, cache: CacheService, key: str, value):
+        loader = AsyncMock(return_value=value)
+        return await cache.get_or_load("user", key, loader, ttl=60), loader
+
+    async def test_second_read_hits_l1(self):
+        """두 번째 조회는 Redis까지 가지 않고 L1에서 반환"""
+        # Given
+        await self._load(self.b, "a@x.com", {"v": 1})
+
+        # When
+        value, loader = await self._load(self.b, "a@x.com", {"v": 2})
+
+        # Then
+        assert value == {"v": 1}
+        loader.assert_not_awaited()
+        assert self.b.local_hits == 1
+
+    async def test_delete_on_one_worker_invalidates_other_l1(self):
+        """한 워커의 delete가 다른 워커의 L1 항목도 제거"""
+        # Given - b의 L1에 적재
+        await self._load(self.b, "a@x.com", {"v": 1})
+        assert self.b.local.get("user", "a@x.com") == (True, {"v": 1})
+
+        # When
+        await self.a.delete("user", "a@x.com")
+        await _until(lambda: not self.b.local.get("user", "a@x.com")[0])
+
+        # Then - b는 다시 원본을 조회
+        value, loader = await self._load(self.b, "a@x.com", {"v": 2})
+        assert value == {"v": 2}
+        loader.assert_awaited_once()
+
+    async def test_namespace_bump_on_one_worker_invalidates_other_l1(self):
+        """한 워커의 네임스페이스 버전 증가가 다른 워커의 L1 네임스페이스 전체를 제거"""
+        # Given
+        await self._load(self.b, "a@x.com", {"v": 1})
+        await self._load(self.b, "b@x.com", {"v": 1})
+        await self.b.get_or_load("other", "k", AsyncMock(return_value="keep"), ttl=60)
+
+        # When
+        assert await self.a.invalidate_namespace("user") == 1
+        await _until(lambda: self.b.local.stats()["entries"] == 1)
+
+        # Then
+        assert self.b.local.get("other", "k") == (True, "keep")
+        value, loader = await self._load(self.b, "a@x.com", {"v": 2})
+        assert value == {"v": 2}
+        loader.assert_awaited_once()
+
+    async def test_l1_disabled_while_not_listening(self):
+        """무효화 채널을 구독하지 않는 동안에는 L1을 쓰지 않음"""
+        # Given
+        await self.b.stop()
+
+        # When
+        await self._load(self.b, "a@x.com", {"v": 1})
+        value, loader = await self._load(self.b, "a@x.com", {"v": 2})
+
+        # Then - Redis(L2)에서 적중
+        assert value == {"v": 1}
+        loader.assert_not_awaited()
+        assert self.b.local_hits == 0
+        assert self.b.local.stats()["entries"] == 0
@@ -0,0 +1,81 @@
+import asyncio
+import pytest
+
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config.setting import settings
+from app.database.pool import InstrumentedAsyncPool
+
+
+@pytest.mark.unit
+class TestInstrumentedAsyncPool:
+    """InstrumentedAsyncPool 단위 테스트 (aiosqlite)"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "POSTGRES_POOL_SLOW_WAIT", 0.05)
+        self.engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedAsyncPool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.1,
+        )
+        self.pool = self.engine.sync_engine.pool
+        yield
+        await self.engine.dispose()
+
+    async def test_records_checkouts(self):
+        """획득마다 checkouts/대기 시간을 누적하고 현재 보유 수를 반영"""
+        # When
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            during = self.pool.stats()
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        # Then
+        stats = self.pool.stats()
+        assert during["checked_out"] == 1
+        assert stats["checked_out"] == 0
+        assert stats["checkouts"] == 2
+        assert stats["timeouts"] == 0
+        assert stats["wait_max_ms"] >= stats["wait_avg_ms"] >= 0
+
+    async def test_exhausted_pool_counts_timeout_and_slow_wait(self):
+        """풀이 고갈되면 pool_timeout 후 타임아웃과 느린 대기로 집계"""
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+            # When - 유일한 커넥션을 보유한 채 추가 획득
+            with pytest.raises(exc.TimeoutError):
+                async with self.engine.connect():
+                    pass
+
+        # Then
+        stats = self.pool.stats()
+        assert stats["timeouts"] == 1
+        assert stats["slow_waits"] == 1
+        assert stats["wait_max_ms"] >= 100
+
+    async def test_waiter_gets_released_connection(self):
+        """대기 중인 획득은 반납된 커넥션을 받아 진행"""
+        # Given
+        conn = await self.engine.connect()
+        self.pool._timeout = 1.0
+
+        async def use() -> int:
+            async with self.engine.connect() as other:
+                return (await other.execute(text("SELECT 1"))).scalar()
+
+        waiter = asyncio.create_task(use())
+        await asyncio.sleep(0.1)
+
+        # When
+        await conn.close()
+
+        # Then
+        assert await waiter == 1
+        assert self.pool.stats()["timeouts"] == 0
+        assert self.pool.stats()["slow_waits"] == 1
@@ -0,0 +1,89 @@
+import pytest
+
+from sqlalchemy import column, event, insert, select, table, text
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database.session import UnitOfWork
+
+_item = table("item", column("v"))
+
+
+@pytest.mark.unit
+class TestUnitOfWorkRoundTrips:
+    """UnitOfWork가 DB로 보내는 문장 수 단위 테스트 (aiosqlite)"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, tmp_path):
+        self.engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'uow.db'}")
+        self.statements = []
+
+        @event.listens_for(self.engine.sync_engine, "connect")
+        def trace(dbapi_connection, connection_record):
+            # SQLite가 실제로 실행한 문장 기록
+            dbapi_connection.await_(
+                dbapi_connection.driver_connection.set_trace_callback(self.statements.append)
+            )
+
+        @event.listens_for(self.engine.sync_engine, "begin")
+        def begin(conn):
+            # asyncpg처럼 트랜잭션 시작 시 BEGIN을 보냄 (AUTOCOMMIT이면 보내지 않음)
+            if conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT":
+                conn.exec_driver_sql("BEGIN")
+
+        async with self.engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE item (v INTEGER)"))
+        self.uow = UnitOfWork(async_sessionmaker(bind=self.engine, expire_on_commit=False))
+        yield
+        await self.engine.dispose()
+
+    def _sent(self):
+        """실행된 문장의 종류 (SQLite 전용 격리 수준 복원 PRAGMA는 제외)"""
+        return [s.split()[0] for s in self.statements if not s.startswith("PRAGMA")]
+
+    async def test_read_only_sends_only_select(self):
+        """읽기 전용 세션은 BEGIN/ROLLBACK 없이 SELECT만 전송"""
+        # Given
+        self.statements.clear()
+
+        # When
+        async with self.uow.reader() as session:
+            await session.execute(select(_item))
+
+        # Then
+        assert self._sent() == ["SELECT"]
+
+    async def test_read_in_write_session_sends_begin_and_rollback(self):
+        """쓰기 세션에서의 조회는 COMMIT을 건너뛰어도 BEGIN/ROLLBACK 왕복이 남음 (비교 기준)"""
+        # Given
+        self.statements.clear()
+
+        # When
+        async with self.uow as session:
+            await session.execute(select(_item))
+
+        # Then
+        assert self._sent() == ["BEGIN", "SELECT", "ROLLBACK"]
+
+    async def test_write_commits(self):
+        """쓰기가 있으면 BEGIN ... COMMIT"""
+        # Given
+        self.statements.clear()
+
+        # When
+        async with self.uow as session:
+            await session.execute(insert(_item).values(v=1))
+
+        # Then
+        assert self._sent() == ["BEGIN", "INSERT", "COMMIT"]
+
+    async def test_read_only_rejects_orm_write(self):
+        """AUTOCOMMIT 읽기 전용 세션의 ORM 쓰기 문장은 전송 전에 거부"""
+        # Given
+        self.statements.clear()
+
+        # When / Then
+        with pytest.raises(InvalidRequestError):
+            async with self.uow.reader() as session:
+                await session.execute(insert(_item).values(v=1))
+        assert "INSERT" not in self._sent()
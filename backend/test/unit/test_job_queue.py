@@ -0,0 +1,224 @@
+import asyncio
+import time
+import pytest
+
+from app.core.job_queue import RedisJobQueue
+from app.core.lock import RedisLock
+
+
+async def _until(condition, timeout: float = 3.0) -> None:
+    """조건(코루틴 함수 가능)이 참이 될 때까지 대기"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        result = condition()
+        if asyncio.iscoroutine(result):
+            result = await result
+        if result:
+            return
+        assert loop.time() < deadline, "조건 대기 시간 초과"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.unit
+class TestRedisJobQueue:
+    """RedisJobQueue 단위 테스트 (fakeredis)"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, fake_redis, monkeypatch):
+        self.redis = fake_redis
+        # fakeredis의 BLMOVE는 빈 리스트에서 대기 없이 바로 None을 반환하므로 짧은 대기로 흉내
+        blmove = fake_redis.blmove
+
+        async def blocking_blmove(*args, **kwargs):
+            result = await blmove(*args, **kwargs)
+            if result is None:
+                await asyncio.sleep(0.01)
+            return result
+
+        monkeypatch.setattr(fake_redis, "blmove", blocking_blmove)
+        self.lock = RedisLock()
+        self.queue = RedisJobQueue(
+            name="test", lease_ttl=3, reclaim_interval=0.05, requeue_delay=0.2, lock=self.lock
+        )
+        yield
+        await self.queue.stop()
+
+    async def test_job_runs_once_and_is_cleaned_up(self):
+        """제출한 작업은 lease를 잡고 한 번 실행된 뒤 큐 상태에서 제거"""
+        # Given
+        payloads = []
+
+        async def handler(payload):
+            assert await self.redis.exists(self.lock.lock_key(self.queue._lease_name("job-1")))
+            payloads.append(payload)
+
+        self.queue.register("echo", handler)
+
+        # When
+        await self.queue.enqueue("echo", {"n": 1}, job_id="job-1")
+        await self.queue.start()
+        await _until(lambda: self.queue.completed_count == 1)
+
+        # Then
+        assert payloads == [{"n": 1}]
+        assert await self.redis.llen(self.queue._processing_key) == 0
+        assert await self.redis.hlen(self.queue._data_key) == 0
+        assert not await self.redis.exists(self.lock.lock_key(self.queue._lease_name("job-1")))
+
+    async def test_lease_unavailable_requeues_without_releasing(self):
+        """lease를 얻지 못한 작업은 남의 lease를 건드리지 않고, 잠시 후 시도 횟수 증가 없이 pending으로 반환"""
+        # Given - 다른 소유자가 lease 보유 중
+        lease_name = self.queue._lease_name("job-1")
+        assert await self.lock.acquire(lease_name, ttl=30) is not None
+        await self.redis.lpush(self.queue._processing_key, "job-1")
+
+        # When
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        await asyncio.create_task(self.queue._execute("job-1"))
+
+        # Then
+        assert loop.time() - started_at >= self.queue.requeue_delay / 2
+        assert await self.lock.is_owned_by_me(lease_name)
+        assert self.lock._local.waiters(lease_name) == 0
+        assert await self.redis.lrange(self.queue._pending_key, 0, -1) == ["job-1"]
+        assert await self.redis.llen(self.queue._processing_key) == 0
+        assert await self.redis.hget(self.queue._attempts_key, "job-1") is None
+        await self.lock.release(lease_name)
+
+    async def test_taken_lease_does_not_spin_between_workers(self):
+        """다른 워커가 lease를 보유한 작업은 지연 후 반환되어 가져오기/반환을 반복하지 않고, lease가 풀리면 실행"""
+        # Given - 다른 워커(별도 RedisLock)가 lease 보유 중
+        other = RedisLock()
+        lease_name = self.queue._lease_name("job-1")
+        holding, done = asyncio.Event(), asyncio.Event()
+
+        async def hold_lease() -> None:
+            async with other.lock(lease_name, ttl=30):
+                holding.set()
+                await done.wait()
+
+        holder = asyncio.create_task(hold_lease())
+        await holding.wait()
+
+        claims = 0
+        blmove = self.redis.blmove
+
+        async def counting_blmove(*args, **kwargs):
+            nonlocal claims
+            result = await blmove(*args, **kwargs)
+            claims += result is not None
+            return result
+
+        self.redis.blmove = counting_blmove
+        payloads = []
+
+        async def handler(payload):
+            payloads.append(payload)
+
+        self.queue.register("echo", handler)
+        await self.queue.enqueue("echo", {"n": 1}, job_id="job-1")
+
+        # When - lease가 잡혀 있는 동안
+        await self.queue.start()
+        await asyncio.sleep(0.6)
+
+        # Then - 지연(0.1~0.2초)마다 한 번씩만 가져감
+        assert 1 <= claims <= 7
+        assert payloads == []
+
+        # When - lease 해제
+        done.set()
+        await holder
+        await _until(lambda: self.queue.completed_count == 1)
+
+        # Then
+        assert payloads == [{"n": 1}]
+        assert await self.redis.hget(self.queue._attempts_key, "job-1") is None
+
+    async def test_stop_releases_lease_before_requeue(self):
+        """종료 시 lease를 먼저 해제한 뒤 pending으로 반환 (반환된 작업을 가져간 워커가 바로 lease를 얻을 수 있게)"""
+        # Given
+        started = asyncio.Event()
+        lease_key = self.lock.lock_key(self.queue._lease_name("job-1"))
+
+        async def handler(payload):
+            started.set()
+            await asyncio.sleep(10)
+
+        self.queue.register("slow", handler)
+        await self.queue.enqueue("slow", {}, job_id="job-1")
+        await self.queue.start()
+        await asyncio.wait_for(started.wait(), timeout=2)
+
+        lease_at_requeue = []
+        requeue = self.queue._requeue
+
+        async def recording_requeue(job_id, attempted=True):
+            lease_at_requeue.append(await self.redis.exists(lease_key))
+            await requeue(job_id, attempted)
+
+        self.queue._requeue = recording_requeue
+
+        # When
+        await self.queue.stop()
+
+        # Then
+        assert lease_at_requeue == [0]
+        assert await self.redis.lrange(self.queue._pending_key, 0, -1) == ["job-1"]
+        assert await self.redis.hget(self.queue._attempts_key, "job-1") == "0"
+
+    async def test_requeue_skips_job_already_reclaimed(self):
+        """reclaim이 먼저 pending으로 옮긴 작업은 다시 추가하지 않음"""
+        await self.redis.rpush(self.queue._pending_key, "job-1")
+
+        await self.queue._requeue("job-1")
+
+        assert await self.redis.lrange(self.queue._pending_key, 0, -1) == ["job-1"]
+
+    async def test_reclaims_only_expired_leases(self):
+        """lease가 없는 채로 grace 시간이 지난 processing 작업만 pending으로 회수"""
+        # Given - orphan은 lease 없음, owned는 lease 보유 중
+        old = int(time.time()) - 100
+        await self.redis.lpush(self.queue._processing_key, "orphan", "owned")
+        await self.redis.hset(self.queue._claimed_key, mapping={"orphan": old, "owned": old})
+        assert await self.lock.acquire(self.queue._lease_name("owned"), ttl=30) is not None
+
+        # When
+        reclaimer = asyncio.create_task(self.queue._reclaim_loop())
+        try:
+            await _until(lambda: self.queue.reclaimed_count == 1)
+        finally:
+            reclaimer.cancel()
+
+        # Then
+        assert await self.redis.lrange(self.queue._pending_key, 0, -1) == ["orphan"]
+        assert await self.redis.lrange(self.queue._processing_key, 0, -1) == ["owned"]
+        assert await self.redis.hget(self.queue._claimed_key, "orphan") is None
+
+    async def test_lost_lease_cancels_running_job(self):
+        """하트비트가 lease 연장에 실패하면 작업을 취소하고 회수는 reclaim에 맡김"""
+        # Given
+        started, cancelled = asyncio.Event(), asyncio.Event()
+
+        async def handler(payload):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        self.queue.register("slow", handler)
+        await self.queue.enqueue("slow", {}, job_id="job-1")
+        await self.queue.start()
+        await asyncio.wait_for(started.wait(), timeout=2)
+
+        # When - lease가 외부에서 만료됨
+        await self.redis.delete(self.lock.lock_key(self.queue._lease_name("job-1")))
+
+        # Then - 다음 하트비트(1초)에서 취소, processing에 남아 reclaim 대상이 됨
+        await asyncio.wait_for(cancelled.wait(), timeout=3)
+        await _until(lambda: not self.queue.running_jobs())
+        assert self.queue.completed_count == 0
@@ -0,0 +1,124 @@
+import asyncio
+import pytest
+from typing import ClassVar, Optional
+from unittest.mock import AsyncMock
+
+from pydantic import BaseModel
+
+from app.core.log_writer import LogWriter
+from app.repository.log import LogRepository
+
+_create_many = LogRepository.create_many
+
+
+class _FakeLog(BaseModel):
+    """beanie 초기화 없이 검증만 수행하는 Log 대역"""
+    called_api: str
+    status_code: Optional[int] = None
+
+    insert_many: ClassVar[AsyncMock] = AsyncMock()
+
+
+@pytest.mark.unit
+class TestLogWriter:
+    """LogWriter 단위 테스트 (MongoDB 저장은 mock)"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        self.saved = []
+
+        async def create_many(records):
+            self.saved.extend(records)
+            return len(records)
+
+        self.create_many = AsyncMock(side_effect=create_many)
+        monkeypatch.setattr(LogRepository, "create_many", self.create_many)
+
+    async def test_drop_policy_discards_when_full(self):
+        """drop 정책은 큐가 가득 차면 대기 없이 버리고 dropped에 집계"""
+        # Given
+        writer = LogWriter(max_queue_size=2, overflow_policy=LogWriter.POLICY_DROP)
+
+        # When
+        results = [await writer.enqueue({"called_api": f"/{i}"}) for i in range(3)]
+
+        # Then
+        assert results == [True, True, False]
+        assert writer.stats()["enqueued"] == 2
+        assert writer.stats()["dropped"] == 1
+
+    async def test_block_policy_waits_for_space(self):
+        """block 정책은 put_timeout 동안 자리가 나길 기다리고, 끝내 없으면 버림"""
+        # Given
+        writer = LogWriter(max_queue_size=1, overflow_policy=LogWriter.POLICY_BLOCK, put_timeout=0.5)
+        assert await writer.enqueue({"called_api": "/0"})
+
+        # When - 대기 중 자리가 남
+        asyncio.get_running_loop().call_later(0.05, writer._drain, 1)
+        accepted = await writer.enqueue({"called_api": "/1"})
+
+        # Then
+        assert accepted
+
+        # When - 자리가 나지 않음
+        writer.put_timeout = 0.05
+        rejected = await writer.enqueue({"called_api": "/2"})
+
+        # Then
+        assert not rejected
+        assert writer.stats()["enqueued"] == 2
+        assert writer.stats()["dropped"] == 1
+
+    async def test_stop_flushes_remaining_in_batches(self):
+        """stop 시 남은 로그를 batch_size 단위로 모두 저장"""
+        # Given
+        writer = LogWriter(batch_size=2, flush_interval=10)
+        for i in range(5):
+            await writer.enqueue({"called_api": f"/{i}"})
+
+        # When
+        await writer.stop()
+
+        # Then
+        assert [len(call.args[0]) for call in self.create_many.await_args_list] == [2, 2, 1]
+        assert [record["called_api"] for record in self.saved] == [f"/{i}" for i in range(5)]
+        assert writer.stats()["flushed"] == 5
+        assert all("created_at" in record for record in self.saved)
+
+    async def test_save_failure_counts_whole_batch(self):
+        """저장 자체가 실패하면 배치 전체를 failed/dropped로 집계"""
+        # Given
+        writer = LogWriter()
+        self.create_many.side_effect = RuntimeError("mongo down")
+
+        # When
+        await writer._flush([{"called_api": "/a"}, {"called_api": "/b"}])
+
+        # Then
+        assert writer.stats()["failed"] == 2
+        assert writer.stats()["dropped"] == 2
+        assert writer.stats()["flushed"] == 0
+
+    async def test_invalid_record_is_skipped_individually(self, monkeypatch):
+        """검증에 실패한 레코드만 건너뛰고 나머지는 저장, invalid로 집계"""
+        # Given - 실제 create_many로 검증
+        monkeypatch.setattr(LogRepository, "create_many", _create_many)
+        monkeypatch.setattr("app.repository.log.Log", _FakeLog)
+        _FakeLog.insert_many.reset_mock()
+        writer = LogWriter()
+
+        # When
+        await writer._flush([
+            {"called_api": "/ok"},
+            {"called_api": None},
+            {"called_api": "/ok2", "status_code": "not-a-number"},
+            {"called_api": "/ok3", "status_code": 200},
+        ])
+
+        # Then
+        logs = _FakeLog.insert_many.await_args.args[0]
+        assert [log.called_api for log in logs] == ["/ok", "/ok3"]
+        assert writer.stats()["flushed"] == 2
+        assert writer.stats()["invalid"] == 2
+        assert writer.stats()["dropped"] == 2
+        assert writer.stats()["failed"] == 0
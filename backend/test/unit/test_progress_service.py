@@ -0,0 +1,291 @@
+import json
+import asyncio
+import pytest
+import httpx
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from fastapi import FastAPI
+
+from app.core.pubsub_hub import get_pubsub_hub
+from app.service.progress import ProgressService, PROGRESS_STEPS
+from app.util.id_generator import generate_progress_id
+
+
+def _step(progress_key: str, step: int) -> dict:
+    return {
+        "progress_key": progress_key,
+        "user_id": "user-1",
+        "current_step": step,
+        "total_steps": len(PROGRESS_STEPS),
+        "message": f"step {step}",
+        "status": "in_progress" if step < len(PROGRESS_STEPS) else "completed",
+    }
+
+
+def _parse_sse(text: str) -> list:
+    """SSE 본문 → [(event, id, data)]"""
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], fields.get("id"), json.loads(fields["data"])))
+    return events
+
+
+async def _collect(stream, timeout: float = 2.0) -> list:
+    async def run():
+        return [event async for event in stream]
+    return _parse_sse("".join(await asyncio.wait_for(run(), timeout=timeout)))
+
+
+@pytest.mark.unit
+class TestProgressStream:
+    """진행률 스트림 replay/이어보기 단위 테스트 (fakeredis)"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, fake_redis, monkeypatch):
+        self.redis = fake_redis
+        self.progress_key = generate_progress_id()
+        self.repo = Mock()
+        self.repo.find_by_key = AsyncMock(
+            return_value=SimpleNamespace(user_id="user-1", progress_key=self.progress_key, end=None)
+        )
+        self.repo.update_end_status = AsyncMock()
+        monkeypatch.setattr("app.service.progress.ProgressRepository", self.repo)
+        self.job_queue = Mock()
+        self.job_queue.enqueue = AsyncMock()
+        monkeypatch.setattr("app.service.progress.get_job_queue", lambda: self.job_queue)
+        # 발행이 없을 때 스트림 폴백 조회까지 오래 기다리지 않도록
+        monkeypatch.setattr("app.service.progress.PROGRESS_FALLBACK_POLL_INTERVAL", 0.1)
+
+    async def _append(self, *steps: int) -> list:
+        return [await ProgressService._update_redis(self.progress_key, _step(self.progress_key, s)) for s in steps]
+
+    @pytest.mark.parametrize("event_id, expected", [
+        ("PGS_1700000000_ab12cd34:1700000000000-0", ("PGS_1700000000_ab12cd34", "1700000000000-0")),
+        ("1700000000000-3", (None, "1700000000000-3")),
+        ("PGS_1:not-an-id", (None, None)),
+        ("", (None, None)),
+        (None, (None, None)),
+    ])
+    def test_parse_event_id(self, event_id, expected):
+        """Last-Event-ID → (progress_key, 엔트리 ID), 잘못된 형식은 (None, None)"""
+        assert ProgressService._parse_event_id(event_id) == expected
+
+    async def test_event_id_round_trip(self):
+        """발급한 이벤트 ID를 그대로 파싱하면 같은 progress_key/엔트리 ID"""
+        entry_id, = await self._append(1)
+        event_id = ProgressService._event_id(self.progress_key, entry_id)
+        assert ProgressService._parse_event_id(event_id) == (self.progress_key, entry_id)
+
+    async def test_read_after_does_not_block(self):
+        """XREAD는 BLOCK 없이 바로 반환 (새 엔트리 없음 → [], 스트림 없음 → None)"""
+        # Given
+        *_, last_id = await self._append(1, 2)
+
+        # When
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        empty = await ProgressService._read_after(self.progress_key, last_id)
+        missing = await ProgressService._read_after("PGS_0_missing", None)
+
+        # Then
+        assert empty == []
+        assert missing is None
+        assert loop.time() - started < 0.5
+
+    async def test_replays_entries_after_last_id(self):
+        """last_id 이후 엔트리만 replay하고 완료 엔트리에서 종료"""
+        # Given
+        ids = await self._append(1, 2, 3, 4, 5)
+
+        # When
+        events = await _collect(
+            ProgressService._stream_progress(self.progress_key, "user-1", asyncio.Queue(), last_id=ids[2])
+        )
+
+        # Then
+        assert [e[0] for e in events] == ["progress", "progress"]
+        assert [e[1] for e in events] == [ProgressService._event_id(self.progress_key, i) for i in ids[3:]]
+        assert events[-1][2]["status"] == "completed"
+
+    async def test_deduplicates_replay_and_pubsub(self):
+        """replay한 엔트리가 Pub/Sub으로 다시 와도 한 번만 전송"""
+        # Given
+        ids = await self._append(4, 5)
+        queue = asyncio.Queue()
+        queue.put_nowait({"id": ids[0], "data": _step(self.progress_key, 4)})
+
+        # When
+        events = await _collect(ProgressService._stream_progress(self.progress_key, "user-1", queue))
+
+        # Then
+        assert [e[2]["current_step"] for e in events] == [4, 5]
+
+    async def test_falls_back_to_stream_without_pubsub(self):
+        """발행을 놓쳐도 폴백 주기마다 스트림을 확인해 이어서 전송"""
+        # Given
+        await self._append(1)
+        stream = ProgressService._stream_progress(self.progress_key, "user-1", asyncio.Queue())
+
+        async def append_later():
+            await asyncio.sleep(0.05)
+            # 발행 없이 스트림에만 추가 (Pub/Sub 유실 상황)
+            await self.redis.xadd(
+                ProgressService._stream_key(self.progress_key),
+                {"data": json.dumps(_step(self.progress_key, 5))},
+            )
+
+        # When
+        writer = asyncio.create_task(append_later())
+        events = await _collect(stream)
+        await writer
+
+        # Then
+        assert [e[2]["current_step"] for e in events] == [1, 5]
+
+    async def test_failed_entry_yields_final_event(self):
+        """실패 엔트리를 만나면 MongoDB 기준 failed 이벤트로 종료"""
+        # Given
+        self.repo.find_by_key.return_value.end = False
+        await self._append(1)
+        await ProgressService._update_redis(self.progress_key, {"progress_key": self.progress_key, "status": "failed"})
+
+        # When
+        events = await _collect(ProgressService._stream_progress(self.progress_key, "user-1", asyncio.Queue()))
+
+        # Then
+        assert [e[0] for e in events] == ["progress", "failed"]
+
+    async def test_search_resumes_from_last_event_id(self):
+        """Last-Event-ID만으로 작업을 찾아 그 이후 엔트리부터 이어보기"""
+        # Given
+        ids = await self._append(1, 2, 3, 4, 5)
+        last_event_id = ProgressService._event_id(self.progress_key, ids[1])
+
+        # When
+        events = await _collect(ProgressService.search_progress("user-1", last_event_id))
+
+        # Then
+        self.repo.find_by_key.assert_awaited_once_with(self.progress_key)
+        assert [e[2]["current_step"] for e in events] == [3, 4, 5]
+
+    async def test_search_ignores_event_id_of_other_progress(self):
+        """다른 작업의 Last-Event-ID면 위치를 버리고 현재 상태(resume)부터 전송"""
+        # Given
+        ids = await self._append(4, 5)
+        other_event_id = ProgressService._event_id("PGS_0_other", ids[0])
+
+        # When
+        events = await _collect(
+            ProgressService.search_progress("user-1", other_event_id, progress_key=self.progress_key)
+        )
+
+        # Then
+        assert [(e[0], e[2]["current_step"]) for e in events] == [("resume", 5)]
+
+    async def test_sse_endpoint_passes_last_event_id(self):
+        """/sse/chat에 Last-Event-ID가 오면 새 작업을 만들지 않고 이어보기"""
+        # Given - app.api.v1.user 패키지가 DI 컨테이너(dependency_injector)를 함께 import
+        pytest.importorskip("dependency_injector")
+        from app.api.v1.user.sse import router as sse_router
+
+        ids = await self._append(1, 2, 3, 4, 5)
+        app = FastAPI()
+        app.include_router(sse_router)
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+        # When
+        response = await client.get(
+            "/sse/chat",
+            params={"user_id": "user-1"},
+            headers={"Last-Event-ID": ProgressService._event_id(self.progress_key, ids[3])},
+        )
+
+        # Then
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        assert [e[2]["current_step"] for e in events] == [5]
+        self.job_queue.enqueue.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestProgressRun:
+    """진행률 작업 실행 단위 테스트 (fakeredis)"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, fake_redis, monkeypatch):
+        self.redis = fake_redis
+        self.progress_key = generate_progress_id()
+        self.repo = Mock()
+        self.repo.update_end_status = AsyncMock()
+        monkeypatch.setattr("app.service.progress.ProgressRepository", self.repo)
+
+        # 단계 사이 10초 대기를 건너뜀 (fail_at번째 대기에서 예외)
+        self.sleeps = 0
+        self.fail_at = None
+        real_sleep = asyncio.sleep
+
+        async def fast_sleep(delay, *args, **kwargs):
+            self.sleeps += 1
+            if self.sleeps == self.fail_at:
+                raise RuntimeError("worker failure")
+            await real_sleep(0)
+
+        monkeypatch.setattr("app.service.progress.asyncio.sleep", fast_sleep)
+
+    async def _entries(self) -> list:
+        entries = await self.redis.xrange(ProgressService._stream_key(self.progress_key))
+        return [json.loads(fields["data"]) for _, fields in entries]
+
+    async def test_runs_all_steps(self):
+        """모든 단계를 스트림에 기록하고 완료 처리"""
+        # When
+        await ProgressService._run_progress("user-1", self.progress_key)
+
+        # Then
+        entries = await self._entries()
+        assert [e["current_step"] for e in entries] == [1, 2, 3, 4, 5]
+        assert entries[-1]["status"] == "completed"
+        self.repo.update_end_status.assert_awaited_once_with(self.progress_key, end=True)
+
+    async def test_resumes_from_last_step(self):
+        """회수된 작업은 스트림의 마지막 단계 이후부터 진행"""
+        # Given
+        await ProgressService._update_redis(self.progress_key, _step(self.progress_key, 3))
+
+        # When
+        await ProgressService._run_progress("user-1", self.progress_key)
+
+        # Then
+        assert [e["current_step"] for e in await self._entries()] == [3, 4, 5]
+        assert self.sleeps == 2
+
+    async def test_skips_finished_progress(self):
+        """이미 완료된 작업은 다시 실행하지 않음"""
+        # Given
+        await ProgressService._update_redis(self.progress_key, _step(self.progress_key, 5))
+
+        # When
+        await ProgressService._run_progress("user-1", self.progress_key)
+
+        # Then
+        assert len(await self._entries()) == 1
+        self.repo.update_end_status.assert_not_awaited()
+
+    async def test_failure_publishes_failed_entry(self):
+        """처리 중 예외가 나면 실패 엔트리를 스트림에 남기고 구독자에게 엔트리 ID와 함께 발행"""
+        # Given
+        self.fail_at = 3
+
+        # When
+        async with get_pubsub_hub().subscribe(ProgressService._channel(self.progress_key)) as queue:
+            await ProgressService._run_progress("user-1", self.progress_key)
+            messages = [await asyncio.wait_for(queue.get(), timeout=1) for _ in range(3)]
+
+        # Then
+        stream = await self.redis.xrange(ProgressService._stream_key(self.progress_key))
+        assert [json.loads(f["data"]).get("current_step") for _, f in stream] == [1, 2, None]
+        assert messages[-1] == {"id": stream[-1][0], "data": json.loads(stream[-1][1]["data"])}
+        assert messages[-1]["data"]["status"] == "failed"
+        self.repo.update_end_status.assert_awaited_once_with(self.progress_key, end=False)
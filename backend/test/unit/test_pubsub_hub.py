@@ -0,0 +1,126 @@
+import asyncio
+import json
+import pytest
+
+from app.core.pubsub_hub import PubSubHub
+
+
+async def _receive(queue: asyncio.Queue, timeout: float = 1.0):
+    return await asyncio.wait_for(queue.get(), timeout=timeout)
+
+
+async def _until(condition, timeout: float = 2.0) -> None:
+    """조건이 참이 될 때까지 대기"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "조건 대기 시간 초과"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.unit
+class TestPubSubHub:
+    """PubSubHub 단위 테스트 (fakeredis)"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, fake_redis):
+        self.redis = fake_redis
+        self.hub = PubSubHub(queue_size=10)
+        yield
+        await self.hub.close()
+
+    async def test_subscribers_share_one_upstream_subscription(self):
+        """같은 채널의 구독자들은 upstream 구독 하나를 공유하고 모두 메시지를 받음"""
+        async with self.hub.subscribe("ch") as first, self.hub.subscribe("ch") as second:
+            # When - 진입 시점에 SUBSCRIBE 확인까지 끝나 있으므로 바로 발행해도 수신
+            receivers = await self.redis.publish("ch", json.dumps({"n": 1}))
+
+            # Then
+            assert receivers == 1
+            assert await _receive(first) == {"n": 1}
+            assert await _receive(second) == {"n": 1}
+            assert self.hub.stats()["channels"] == 1
+            assert self.hub.stats()["subscribers"] == 2
+
+        assert self.hub.stats()["channels"] == 0
+        assert await self.redis.pubsub_numsub("ch") == [("ch", 0)]
+
+    async def test_full_queue_drops_oldest(self):
+        """구독자 큐가 가득 차면 가장 오래된 메시지를 버리고 개수를 기록"""
+        hub = PubSubHub(queue_size=1)
+        try:
+            async with hub.subscribe("ch") as queue:
+                for n in range(3):
+                    await self.redis.publish("ch", json.dumps({"n": n}))
+                await _until(lambda: hub.dropped_count == 2)
+
+                assert await _receive(queue) == {"n": 2}
+        finally:
+            await hub.close()
+
+    async def test_slow_subscribe_does_not_block_other_channels(self, monkeypatch):
+        """한 채널의 구독 확인 대기가 다른 채널 구독을 막지 않음 (채널별 락)"""
+        release = asyncio.Event()
+        wait_subscribed = self.hub._wait_subscribed
+
+        async def slow_wait(channel, pubsub):
+            if channel == "slow":
+                await release.wait()
+            await wait_subscribed(channel, pubsub)
+        monkeypatch.setattr(self.hub, "_wait_subscribed", slow_wait)
+
+        async def join_slow():
+            async with self.hub.subscribe("slow"):
+                pass
+        slow = asyncio.create_task(join_slow())
+        await asyncio.sleep(0)
+
+        async def use_fast():
+            async with self.hub.subscribe("fast") as queue:
+                await self.redis.publish("fast", json.dumps({"ok": True}))
+                return await _receive(queue)
+
+        # When & Then - slow 구독이 끝나지 않아도 fast 구독은 바로 완료
+        assert await asyncio.wait_for(use_fast(), timeout=1.0) == {"ok": True}
+        assert not slow.done()
+
+        release.set()
+        await slow
+
+    async def test_failed_subscribe_leaves_no_topic(self, monkeypatch):
+        """upstream 구독에 실패하면 채널을 등록해 두지 않아 다음 구독이 다시 시도함"""
+        available = False
+
+        async def flaky_client():
+            if not available:
+                raise ConnectionError("redis down")
+            return self.redis
+        monkeypatch.setattr("app.core.pubsub_hub.get_redis_pubsub_client", flaky_client)
+
+        with pytest.raises(ConnectionError):
+            async with self.hub.subscribe("ch"):
+                pass
+        assert self.hub.stats()["channels"] == 0
+
+        available = True
+        async with self.hub.subscribe("ch") as queue:
+            await self.redis.publish("ch", json.dumps({"n": 1}))
+            assert await _receive(queue) == {"n": 1}
+
+    async def test_reader_failure_resubscribes(self):
+        """수신 태스크가 끊기면 남은 구독자를 위해 재구독하고 이후 메시지를 계속 전달"""
+        async with self.hub.subscribe("ch") as queue:
+            # Given - upstream 구독 연결이 끊김
+            topic = self.hub._topics["ch"]
+            broken = topic.pubsub
+            await broken.aclose()
+
+            # When
+            await _until(lambda: self.hub.resubscribe_count == 1)
+
+            # Then - 새 구독으로 교체되어 기존/새 구독자 모두 수신
+            assert topic.pubsub is not broken
+            async with self.hub.subscribe("ch") as late:
+                await self.redis.publish("ch", json.dumps({"n": 1}))
+                assert await _receive(queue) == {"n": 1}
+                assert await _receive(late) == {"n": 1}
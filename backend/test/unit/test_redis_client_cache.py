@@ -0,0 +1,185 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.config.setting import settings
+from app.core.redis import create_redis_client
+from app.core.redis_client_cache import RedisClientCache
+
+
+async def _until(condition, timeout: float = 2.0) -> None:
+    """조건이 참이 될 때까지 대기"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "조건 대기 시간 초과"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.unit
+class TestRedisClientCache:
+    """
+    RedisClientCache 단위 테스트 (fakeredis)
+
+    fakeredis는 CLIENT TRACKING을 지원하지 않으므로 추적 연결은 준비된 것으로 두고,
+    서버가 보내는 invalidation은 __redis__:invalidate 채널 발행 또는 _invalidate 호출로 재현
+    """
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, fake_redis):
+        self.redis = fake_redis
+        self.cache = RedisClientCache(prefixes=["progress:"], max_entries=2, max_age=60, check_interval=0.05)
+        self.cache._ready = True
+        await self.redis.set("progress:a", "1")
+        await self.redis.set("progress:b", "2")
+        await self.redis.set("other", "x")
+
+    async def test_hit_after_miss_and_invalidation_removes_entry(self):
+        """두 번째 조회는 로컬 캐시, invalidation 후에는 다시 Redis 조회"""
+        # When
+        assert await self.cache.execute("GET", "progress:a") == "1"
+        await self.redis.set("progress:a", "changed")
+        cached = await self.cache.execute("GET", "progress:a")
+
+        # Then
+        assert cached == "1"
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+
+        # When - 서버가 키 변경을 알림
+        self.cache._invalidate(["progress:a"])
+
+        # Then
+        assert await self.cache.execute("GET", "progress:a") == "changed"
+        assert self.cache.invalidations == 1
+
+    async def test_untracked_key_and_not_ready_bypass_cache(self):
+        """추적 대상이 아닌 키나 추적 연결이 없을 때는 저장하지 않음"""
+        await self.cache.execute("GET", "other")
+        self.cache._ready = False
+        await self.cache.execute("GET", "progress:a")
+
+        assert self.cache.stats()["entries"] == 0
+        assert (self.cache.hits, self.cache.misses) == (0, 0)
+
+    async def test_invalidation_during_read_is_not_cached(self):
+        """조회 도중 invalidation이 도착한 값은 캐시하지 않음"""
+        # Given - Redis 응답이 오기 전에 invalidation 도착
+        execute_command = self.redis.execute_command
+
+        async def racing_execute(*args, **kwargs):
+            value = await execute_command(*args, **kwargs)
+            self.cache._invalidate([args[1]])
+            return value
+
+        self.redis.execute_command = racing_execute
+
+        # When
+        assert await self.cache.execute("GET", "progress:a") == "1"
+
+        # Then
+        assert self.cache.stats()["entries"] == 0
+        assert not self.cache._dirty and not self.cache._inflight
+
+    async def test_flush_invalidation_clears_everything(self):
+        """keys가 None(FLUSHDB)이면 전체 항목 제거"""
+        await self.cache.execute("GET", "progress:a")
+        await self.cache.execute("GET", "progress:b")
+
+        self.cache._invalidate(None)
+
+        assert self.cache.stats()["entries"] == 0
+        assert not self.cache._key_index
+
+    async def test_lru_eviction_and_max_age(self):
+        """max_entries를 넘으면 가장 오래 안 쓴 항목부터 제거, max_age가 지난 항목은 재조회"""
+        # Given
+        await self.cache.execute("GET", "progress:a")
+        await self.cache.execute("GET", "progress:b")
+        await self.cache.execute("GET", "progress:a")  # a를 최근 사용으로
+
+        # When
+        await self.cache.execute("XLEN", "progress:c")
+
+        # Then
+        assert ("GET", "progress:b") not in self.cache._entries
+        assert ("GET", "progress:a") in self.cache._entries
+
+        # When - 보존 시간 초과
+        self.cache.max_age = 0
+        await self.cache.execute("GET", "progress:a")
+
+        # Then
+        assert self.cache.hits == 1
+
+    async def test_supervisor_applies_published_invalidation(self):
+        """__redis__:invalidate 채널 메시지를 받으면 해당 키 항목 제거"""
+        # Given
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(RedisClientCache.INVALIDATE_CHANNEL)
+        self.cache._pubsub = pubsub
+        self.cache._tracker = AsyncMock()
+        self.cache._tracker.execute_command.return_value = {"flags": ["on", "bcast"]}
+        await self.cache.execute("GET", "progress:a")
+        supervisor = asyncio.create_task(self.cache._supervise())
+
+        try:
+            # When
+            await self.redis.publish(RedisClientCache.INVALIDATE_CHANNEL, "progress:a")
+
+            # Then
+            await _until(lambda: self.cache.invalidations == 1)
+            assert self.cache.stats()["entries"] == 0
+        finally:
+            supervisor.cancel()
+            await pubsub.aclose()
+
+    async def test_broken_tracking_resets_cache(self):
+        """추적 REDIRECT가 깨지면 캐시를 비우고 재연결"""
+        # Given
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(RedisClientCache.INVALIDATE_CHANNEL)
+        self.cache._pubsub = pubsub
+        self.cache._tracker = AsyncMock()
+        self.cache._tracker.execute_command.return_value = {"flags": ["on", "broken_redirect"]}
+        self.cache._connect = AsyncMock()
+        await self.cache.execute("GET", "progress:a")
+
+        # When
+        supervisor = asyncio.create_task(self.cache._supervise())
+        try:
+            await _until(lambda: self.cache._connect.await_count >= 1)
+        finally:
+            supervisor.cancel()
+            await pubsub.aclose()
+
+        # Then
+        assert self.cache.resets == 1
+        assert not self.cache._ready
+        assert self.cache.stats()["entries"] == 0
+
+    async def test_tracking_connection_uses_shared_options(self, monkeypatch):
+        """추적 연결은 공유 클라이언트와 같은 설정으로 만들고 읽기 타임아웃만 없앰"""
+        # Given
+        tracker = AsyncMock()
+        create = Mock(return_value=tracker)
+        monkeypatch.setattr("app.core.redis_client_cache.create_redis_client", create)
+
+        # When
+        await self.cache._connect()
+        await self.cache._disconnect()
+
+        # Then
+        create.assert_called_once_with(socket_timeout=None, single_connection_client=True)
+        assert tracker.execute_command.await_args.args[:3] == ("CLIENT", "TRACKING", "ON")
+
+    def test_create_redis_client_keeps_timeouts_and_retry(self):
+        """전용 클라이언트도 연결 타임아웃/재시도 설정을 그대로 가짐"""
+        client = create_redis_client(socket_timeout=None, single_connection_client=True)
+        kwargs = client.connection_pool.connection_kwargs
+
+        assert kwargs["socket_timeout"] is None
+        assert kwargs["socket_connect_timeout"] == settings.REDIS_SOCKET_CONNECT_TIMEOUT
+        assert kwargs["socket_keepalive"] is True
+        assert kwargs["health_check_interval"] == settings.REDIS_HEALTH_CHECK_INTERVAL
+        assert kwargs["retry"] is not None
+        assert client.single_connection_client
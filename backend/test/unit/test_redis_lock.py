@@ -0,0 +1,381 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.core.lock import RedisLock
+from app.core.lock.local import LocalLockRegistry
+from app.core.lock.redis_lock import wait_for_release
+
+
+@pytest.mark.unit
+class TestRedisLock:
+    """RedisLock 단위 테스트 (fakeredis)"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, fake_redis):
+        self.redis = fake_redis
+        self.lock = RedisLock()
+        # 다른 워커 프로세스 역할 (로컬 레지스트리를 공유하지 않음, 토큰은 태스크별이므로 별도 태스크에서 호출)
+        self.other = RedisLock()
+
+    async def test_mutual_exclusion(self):
+        """여러 워커의 여러 태스크 중 한 번에 하나만 임계 구역에 진입"""
+        # Given
+        active, max_active, entered = 0, 0, 0
+
+        async def worker(lock: RedisLock) -> None:
+            nonlocal active, max_active, entered
+            async with lock.lock("res", timeout=5) as lease:
+                assert lease
+                active += 1
+                max_active = max(max_active, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                entered += 1
+
+        # When
+        await asyncio.gather(*(worker(lock) for lock in [self.lock, self.other] * 4))
+
+        # Then
+        assert max_active == 1
+        assert entered == 8
+        assert not await self.lock.is_locked("res")
+
+    async def test_acquire_without_timeout_fails_immediately(self):
+        """timeout=None이면 이미 잠긴 락은 즉시 실패"""
+        assert await self.lock.acquire("res") is not None
+
+        assert await asyncio.wait_for(asyncio.create_task(self.other.acquire("res")), timeout=0.5) is None
+        assert await self.lock.release("res")
+
+    async def test_waiter_wakes_on_release(self):
+        """대기자는 해제 알림(Pub/Sub)으로 깨어나 바로 획득"""
+        # Given
+        assert await self.lock.acquire("res") is not None
+        waiter = asyncio.create_task(self.other.acquire("res", timeout=5))
+        await asyncio.sleep(0.1)
+        assert not waiter.done()
+
+        # When
+        loop = asyncio.get_running_loop()
+        released_at = loop.time()
+        assert await self.lock.release("res")
+        fence = await asyncio.wait_for(waiter, timeout=1)
+
+        # Then
+        assert fence is not None
+        assert loop.time() - released_at < 0.5
+
+    async def test_acquire_times_out(self):
+        """timeout 안에 해제되지 않으면 None"""
+        assert await self.lock.acquire("res") is not None
+
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        assert await asyncio.create_task(self.other.acquire("res", timeout=0.2)) is None
+        assert 0.2 <= loop.time() - started_at < 1
+
+    async def test_expired_lease_can_be_taken_over(self):
+        """TTL이 지나면 다른 워커가 획득하고, 이전 보유자의 해제는 실패"""
+        # Given
+        assert await self.lock.acquire("res", ttl=1) is not None
+
+        # When
+        await asyncio.sleep(1.1)
+        fence = await asyncio.create_task(self.other.acquire("res"))
+
+        # Then
+        assert fence is not None
+        assert not await self.lock.release("res")
+        assert await self.lock.is_locked("res")
+
+    async def test_auto_renew_keeps_lease_past_ttl(self):
+        """auto_renew면 TTL보다 오래 보유해도 lease가 유지됨"""
+        async with self.lock.lock("res", ttl=1, auto_renew=True) as lease:
+            await asyncio.sleep(1.5)
+
+            assert not lease.lost
+            assert await self.lock.is_owned_by_me("res")
+            assert await asyncio.create_task(self.other.acquire("res")) is None
+
+        assert not await self.lock.is_locked("res")
+
+    async def test_auto_renew_marks_lost_lease(self):
+        """연장에 실패하면(다른 보유자에게 넘어감) lease.lost로 알림"""
+        async with self.lock.lock("res", ttl=1, auto_renew=True) as lease:
+            # When - 락 키가 외부에서 사라짐
+            await self.redis.delete(self.lock.lock_key("res"))
+
+            # Then - 다음 연장 주기에 상실로 표시
+            await asyncio.wait_for(lease.lost_event.wait(), timeout=1)
+            assert lease.lost
+
+    async def test_fencing_tokens_increase_across_workers(self):
+        """fencing token은 어느 워커가 획득하든 획득 순서대로 증가"""
+        # Given
+        fences = []
+
+        async def worker(lock: RedisLock) -> None:
+            async with lock.lock("res", timeout=5) as lease:
+                fences.append(lease.fencing_token)
+                await asyncio.sleep(0.01)
+
+        # When
+        await asyncio.gather(*(worker(lock) for lock in [self.lock, self.other] * 3))
+
+        # Then
+        assert fences == sorted(fences)
+        assert len(set(fences)) == 6
+
+    async def test_fence_counter_does_not_expire(self):
+        """fence 카운터는 TTL 없이 유지되어 오랫동안 쉬어도 토큰이 다시 1부터 시작하지 않음"""
+        async with self.lock.lock("res") as lease:
+            assert lease.fencing_token == 1
+
+        assert await self.redis.ttl(self.lock._get_fence_key("res")) == -1
+
+    async def test_same_process_waiters_coalesce_locally(self):
+        """같은 프로세스의 대기자는 로컬 락에서 기다려 Redis 경합에 참여하지 않음"""
+        # Given
+        attempts = 0
+        try_acquire = self.lock._try_acquire
+
+        async def counting_try_acquire(*args, **kwargs):
+            nonlocal attempts
+            attempts += 1
+            return await try_acquire(*args, **kwargs)
+
+        self.lock._try_acquire = counting_try_acquire
+        assert await self.lock.acquire("res") is not None
+
+        async def worker() -> None:
+            async with self.lock.lock("res", timeout=5) as lease:
+                assert lease
+
+        # When
+        workers = [asyncio.create_task(worker()) for _ in range(5)]
+        await asyncio.sleep(0.1)
+
+        # Then - 보유 중에는 Redis 시도 없이 로컬에서 대기
+        assert attempts == 1
+        assert self.lock._local.waiters("res") == 5
+
+        # When - 해제 후 차례로 한 번씩만 시도해 획득
+        await self.lock.release("res")
+        await asyncio.gather(*workers)
+
+        # Then
+        assert attempts == 6
+        assert self.lock._local.waiters("res") == 0
+        assert not self.lock._local._entries
+
+
+@pytest.mark.unit
+class TestLocalLockRegistry:
+    """LocalLockRegistry 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.registry = LocalLockRegistry()
+
+    async def test_timeout_semantics(self):
+        """timeout=None은 즉시 실패, 양수는 그 시간까지 대기"""
+        assert await self.registry.acquire("res")
+
+        assert not await self.registry.acquire("res")
+        assert not await self.registry.acquire("res", timeout=0.05)
+        assert self.registry.waiters("res") == 0
+
+    async def test_release_hands_over_to_waiter(self):
+        """해제하면 대기자가 이어받고, 사용자가 없으면 항목이 정리됨"""
+        # Given
+        assert await self.registry.acquire("res")
+        waiter = asyncio.create_task(self.registry.acquire("res", timeout=0))
+        await asyncio.sleep(0)
+        assert self.registry.waiters("res") == 1
+
+        # When
+        self.registry.release("res")
+
+        # Then
+        assert await waiter
+        self.registry.release("res")
+        assert not self.registry._entries
+
+    async def test_cancelled_waiter_is_cleaned_up(self):
+        """대기 중 취소된 코루틴은 대기자 수에서 빠짐"""
+        assert await self.registry.acquire("res")
+        waiter = asyncio.create_task(self.registry.acquire("res", timeout=0))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert self.registry.waiters("res") == 0
+        self.registry.release("res")
+        assert not self.registry._entries
+
+
+@pytest.mark.unit
+class TestRedisLockScripts:
+    """RedisLock 스크립트 캐시와 일괄 해제/연장 단위 테스트 (fakeredis)"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, fake_redis):
+        self.redis = fake_redis
+        self.lock = RedisLock()
+
+    async def test_scripts_are_registered_once_per_client(self):
+        """load_scripts로 미리 SCRIPT LOAD하고, 이후 호출은 같은 스크립트 객체(EVALSHA)를 재사용"""
+        # Given
+        await self.lock.load_scripts()
+        registered = await self.redis.script_exists(self.lock._script(self.redis, RedisLock.ACQUIRE_SCRIPT).sha)
+        assert registered == [True]
+
+        # When
+        for _ in range(3):
+            assert await self.lock.acquire("res") is not None
+            assert await self.lock.release("res")
+
+        # Then - 같은 클라이언트에는 스크립트 객체가 재사용됨
+        assert self.lock._script(self.redis, RedisLock.ACQUIRE_SCRIPT) is self.lock._script(self.redis, RedisLock.ACQUIRE_SCRIPT)
+
+    async def test_release_many(self):
+        """보유한 락만 한 번에 해제하고 이름별 결과 반환"""
+        # Given
+        for name in ("a", "b"):
+            assert await self.lock.acquire(name) is not None
+        await self.redis.set(self.lock.lock_key("b"), "stolen")
+
+        # When
+        results = await self.lock.release_many(["a", "b", "c"])
+
+        # Then
+        assert results == {"a": True, "b": False, "c": False}
+        assert not await self.lock.is_locked("a")
+        assert await self.redis.get(self.lock.lock_key("b")) == "stolen"
+        assert not self.lock._local._entries
+
+    async def test_extend_many(self):
+        """보유한 락만 한 번에 TTL 연장"""
+        # Given
+        for name in ("a", "b"):
+            assert await self.lock.acquire(name, ttl=5) is not None
+
+        # When
+        results = await self.lock.extend_many(["a", "b", "c"], ttl=60)
+
+        # Then
+        assert results == {"a": True, "b": True, "c": False}
+        assert await self.redis.ttl(self.lock.lock_key("a")) > 30
+        await self.lock.release_many(["a", "b"])
+
+
+@pytest.mark.unit
+class TestWaitForRelease:
+    """wait_for_release 단위 테스트 (fakeredis Pub/Sub)"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, fake_redis):
+        self.redis = fake_redis
+
+    async def test_single_attempt_without_timeout(self):
+        """timeout=None이면 한 번만 시도"""
+        calls = []
+
+        async def attempt():
+            calls.append(1)
+            return None
+
+        assert await wait_for_release("ch", attempt, None) is None
+        assert len(calls) == 1
+
+    async def test_retries_on_release_message(self, monkeypatch):
+        """해제 알림을 받으면 백오프를 기다리지 않고 바로 재시도"""
+        # Given - 백오프로는 timeout 안에 재시도하지 않도록 설정
+        monkeypatch.setattr("app.core.lock.redis_lock.BACKOFF_BASE", 10.0)
+        available = False
+        calls = []
+
+        async def attempt():
+            calls.append(1)
+            return "ok" if available else None
+
+        waiter = asyncio.create_task(wait_for_release("ch", attempt, 5))
+        await asyncio.sleep(0.1)
+        assert len(calls) == 2  # 구독 전 1회 + 구독 후 1회
+
+        # When
+        available = True
+        await self.redis.publish("ch", "1")
+
+        # Then
+        assert await asyncio.wait_for(waiter, timeout=0.5) == "ok"
+        assert len(calls) == 3
+
+    async def test_falls_back_to_polling_when_subscribe_fails(self, monkeypatch):
+        """구독이 실패해도 None으로 끝내지 않고 백오프 폴링으로 재시도"""
+        # Given - 구독이 항상 실패하는 허브
+        class FailingHub:
+            @asynccontextmanager
+            async def subscribe(self, channel):
+                raise ConnectionError("pubsub down")
+                yield
+
+        monkeypatch.setattr("app.core.lock.redis_lock.get_pubsub_hub", lambda: FailingHub())
+        calls = []
+
+        async def attempt():
+            calls.append(1)
+            return "ok" if len(calls) >= 4 else None
+
+        # When
+        result = await asyncio.wait_for(wait_for_release("ch", attempt, 5), timeout=2)
+
+        # Then
+        assert result == "ok"
+        assert len(calls) == 4
+
+    async def test_stalled_subscribe_respects_timeout(self, monkeypatch):
+        """구독이 멈춰도 호출자의 timeout 안에 끝남"""
+        # Given - 구독 확인이 오지 않는 허브
+        class StalledHub:
+            @asynccontextmanager
+            async def subscribe(self, channel):
+                await asyncio.sleep(60)
+                yield asyncio.Queue()
+
+        monkeypatch.setattr("app.core.lock.redis_lock.get_pubsub_hub", lambda: StalledHub())
+
+        async def attempt():
+            return None
+
+        # When
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await wait_for_release("ch", attempt, 0.3)
+
+        # Then
+        assert result is None
+        assert loop.time() - start < 1.0
+
+    async def test_lock_acquires_after_release_without_pubsub(self, monkeypatch):
+        """허브 구독이 실패해도 해제된 락은 timeout 안에 획득"""
+        # Given
+        class FailingHub:
+            @asynccontextmanager
+            async def subscribe(self, channel):
+                raise ConnectionError("pubsub down")
+                yield
+
+        monkeypatch.setattr("app.core.lock.redis_lock.get_pubsub_hub", lambda: FailingHub())
+        holder, waiter_lock = RedisLock(), RedisLock()
+        assert await asyncio.create_task(holder.acquire("job", ttl=1)) is not None
+
+        # When - TTL 만료로 해제됨 (알림 없음)
+        fence = await asyncio.create_task(waiter_lock.acquire("job", timeout=5))
+
+        # Then
+        assert fence is not None
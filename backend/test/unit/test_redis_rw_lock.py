@@ -0,0 +1,115 @@
+import asyncio
+import pytest
+
+from app.core.lock.redis_rw_lock import RedisReadWriteLock
+
+
+@pytest.mark.unit
+class TestRedisReadWriteLock:
+    """RedisReadWriteLock 단위 테스트 (fakeredis)"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, fake_redis):
+        self.redis = fake_redis
+        self.lock = RedisReadWriteLock()
+        self.readers_key = self.lock._keys("res")["readers"]
+
+    async def test_nested_reads_release_every_token(self):
+        """같은 태스크에서 중첩으로 잡은 읽기 락은 토큰을 모두 보관하고 해제 시 남기지 않음"""
+        # Given
+        assert await self.lock.acquire_read("res")
+        assert await self.lock.acquire_read("res")
+        assert await self.redis.zcard(self.readers_key) == 2
+
+        # When
+        assert await self.lock.release_read("res")
+        assert await self.redis.zcard(self.readers_key) == 1
+        assert await self.lock.release_read("res")
+
+        # Then
+        assert await self.redis.zcard(self.readers_key) == 0
+        assert not await self.lock.release_read("res")
+        assert not await self.lock.is_locked("res")
+
+    async def test_extend_read_extends_nested_tokens(self):
+        """중첩 보유 중 extend_read는 모든 토큰의 만료를 연장"""
+        async with self.lock.read_lock("res", ttl=1), self.lock.read_lock("res", ttl=1):
+            before = [score for _, score in await self.redis.zrange(self.readers_key, 0, -1, withscores=True)]
+
+            assert await self.lock.extend_read("res", 60)
+
+            after = [score for _, score in await self.redis.zrange(self.readers_key, 0, -1, withscores=True)]
+            assert len(after) == 2
+            assert all(new > old + 50_000 for old, new in zip(before, after))
+
+        assert await self.redis.zcard(self.readers_key) == 0
+
+    async def test_writer_excludes_readers_and_waits_for_them(self):
+        """reader가 있으면 writer는 대기하고, writer가 보유 중이면 reader는 실패"""
+        # Given - reader 보유 중
+        assert await self.lock.acquire_read("res")
+
+        # When - 다른 태스크의 writer는 즉시 획득 실패, 대기하면 reader 해제 후 획득
+        assert await asyncio.create_task(self.lock.acquire("res")) is None
+        writer = asyncio.create_task(self.lock.acquire("res", timeout=2))
+        await asyncio.sleep(0.05)
+        assert not writer.done()
+        await self.lock.release_read("res")
+        fence = await writer
+
+        # Then
+        assert fence is not None
+        assert not await asyncio.create_task(self.lock.acquire_read("res"))
+
+    async def test_fencing_tokens_increase(self):
+        """쓰기 락 fencing token은 획득마다 증가"""
+        fences = []
+        for _ in range(3):
+            async with self.lock.lock("res") as lease:
+                fences.append(lease.fencing_token)
+
+        assert fences == sorted(fences)
+        assert len(set(fences)) == 3
+        assert await self.redis.ttl(self.lock._keys("res")["fence"]) == -1
+
+    async def test_writers_coalesce_on_local_registry(self):
+        """같은 프로세스의 writer들은 로컬 락에서 대기하고 Redis 경합에는 하나만 참여"""
+        # Given
+        assert await self.lock.acquire("res") is not None
+
+        async def write() -> int:
+            fence = await self.lock.acquire("res", timeout=2)
+            await self.lock.release("res")
+            return fence
+
+        # When
+        waiters = [asyncio.create_task(write()) for _ in range(3)]
+        await asyncio.sleep(0.05)
+
+        # Then - 보유자 1 + 대기자 3이 모두 로컬 레지스트리에 있음
+        assert self.lock._local.waiters("res") == 3
+        assert await self.lock.release("res")
+        fences = await asyncio.gather(*waiters)
+        assert len(set(fences)) == 3
+        assert self.lock._local.waiters("res") == 0
+        assert not await self.lock.is_locked("res")
+
+    async def test_waiting_readers_coalesce_on_local_registry(self):
+        """writer가 보유 중일 때 대기하는 reader는 로컬 락으로 하나씩만 Redis에서 대기"""
+        # Given
+        assert await self.lock.acquire("res") is not None
+
+        async def read() -> bool:
+            acquired = await self.lock.acquire_read("res", timeout=2)
+            await self.lock.release_read("res")
+            return acquired
+
+        # When
+        readers = [asyncio.create_task(read()) for _ in range(3)]
+        await asyncio.sleep(0.05)
+
+        # Then
+        assert self.lock._local.waiters(self.lock._read_wait_name("res")) == 2
+        await self.lock.release("res")
+        assert await asyncio.gather(*readers) == [True, True, True]
+        assert await self.redis.zcard(self.readers_key) == 0
@@ -0,0 +1,78 @@
+import asyncio
+import pytest
+
+from app.core.lock.redis_semaphore import RedisSemaphore
+
+
+@pytest.mark.unit
+class TestRedisSemaphore:
+    """RedisSemaphore 단위 테스트 (fakeredis)"""
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, fake_redis):
+        self.redis = fake_redis
+        self.semaphore = RedisSemaphore(default_limit=3)
+
+    async def test_concurrency_never_exceeds_limit(self):
+        """동시에 보유하는 lease 수는 limit을 넘지 않고, 모든 대기자가 결국 실행"""
+        # Given
+        active, max_active, done = 0, 0, 0
+
+        async def call() -> None:
+            nonlocal active, max_active, done
+            async with self.semaphore.lock("llm", timeout=5) as lease:
+                assert lease
+                active += 1
+                max_active = max(max_active, active)
+                await asyncio.sleep(0.02)
+                active -= 1
+                done += 1
+
+        # When
+        await asyncio.gather(*(call() for _ in range(10)))
+
+        # Then
+        assert max_active == 3
+        assert done == 10
+        assert await self.semaphore.count("llm") == 0
+
+    async def test_acquire_fails_when_full(self):
+        """한도까지 찬 상태에서 timeout=None이면 즉시 실패, 반환되면 다시 획득 가능"""
+        # Given
+        self.semaphore.set_limit("llm", 1)
+        assert await self.semaphore.acquire("llm") is not None
+
+        # When & Then
+        assert await self.semaphore.is_locked("llm")
+        assert await asyncio.create_task(self.semaphore.acquire("llm")) is None
+        assert await self.semaphore.release("llm")
+        assert await asyncio.create_task(self.semaphore.acquire("llm")) is not None
+        assert await self.redis.ttl(self.semaphore._get_fence_key("llm")) == -1
+
+    async def test_expired_lease_frees_slot(self):
+        """반환하지 못한 lease는 TTL 후 자리를 비움"""
+        # Given
+        self.semaphore.set_limit("llm", 1)
+        assert await self.semaphore.acquire("llm", ttl=1) is not None
+
+        # When
+        await asyncio.sleep(1.1)
+
+        # Then
+        assert await self.semaphore.count("llm") == 0
+        assert await asyncio.create_task(self.semaphore.acquire("llm")) is not None
+        assert not await self.semaphore.release("llm")
+
+    async def test_extend_keeps_lease(self):
+        """extend로 연장한 lease는 원래 TTL이 지나도 유지"""
+        # Given
+        self.semaphore.set_limit("llm", 1)
+        assert await self.semaphore.acquire("llm", ttl=1) is not None
+
+        # When
+        assert await self.semaphore.extend("llm", 5)
+        await asyncio.sleep(1.1)
+
+        # Then
+        assert await self.semaphore.count("llm") == 1
+        assert await self.semaphore.release("llm")
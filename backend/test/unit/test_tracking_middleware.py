@@ -0,0 +1,177 @@
+import pytest
+import httpx
+from unittest.mock import AsyncMock, Mock
+
+from fastapi import FastAPI, Request
+
+from app.config.setting import settings
+from app.middleware.auth import BearerTokenAuthMiddleware
+from app.middleware.tracking import (
+    ErrorTrackingMiddleware,
+    MongoDBLoggingMiddleware,
+    RequestIDMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+
+def _build_app(log_writer, monkeypatch) -> FastAPI:
+    """main.create_app()과 같은 순서로 미들웨어를 쌓은 작은 앱"""
+    monkeypatch.setattr("app.middleware.tracking.get_log_writer", lambda: log_writer)
+
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items(request: Request):
+        request.state.user_id = "user-1"
+        return {"request_id": request.state.request_id}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(MongoDBLoggingMiddleware)
+    app.add_middleware(ErrorTrackingMiddleware)
+    app.add_middleware(BearerTokenAuthMiddleware)
+    app.add_middleware(RequestIDMiddleware)
+    return app
+
+
+def _client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app, raise_app_exceptions=False, client=("10.0.0.1", 1234)),
+        base_url="http://test",
+    )
+
+
+@pytest.mark.unit
+class TestTrackingMiddleware:
+    """요청 추적/보안 헤더/로그 미들웨어 단위 테스트 (ASGI)"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        monkeypatch.setattr(settings, "ENVIRONMENT", "DEV")
+        self.log_writer = Mock()
+        self.log_writer.enqueue = AsyncMock()
+        self.client = _client(_build_app(self.log_writer, monkeypatch))
+
+    async def test_generates_request_id_and_headers(self):
+        """요청 ID를 만들어 scope["state"]와 응답 헤더에 넣고 보안/처리 시간 헤더 추가"""
+        # When
+        response = await self.client.get("/items")
+
+        # Then
+        request_id = response.headers["X-Request-ID"]
+        assert request_id
+        assert response.json() == {"request_id": request_id}
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert float(response.headers["X-Process-Time"]) >= 0
+
+    async def test_keeps_incoming_request_id(self):
+        """요청 헤더의 X-Request-ID가 있으면 그대로 사용"""
+        # When
+        response = await self.client.get("/items", headers={"X-Request-ID": "req-123"})
+
+        # Then
+        assert response.headers["X-Request-ID"] == "req-123"
+        assert response.json() == {"request_id": "req-123"}
+
+    async def test_enqueues_api_log(self):
+        """응답 후 API 호출 로그를 LogWriter 큐에 넣음 (user_id는 scope["state"]에서)"""
+        # When
+        await self.client.get("/items")
+
+        # Then
+        self.log_writer.enqueue.assert_awaited_once()
+        log = self.log_writer.enqueue.await_args.args[0]
+        assert log["called_api"] == "/items"
+        assert log["method"] == "GET"
+        assert log["status_code"] == 200
+        assert log["user_id"] == "user-1"
+        assert log["ip_address"] == "10.0.0.1"
+        assert log["response_time"] >= 0
+
+    async def test_enqueues_log_on_exception(self):
+        """처리 중 예외가 나도 500으로 로그를 남김"""
+        # When
+        response = await self.client.get("/boom")
+
+        # Then
+        assert response.status_code == 500
+        log = self.log_writer.enqueue.await_args.args[0]
+        assert log["called_api"] == "/boom"
+        assert log["status_code"] == 500
+        assert log["user_id"] is None
+
+    async def test_enqueue_failure_does_not_fail_request(self):
+        """로그 큐 적재가 실패해도 응답은 그대로"""
+        # Given
+        self.log_writer.enqueue.side_effect = RuntimeError("queue down")
+
+        # When
+        response = await self.client.get("/items")
+
+        # Then
+        assert response.status_code == 200
+
+
+@pytest.mark.unit
+class TestBearerTokenAuthMiddleware:
+    """BearerTokenAuthMiddleware 단위 테스트 (ASGI)"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        monkeypatch.setattr(settings, "ENVIRONMENT", "PROD")
+        monkeypatch.setattr(settings, "ACCESS_TOKEN", "secret")
+        self.log_writer = Mock()
+        self.log_writer.enqueue = AsyncMock()
+        self.client = _client(_build_app(self.log_writer, monkeypatch))
+
+    @pytest.mark.parametrize("headers, detail", [
+        ({}, "Authorization header required"),
+        ({"Authorization": "Basic secret"}, "Invalid authorization header format"),
+        ({"Authorization": "secret"}, "Invalid authorization header format"),
+        ({"Authorization": "Bearer wrong"}, "Invalid access token"),
+    ])
+    async def test_rejects_invalid_token(self, headers, detail):
+        """토큰이 없거나 형식/값이 틀리면 401 (요청 ID 헤더는 유지, 라우터는 실행되지 않음)"""
+        # When
+        response = await self.client.get("/items", headers=headers)
+
+        # Then
+        assert response.status_code == 401
+        assert response.json() == {"detail": detail}
+        assert response.headers["X-Request-ID"]
+        self.log_writer.enqueue.assert_not_awaited()
+
+    async def test_accepts_valid_token(self):
+        """올바른 Bearer 토큰이면 통과"""
+        # When
+        response = await self.client.get("/items", headers={"Authorization": "Bearer secret"})
+
+        # Then
+        assert response.status_code == 200
+        self.log_writer.enqueue.assert_awaited_once()
+
+    async def test_excluded_path_skips_auth(self):
+        """제외 경로는 토큰 없이 통과"""
+        # When
+        response = await self.client.get("/health")
+
+        # Then
+        assert response.status_code == 200
+
+    async def test_skips_auth_outside_prod(self, monkeypatch):
+        """PROD가 아니면 인증하지 않음"""
+        # Given
+        monkeypatch.setattr(settings, "ENVIRONMENT", "DEV")
+
+        # When
+        response = await self.client.get("/items")
+
+        # Then
+        assert response.status_code == 200
@@ -0,0 +1,121 @@
+import pytest
+import httpx
+from unittest.mock import Mock
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
+
+from app.core.exception.handler import register_exception_handlers
+from app.database.session import in_transaction
+from app.middleware.transaction import RequestTransactionMiddleware
+
+
+class FakeUnitOfWork:
+    """커밋/롤백 횟수만 기록하는 UnitOfWork 대역"""
+
+    def __init__(self, fail_commit: bool = False) -> None:
+        self.fail_commit = fail_commit
+        self.session = Mock()
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def __aenter__(self):
+        return self.session
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc:
+            await self.rollback()
+
+    async def commit(self) -> None:
+        if self.fail_commit:
+            raise RuntimeError("commit failed")
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+@pytest.mark.unit
+class TestRequestTransactionMiddleware:
+    """RequestTransactionMiddleware 단위 테스트 (ASGI)"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.uows = []
+        self.seen_transaction = []
+
+        app = FastAPI()
+        register_exception_handlers(app)
+        app.add_middleware(RequestTransactionMiddleware, uow_factory=self._uow_factory)
+        self.fail_commit = False
+
+        @app.post("/items")
+        async def create():
+            self.seen_transaction.append(in_transaction())
+            return JSONResponse({"created": True}, status_code=201)
+
+        @app.post("/conflict")
+        async def conflict():
+            raise HTTPException(status_code=409, detail="conflict")
+
+        @app.post("/error")
+        async def error():
+            return JSONResponse({"ok": False}, status_code=503)
+
+        @app.get("/items")
+        async def read():
+            self.seen_transaction.append(in_transaction())
+            return {"items": []}
+
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app, raise_app_exceptions=False),
+            base_url="http://test",
+        )
+
+    def _uow_factory(self) -> FakeUnitOfWork:
+        uow = FakeUnitOfWork(fail_commit=self.fail_commit)
+        self.uows.append(uow)
+        return uow
+
+    async def test_success_commits(self):
+        """400 미만 응답이면 커밋하고, 핸들러는 요청 세션 안에서 실행"""
+        # When
+        response = await self.client.post("/items")
+
+        # Then
+        assert response.status_code == 201
+        assert self.seen_transaction == [True]
+        assert (self.uows[0].commits, self.uows[0].rollbacks) == (1, 0)
+
+    @pytest.mark.parametrize("path, status", [("/conflict", 409), ("/error", 503)])
+    async def test_error_status_rolls_back(self, path, status):
+        """4xx/5xx 응답이면 롤백"""
+        # When
+        response = await self.client.post(path)
+
+        # Then
+        assert response.status_code == status
+        assert (self.uows[0].commits, self.uows[0].rollbacks) == (0, 1)
+
+    async def test_safe_method_bypasses(self):
+        """GET은 요청 단위 트랜잭션을 열지 않음"""
+        # When
+        response = await self.client.get("/items")
+
+        # Then
+        assert response.status_code == 200
+        assert self.uows == []
+        assert self.seen_transaction == [False]
+
+    async def test_commit_failure_returns_500(self):
+        """커밋이 실패하면 원래 응답 대신 500을 보내고 롤백"""
+        # Given
+        self.fail_commit = True
+
+        # When
+        response = await self.client.post("/items")
+
+        # Then - 성공 응답의 헤더/본문은 나가지 않음
+        assert response.status_code == 500
+        assert response.json()["error"]["code"] == "INTERNAL_ERROR"
+        assert (self.uows[0].commits, self.uows[0].rollbacks) == (0, 1)
@@ -1,7 +1,16 @@
+import asyncio
+from datetime import datetime
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import ANY, AsyncMock, Mock
+from sqlalchemy.exc import IntegrityError
 
-from app.dto.user import UserUpdateDTO, UserDTO
+from app.config.setting import settings
+from app.core.cache import CacheService
+from app.core.single_flight import SingleFlight
+from app.database.session import UnitOfWork, in_transaction, use_session
+from app.dto.user import UserCreateDTO, UserUpdateDTO, UserDTO, CountStrategy, BulkStatus
+from app.service.user import USER_CACHE_NAMESPACE, USER_COUNT_CACHE_KEY
+from app.util.cursor import decode_cursor, encode_cursor
 
 
 @pytest.mark.unit
@@ -22,45 +31,140 @@ class TestUserServiceDI:
     async def test_create_user_success(self):
         """사용자 생성 성공 테스트 - DI 패턴"""
         # Given
-        self.mock_repository.get_by_email.return_value = None  # 기존 사용자 없음
         self.mock_repository.create.return_value = self.sample_user_dto
         
         # When
         result = await self.user_service.create_user(self.sample_user_create_dto)
         
-        # Then
+        # Then - 사전 조회 없이 INSERT 한 번
         assert result == self.sample_user_dto
-        self.mock_repository.get_by_email.assert_called_once_with(self.sample_user_create_dto.email)
+        self.mock_repository.get_by_email.assert_not_called()
         self.mock_repository.create.assert_called_once_with(self.sample_user_create_dto)
 
     async def test_create_user_already_exists(self):
         """사용자 생성 실패 - 이미 존재하는 이메일"""
         # Given
-        self.mock_repository.get_by_email.return_value = self.sample_user_dto  # 이미 존재
+        self.mock_repository.create.return_value = None  # ON CONFLICT로 삽입되지 않음
         
         # When & Then
         with pytest.raises(ValueError, match="already exists"):
             await self.user_service.create_user(self.sample_user_create_dto)
         
-        self.mock_repository.get_by_email.assert_called_once_with(self.sample_user_create_dto.email)
-        self.mock_repository.create.assert_not_called()
+        self.mock_repository.get_by_email.assert_not_called()
+        self.mock_repository.create.assert_called_once_with(self.sample_user_create_dto)
 
-    async def test_create_user_with_session_success(self):
-        """세션을 사용한 사용자 생성 성공 테스트"""
+    async def test_create_user_joins_request_session(self):
+        """요청 단위 세션이 열려 있으면 새 UnitOfWork 없이 그 세션에 참여"""
         # Given
-        mock_session = AsyncMock()
-        self.mock_repository.get_by_email.return_value = None
+        request_session = AsyncMock()
         self.mock_repository.create.return_value = self.sample_user_dto
         
         # When
-        result = await self.user_service.create_user_with_session(
-            mock_session, self.sample_user_create_dto
-        )
+        with use_session(request_session):
+            result = await self.user_service.create_user(self.sample_user_create_dto)
+            await self.user_service.get_user_by_email(self.sample_user_create_dto.email)
         
         # Then
         assert result == self.sample_user_dto
-        self.mock_repository.get_by_email.assert_called_once_with(self.sample_user_create_dto.email)
-        self.mock_repository.create.assert_called_once_with(self.sample_user_create_dto)
+        self.user_service.uow.__aenter__.assert_not_called()
+        self.user_service.uow.reader.assert_not_called()
+
+    async def test_bulk_create_users_row_results(self, sample_user_list):
+        """일괄 생성 - 입력 순서대로 created/skipped/duplicate 결과"""
+        # Given - user1은 생성, user2는 이미 존재, user1 중복
+        rows = [
+            UserCreateDTO(email="user1@example.com", name="User One"),
+            UserCreateDTO(email="user2@example.com", name="User Two"),
+            UserCreateDTO(email="user1@example.com", name="Again"),
+        ]
+        self.mock_repository.bulk_create.return_value = sample_user_list[:1]
+
+        # When
+        results = await self.user_service.bulk_create_users(rows)
+
+        # Then
+        assert [result.status for result in results] == [
+            BulkStatus.CREATED, BulkStatus.SKIPPED, BulkStatus.DUPLICATE
+        ]
+        assert results[0].user == sample_user_list[0]
+        # 중복 제거된 행만 한 번에 전달
+        self.mock_repository.bulk_create.assert_called_once_with(
+            rows[:2], batch_size=ANY, copy_threshold=ANY
+        )
+        self.mock_repository.get_by_email.assert_not_called()
+
+    async def test_bulk_create_users_upsert(self, sample_user_list):
+        """일괄 업서트 - 새 이메일은 created, 기존 이메일은 updated"""
+        # Given
+        rows = [UserCreateDTO(email=user.email, name=user.name) for user in sample_user_list]
+        self.mock_repository.bulk_upsert.return_value = [
+            (sample_user_list[0], True),
+            (sample_user_list[1], False),
+        ]
+
+        # When
+        results = await self.user_service.bulk_create_users(rows, upsert=True)
+
+        # Then
+        assert [result.status for result in results] == [BulkStatus.CREATED, BulkStatus.UPDATED]
+        self.mock_repository.bulk_create.assert_not_called()
+
+    async def test_bulk_create_users_failed_batch_falls_back_to_rows(self, sample_user_list):
+        """일괄 생성 - 배치가 실패하면 행 단위로 다시 넣고 실패한 행만 failed"""
+        # Given - 배치 INSERT 실패, 행 단위로는 user2만 실패
+        rows = [UserCreateDTO(email=user.email, name=user.name) for user in sample_user_list]
+        error = IntegrityError("INSERT", None, Exception("bad row"))
+        self.mock_repository.bulk_create.side_effect = [error, [sample_user_list[0]], error]
+
+        # When
+        results = await self.user_service.bulk_create_users(rows)
+
+        # Then
+        assert [result.status for result in results] == [BulkStatus.CREATED, BulkStatus.FAILED]
+        assert results[1].error == "bad row"
+        assert self.mock_repository.bulk_create.call_count == 3
+
+    async def test_bulk_create_users_bisects_failed_batch(self):
+        """일괄 생성 - 실패한 배치는 반씩 나눠 다시 시도 (행마다 SAVEPOINT를 만들지 않음)"""
+        # Given - 4행 중 마지막 행만 실패
+        rows = [UserCreateDTO(email=f"user{i}@example.com", name=f"User {i}") for i in range(4)]
+        bad = rows[3].email
+
+        async def bulk_create(chunk, **kwargs):
+            if any(row.email == bad for row in chunk):
+                raise IntegrityError("INSERT", None, Exception("bad row"))
+            return [UserDTO(email=row.email, name=row.name, created_at=datetime.now()) for row in chunk]
+        self.mock_repository.bulk_create.side_effect = bulk_create
+
+        # When
+        results = await self.user_service.bulk_create_users(rows)
+
+        # Then - 전체(실패) → [0,1] → [2,3](실패) → [2] → [3](실패)
+        assert [result.status for result in results] == [BulkStatus.CREATED] * 3 + [BulkStatus.FAILED]
+        assert [len(call.args[0]) for call in self.mock_repository.bulk_create.call_args_list] == [4, 2, 2, 1, 1]
+
+    async def test_bulk_create_users_non_db_error_propagates(self):
+        """일괄 생성 - DB 오류가 아닌 예외는 행 단위 재시도 없이 그대로 전파"""
+        # Given
+        self.mock_repository.bulk_create.side_effect = RuntimeError("boom")
+
+        # When & Then
+        with pytest.raises(RuntimeError, match="boom"):
+            await self.user_service.bulk_create_users([self.sample_user_create_dto])
+
+        self.mock_repository.bulk_create.assert_called_once()
+
+    async def test_bulk_create_users_too_many_rows(self, monkeypatch):
+        """일괄 생성 실패 - 최대 행 수 초과"""
+        # Given
+        monkeypatch.setattr(settings, "USER_BULK_MAX_ROWS", 1)
+        rows = [self.sample_user_create_dto, self.sample_user_create_dto]
+
+        # When & Then
+        with pytest.raises(ValueError, match="Too many users"):
+            await self.user_service.bulk_create_users(rows)
+
+        self.mock_repository.bulk_create.assert_not_called()
 
     async def test_get_user_by_email_found(self):
         """이메일로 사용자 조회 성공 테스트"""
@@ -88,6 +192,73 @@ class TestUserServiceDI:
         assert result is None
         self.mock_repository.get_by_email.assert_called_once_with(email)
 
+    async def test_get_user_by_email_concurrent_calls_coalesced(self):
+        """같은 이메일 동시 조회는 Repository를 한 번만 호출 (single-flight)"""
+        # Given
+        email = "test@example.com"
+
+        async def slow_get_by_email(_email):
+            await asyncio.sleep(0.01)
+            return self.sample_user_dto
+        self.mock_repository.get_by_email.side_effect = slow_get_by_email
+
+        # When
+        results = await asyncio.gather(
+            *(self.user_service.get_user_by_email(email) for _ in range(5))
+        )
+
+        # Then
+        assert results == [self.sample_user_dto] * 5
+        self.mock_repository.get_by_email.assert_called_once_with(email)
+
+    async def test_get_user_by_email_in_transaction_not_coalesced(self):
+        """열린 트랜잭션 안의 조회는 single-flight로 합치지 않고 각자 자신의 세션에서 조회"""
+        # Given
+        email = "test@example.com"
+
+        async def slow_get_by_email(_email):
+            await asyncio.sleep(0.01)
+            return self.sample_user_dto
+        self.mock_repository.get_by_email.side_effect = slow_get_by_email
+
+        # When
+        with use_session(AsyncMock()):
+            await asyncio.gather(*(self.user_service.get_user_by_email(email) for _ in range(3)))
+
+        # Then
+        assert self.mock_repository.get_by_email.call_count == 3
+
+    async def test_single_flight_runs_outside_caller_transaction(self):
+        """single-flight 실행 태스크는 leader의 트랜잭션 세션을 물려받지 않음"""
+        # Given
+        async def load():
+            return in_transaction()
+
+        # When
+        with use_session(AsyncMock()):
+            leader_in_transaction = await SingleFlight().do("test", "key", load)
+
+        # Then
+        assert leader_in_transaction is False
+
+    async def test_read_methods_use_read_only_transaction(self):
+        """조회 메서드는 읽기 전용(replica) 트랜잭션, 변경 메서드는 primary 트랜잭션"""
+        # When
+        await self.user_service.get_user_by_email("test@example.com")
+        await self.user_service.get_all_users()
+        await self.user_service.get_users_by_cursor()
+
+        # Then
+        assert self.user_service.uow.reader.call_count == 3
+
+        # When
+        self.user_service.uow.reader.reset_mock()
+        self.mock_repository.create.return_value = self.sample_user_dto
+        await self.user_service.create_user(self.sample_user_create_dto)
+
+        # Then
+        self.user_service.uow.reader.assert_not_called()
+
     async def test_get_all_users_success(self, sample_user_list):
         """모든 사용자 조회 성공 테스트"""
         # Given
@@ -117,6 +288,84 @@ class TestUserServiceDI:
         # Then
         self.mock_repository.get_all.assert_called_once_with(skip=0, limit=100)
 
+    async def test_get_all_users_count_none(self, sample_user_list):
+        """전체 수 생략 - COUNT 쿼리 없이 total None"""
+        # Given
+        self.mock_repository.get_all.return_value = sample_user_list
+
+        # When
+        users, total = await self.user_service.get_all_users(count=CountStrategy.NONE)
+
+        # Then
+        assert users == sample_user_list
+        assert total is None
+        self.mock_repository.count_all.assert_not_called()
+        self.mock_repository.count_estimated.assert_not_called()
+
+    async def test_get_all_users_count_estimated(self):
+        """추정치 사용 - 임계값 이상이면 통계 기반 추정치 반환"""
+        # Given
+        self.mock_repository.count_estimated.return_value = settings.USER_COUNT_EXACT_THRESHOLD + 1
+
+        # When
+        _, total = await self.user_service.get_all_users(count=CountStrategy.ESTIMATED)
+
+        # Then
+        assert total == settings.USER_COUNT_EXACT_THRESHOLD + 1
+        self.mock_repository.count_all.assert_not_called()
+
+    async def test_get_all_users_count_estimated_small_table(self):
+        """추정치 사용 - 임계값 미만이거나 통계가 없으면 정확한 COUNT"""
+        # Given
+        self.mock_repository.count_estimated.return_value = 5
+        self.mock_repository.count_all.return_value = 7
+
+        # When
+        _, total = await self.user_service.get_all_users(count=CountStrategy.ESTIMATED)
+
+        # Then
+        assert total == 7
+        self.mock_repository.count_all.assert_called_once()
+
+    async def test_get_users_by_cursor_has_next_page(self, sample_user_list):
+        """커서 페이징 - 다음 페이지가 있으면 마지막 사용자 위치를 커서로 반환"""
+        # Given - limit보다 한 건 더 조회됨
+        self.mock_repository.get_all_by_cursor.return_value = sample_user_list
+        self.mock_repository.count_all.return_value = 2
+
+        # When
+        users, total, next_cursor = await self.user_service.get_users_by_cursor(limit=1)
+
+        # Then
+        assert users == sample_user_list[:1]
+        assert total == 2
+        assert decode_cursor(next_cursor) == (sample_user_list[0].created_at, sample_user_list[0].email)
+        self.mock_repository.get_all_by_cursor.assert_called_once_with(limit=2, after=None)
+
+    async def test_get_users_by_cursor_last_page(self, sample_user_list):
+        """커서 페이징 - 마지막 페이지면 next_cursor 없음, 전달받은 커서 위치부터 조회"""
+        # Given
+        cursor = encode_cursor(self.sample_user_dto.created_at, self.sample_user_dto.email)
+        self.mock_repository.get_all_by_cursor.return_value = sample_user_list
+
+        # When
+        users, _, next_cursor = await self.user_service.get_users_by_cursor(limit=2, cursor=cursor)
+
+        # Then
+        assert users == sample_user_list
+        assert next_cursor is None
+        self.mock_repository.get_all_by_cursor.assert_called_once_with(
+            limit=3, after=(self.sample_user_dto.created_at, self.sample_user_dto.email)
+        )
+
+    async def test_get_users_by_cursor_invalid_cursor(self):
+        """커서 페이징 실패 - 잘못된 커서"""
+        # When & Then
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await self.user_service.get_users_by_cursor(limit=10, cursor="broken")
+
+        self.mock_repository.get_all_by_cursor.assert_not_called()
+
     async def test_update_user_success(self):
         """사용자 업데이트 성공 테스트"""
         # Given
@@ -127,7 +376,6 @@ class TestUserServiceDI:
             created_at=self.sample_user_dto.created_at
         )
         
-        self.mock_repository.get_by_email.return_value = self.sample_user_dto
         self.mock_repository.update.return_value = updated_user
         
         # When
@@ -135,21 +383,20 @@ class TestUserServiceDI:
         
         # Then
         assert result == updated_user
-        self.mock_repository.get_by_email.assert_called_once_with(email)
+        self.mock_repository.get_by_email.assert_not_called()
         self.mock_repository.update.assert_called_once_with(email, self.sample_user_update_dto)
 
     async def test_update_user_not_found(self):
         """사용자 업데이트 실패 - 사용자 없음"""
         # Given
         email = "nonexistent@example.com"
-        self.mock_repository.get_by_email.return_value = None
+        self.mock_repository.update.return_value = None  # UPDATE 대상 행 없음
         
         # When & Then
         with pytest.raises(ValueError, match="not found"):
             await self.user_service.update_user(email, self.sample_user_update_dto)
         
-        self.mock_repository.get_by_email.assert_called_once_with(email)
-        self.mock_repository.update.assert_not_called()
+        self.mock_repository.update.assert_called_once_with(email, self.sample_user_update_dto)
 
     async def test_update_user_no_data(self):
         """사용자 업데이트 실패 - 업데이트할 데이터 없음"""
@@ -157,20 +404,28 @@ class TestUserServiceDI:
         email = "test@example.com"
         empty_update_dto = UserUpdateDTO()
         
-        self.mock_repository.get_by_email.return_value = self.sample_user_dto
+        self.mock_repository.update.return_value = Mock()  # 빈 업데이트는 기존 사용자 조회 결과
         
         # When & Then
         with pytest.raises(ValueError, match="No data provided"):
             await self.user_service.update_user(email, empty_update_dto)
         
-        self.mock_repository.get_by_email.assert_called_once_with(email)
-        self.mock_repository.update.assert_not_called()
+        self.mock_repository.update.assert_called_once_with(email, empty_update_dto)
+
+    async def test_update_user_no_data_not_found(self):
+        """사용자 업데이트 실패 - 데이터가 없어도 없는 사용자는 not found가 먼저"""
+        # Given
+        email = "nonexistent@example.com"
+        self.mock_repository.update.return_value = None
+        
+        # When & Then
+        with pytest.raises(ValueError, match="not found"):
+            await self.user_service.update_user(email, UserUpdateDTO())
 
     async def test_delete_user_success(self):
         """사용자 삭제 성공 테스트"""
         # Given
         email = "test@example.com"
-        self.mock_repository.get_by_email.return_value = self.sample_user_dto
         self.mock_repository.delete.return_value = True
         
         # When
@@ -178,18 +433,256 @@ class TestUserServiceDI:
         
         # Then
         assert result is True
-        self.mock_repository.get_by_email.assert_called_once_with(email)
+        self.mock_repository.get_by_email.assert_not_called()
         self.mock_repository.delete.assert_called_once_with(email)
 
     async def test_delete_user_not_found(self):
         """사용자 삭제 실패 - 사용자 없음"""
         # Given
         email = "nonexistent@example.com"
-        self.mock_repository.get_by_email.return_value = None
+        self.mock_repository.delete.return_value = False  # DELETE 대상 행 없음
         
         # When & Then
         with pytest.raises(ValueError, match="not found"):
             await self.user_service.delete_user(email)
         
+        self.mock_repository.delete.assert_called_once_with(email)
+
+
+@pytest.mark.unit
+class TestUserServiceCache:
+    """UserService 캐시 적용 단위 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user_service_with_di, mock_cache_service, sample_user_create_dto, sample_user_dto, sample_user_update_dto):
+        """각 테스트 메서드 실행 전 설정"""
+        self.user_service, repo_mapping = user_service_with_di
+        self.mock_repository = repo_mapping["UserRepository"]
+        self.mock_cache = mock_cache_service
+
+        self.sample_user_create_dto = sample_user_create_dto
+        self.sample_user_dto = sample_user_dto
+        self.sample_user_update_dto = sample_user_update_dto
+
+    async def test_get_user_by_email_cache_hit(self):
+        """캐시 적중 시 Repository를 호출하지 않음"""
+        # Given
+        email = "test@example.com"
+        self.mock_cache.get_or_load.return_value = self.sample_user_dto
+
+        # When
+        result = await self.user_service.get_user_by_email(email)
+
+        # Then
+        assert result == self.sample_user_dto
+        self.mock_cache.get_or_load.assert_called_once_with(
+            USER_CACHE_NAMESPACE, email, ANY, ttl=ANY, serializer=ANY, negative_ttl=None, local=True
+        )
+        self.mock_repository.get_by_email.assert_not_called()
+
+    async def test_get_user_by_email_cache_miss(self):
+        """캐시 미스 시 Repository 결과를 loader로 반환"""
+        # Given
+        email = "test@example.com"
+        self.mock_repository.get_by_email.return_value = self.sample_user_dto
+
+        async def load(namespace, key, loader, **kwargs):
+            return await loader()
+        self.mock_cache.get_or_load.side_effect = load
+
+        # When
+        result = await self.user_service.get_user_by_email(email)
+
+        # Then
+        assert result == self.sample_user_dto
+        self.mock_repository.get_by_email.assert_called_once_with(email)
+
+    async def test_single_flight_only_on_cache_miss(self, monkeypatch):
+        """워커 간 single-flight를 켜도 캐시 적중 경로에서는 실행하지 않고, 미스의 로더만 합침"""
+        # Given
+        email = "test@example.com"
+        monkeypatch.setattr(settings, "SINGLE_FLIGHT_DISTRIBUTED", True)
+        flight = AsyncMock(spec=SingleFlight)
+
+        async def run(name, key, fn, **kwargs):
+            return await fn()
+        flight.do.side_effect = run
+        monkeypatch.setattr("app.core.single_flight.get_single_flight", lambda: flight)
+        self.mock_repository.get_by_email.return_value = self.sample_user_dto
+
+        # When - 캐시 적중
+        self.mock_cache.get_or_load.return_value = self.sample_user_dto
+        await self.user_service.get_user_by_email(email)
+
+        # Then
+        flight.do.assert_not_called()
+
+        # When - 캐시 미스
+        async def load(namespace, key, loader, **kwargs):
+            return await loader()
+        self.mock_cache.get_or_load.side_effect = load
+        result = await self.user_service.get_user_by_email(email)
+
+        # Then
+        assert result == self.sample_user_dto
+        flight.do.assert_awaited_once_with(USER_CACHE_NAMESPACE, email, ANY, distributed=True, serializer=ANY)
+
+    async def test_get_all_users_count_cached(self):
+        """캐시된 전체 수 - count_all을 loader로 TTL 캐시 조회"""
+        # Given
+        self.mock_cache.get_or_load.return_value = 42
+
+        # When
+        _, total = await self.user_service.get_all_users(count=CountStrategy.CACHED)
+
+        # Then
+        assert total == 42
+        self.mock_cache.get_or_load.assert_called_once_with(
+            USER_CACHE_NAMESPACE, USER_COUNT_CACHE_KEY, ANY, ttl=settings.USER_COUNT_CACHE_TTL
+        )
+        self.mock_repository.count_all.assert_not_called()
+
+    async def test_create_user_evicts_cache(self):
+        """사용자 생성 시 "없음" 캐시 무효화"""
+        # Given
+        self.mock_repository.create.return_value = self.sample_user_dto
+
+        # When
+        await self.user_service.create_user(self.sample_user_create_dto)
+
+        # Then
+        self.mock_cache.delete.assert_awaited_once_with(USER_CACHE_NAMESPACE, self.sample_user_create_dto.email)
+
+    async def test_create_user_in_request_evicts_after_commit(self):
+        """요청 단위 트랜잭션 안에서는 캐시 무효화를 커밋 이후로 미룸"""
+        # Given
+        request_session = AsyncMock()
+        request_session.info = {}
+        uow = UnitOfWork(session=Mock(return_value=request_session))
+        self.mock_repository.create.return_value = self.sample_user_dto
+
+        # When
+        async with uow as session:
+            with use_session(session):
+                await self.user_service.create_user(self.sample_user_create_dto)
+            # Then - 커밋 전에는 무효화하지 않음
+            self.mock_cache.delete.assert_not_awaited()
+
+        request_session.commit.assert_awaited_once()
+        self.mock_cache.delete.assert_awaited_once_with(USER_CACHE_NAMESPACE, self.sample_user_create_dto.email)
+
+    async def test_read_in_write_transaction_skips_cache_and_rolls_back(self):
+        """쓰기 트랜잭션 안의 조회는 캐시를 쓰지 않음 - 롤백돼도 커밋 전 값이 캐시에 남지 않음"""
+        # Given
+        request_session = AsyncMock()
+        request_session.info = {}
+        uow = UnitOfWork(session=Mock(return_value=request_session))
+        email = self.sample_user_create_dto.email
+        self.mock_repository.create.return_value = self.sample_user_dto
+        self.mock_repository.get_by_email.return_value = self.sample_user_dto
+
+        # When - 생성 직후 같은 트랜잭션에서 조회한 뒤 롤백
+        with pytest.raises(RuntimeError):
+            async with uow as session:
+                with use_session(session):
+                    await self.user_service.create_user(self.sample_user_create_dto)
+                    result = await self.user_service.get_user_by_email(email)
+                raise RuntimeError("rollback")
+
+        # Then - 자신의 쓰기를 DB에서 읽고, 캐시는 채우지도 무효화하지도 않음
+        assert result == self.sample_user_dto
         self.mock_repository.get_by_email.assert_called_once_with(email)
-        self.mock_repository.delete.assert_not_called()
\ No newline at end of file
+        self.mock_cache.get_or_load.assert_not_awaited()
+        self.mock_cache.delete.assert_not_awaited()
+        request_session.rollback.assert_awaited_once()
+        request_session.commit.assert_not_awaited()
+
+    async def test_bulk_create_users_invalidates_namespace(self):
+        """일괄 생성 시 사용자 캐시 네임스페이스 전체 무효화"""
+        # When
+        await self.user_service.bulk_create_users([self.sample_user_create_dto])
+
+        # Then
+        self.mock_cache.invalidate_namespace.assert_awaited_once_with(USER_CACHE_NAMESPACE)
+        self.mock_cache.delete.assert_not_called()
+
+    async def test_update_user_evicts_cache(self):
+        """사용자 업데이트 성공 시 캐시 무효화"""
+        # Given
+        email = "test@example.com"
+        self.mock_repository.update.return_value = self.sample_user_dto
+
+        # When
+        await self.user_service.update_user(email, self.sample_user_update_dto)
+
+        # Then
+        self.mock_cache.delete.assert_awaited_once_with(USER_CACHE_NAMESPACE, email)
+
+    async def test_update_user_failure_keeps_cache(self):
+        """사용자 업데이트 실패 시 캐시 유지"""
+        # Given
+        email = "nonexistent@example.com"
+        self.mock_repository.update.return_value = None
+
+        # When & Then
+        with pytest.raises(ValueError, match="not found"):
+            await self.user_service.update_user(email, self.sample_user_update_dto)
+
+        self.mock_cache.delete.assert_not_called()
+
+    async def test_delete_user_evicts_cache(self):
+        """사용자 삭제 성공 시 캐시 무효화"""
+        # Given
+        email = "test@example.com"
+        self.mock_repository.delete.return_value = True
+
+        # When
+        await self.user_service.delete_user(email)
+
+        # Then
+        self.mock_cache.delete.assert_awaited_once_with(USER_CACHE_NAMESPACE, email)
+
+
+@pytest.mark.unit
+class TestUserServiceReplicaCache:
+    """캐시를 채우는 조회의 replica 지연 단위 테스트 (fakeredis 캐시)"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, user_service_with_di, fake_redis, monkeypatch, sample_user_dto):
+        self.user_service, repo_mapping = user_service_with_di
+        self.mock_repository = repo_mapping["UserRepository"]
+        cache = CacheService()
+        monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+        monkeypatch.setattr("app.core.cache.get_cache_service", lambda: cache)
+        monkeypatch.setattr("app.service.user.get_cache_service", lambda: cache)
+
+        # replica는 쓰기를 아직 반영하지 못한 상태 (지연), primary는 최신 값
+        self.old = sample_user_dto
+        self.new = sample_user_dto.model_copy(update={"name": "Updated User"})
+        replica_session = AsyncMock(info={"read_only": True})
+        replica, primary = self._reader(replica_session), self._reader(AsyncMock(info={"read_only": True}))
+        self.user_service.uow.reader = Mock(side_effect=lambda use_replica=True: replica if use_replica else primary)
+        self.mock_repository.get_by_email.side_effect = (
+            lambda email: self.old if self.user_service._session is replica_session else self.new
+        )
+        self.mock_repository.update.return_value = self.new
+
+    @staticmethod
+    def _reader(session: AsyncMock) -> Mock:
+        uow = Mock(spec=UnitOfWork)
+        uow.__aenter__ = AsyncMock(return_value=session)
+        uow.__aexit__ = AsyncMock(return_value=None)
+        return uow
+
+    async def test_lagging_replica_is_not_cached_after_eviction(self):
+        """수정으로 캐시를 비운 직후의 조회가 replica의 이전 값을 다시 캐시하지 않음"""
+        # When
+        await self.user_service.update_user(self.old.email, UserUpdateDTO(name="Updated User"))
+        first = await self.user_service.get_user_by_email(self.old.email)
+        cached = await self.user_service.get_user_by_email(self.old.email)
+
+        # Then
+        assert first == self.new
+        assert cached == self.new
+        self.user_service.uow.reader.assert_called_with(use_replica=False)
+        self.mock_repository.get_by_email.assert_called_once()